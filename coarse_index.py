@@ -0,0 +1,144 @@
+"""
+2단계 추천용 대략 검색 인덱스 모듈
+model_builder가 저장하는 form_profiles.pkl의 (기관명, 일반전형)별 평균 점수를 그룹 중심점으로 사용합니다.
+
+1단계: 사용자와 그룹 중심점(약 138개)의 코사인 유사도로 가까운 그룹 nprobe개 선택
+2단계: 선택된 그룹에 속한 공고만 정확한 유사도로 계산
+
+중심점 점수가 공고 점수의 상한은 아니므로 결과는 근사값입니다.
+재현율은 test/benchmark_coarse_index.py로 전체 계산과 비교해 확인합니다.
+"""
+
+import os
+import pickle
+import numpy as np
+from scoring_kernel import select_top_k_batch
+from distinct_groups import PostingGroups, posting_group_ids
+from log_config import get_logger
+
+# 로깅 설정
+logger = get_logger(__name__, 'coarse_index.log')
+
+FORM_PROFILES_FILENAME = 'form_profiles.pkl'
+
+class CoarseIndex:
+    """(기관명, 일반전형) 그룹 중심점 인덱스"""
+
+    def __init__(self, kernel, groups, centroids):
+        """
+        Args:
+            kernel: 공고 단위 유사도 커널 (표준화 파라미터 사용)
+            groups: 그룹 배치 (PostingGroups, 그룹 순 공고 행 번호와 시작 위치)
+            centroids: 그룹별 평균 원점수 (G×16), groups의 그룹 순서
+        """
+        self.kernel = kernel
+        self.groups = groups
+        self.ends = np.append(groups.starts[1:], len(groups.order))
+
+        # 중심점을 표준화 후 L2 정규화 (사용자 벡터와의 내적 = 코사인 유사도)
+        standardized = kernel.standardize(centroids)
+        norms = np.linalg.norm(standardized, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.centroids = np.ascontiguousarray(standardized / norms, dtype=np.float32)
+        self.centroids.flags.writeable = False
+
+    @classmethod
+    def build(cls, kernel, records, model_dir=None):
+        """
+        스냅샷 데이터로 인덱스 생성
+
+        model_dir에 form_profiles.pkl이 있으면 그 평균 점수를 중심점으로 쓰고,
+        없거나 프로필이 빠진 그룹은 공고 원점수 평균으로 계산합니다.
+
+        Args:
+            kernel: 공고 단위 유사도 커널
+            records: 응답용 공고 레코드 (PostingRecords)
+            model_dir: 모델 디렉토리 경로
+        """
+        group_ids = posting_group_ids(records, 'agency_form')
+        groups = PostingGroups(group_ids, kernel.posting_info['id'])
+        group_keys = group_ids[groups.order[groups.starts]]
+
+        # 공고 원점수 그룹 평균 (G×16)
+        positions = np.searchsorted(group_keys, group_ids)
+        counts = np.bincount(positions, minlength=len(group_keys))[:, None]
+        centroids = np.zeros((len(group_keys), records.posting_scores.shape[1]), dtype=np.float64)
+        np.add.at(centroids, positions, np.asarray(records.posting_scores, dtype=np.float64))
+        centroids /= np.maximum(counts, 1)
+
+        profile_path = os.path.join(model_dir, FORM_PROFILES_FILENAME) if model_dir else None
+        form_profiles = None
+        if profile_path and os.path.exists(profile_path):
+            with open(profile_path, 'rb') as f:
+                form_profiles = pickle.load(f)
+            if list(form_profiles.index.names) != ['기관명', '일반전형'] or \
+                    any(col not in form_profiles.columns for col in records.score_columns):
+                logger.warning("⚠️ form_profiles.pkl 형식이 (기관명, 일반전형)별 점수 평균이 아니어서 공고 평균을 사용합니다.")
+                form_profiles = None
+
+        if form_profiles is not None:
+            agency_codes = {agency: code for code, agency in enumerate(records.agencies)}
+            form_codes = {form: code for code, form in enumerate(records.forms)}
+
+            matched = 0
+            for (agency, form), values in zip(form_profiles.index, form_profiles[records.score_columns].to_numpy()):
+                if str(agency) not in agency_codes or str(form) not in form_codes:
+                    continue
+                key = agency_codes[str(agency)] * len(records.forms) + form_codes[str(form)]
+                position = np.searchsorted(group_keys, key)
+                if position < len(group_keys) and group_keys[position] == key:
+                    centroids[position] = values
+                    matched += 1
+            if matched < len(group_keys):
+                logger.warning(f"⚠️ form_profiles.pkl에 없는 그룹 {len(group_keys) - matched}개는 공고 평균으로 계산합니다.")
+        else:
+            logger.info(f"ℹ️ {FORM_PROFILES_FILENAME}이 없어 공고 평균으로 그룹 중심점을 계산합니다.")
+
+        return cls(kernel, groups, centroids)
+
+    def __len__(self):
+        return len(self.centroids)
+
+    def probe(self, user_score_matrix, nprobe):
+        """
+        사용자별 가까운 그룹의 공고 행 번호
+
+        Args:
+            user_score_matrix: 사용자 원점수 배열 (N×16)
+            nprobe: 사용자별 선택할 그룹 수
+
+        Returns:
+            list: 사용자별 후보 공고 행 번호 배열
+        """
+        user_standardized = self.kernel.standardize(user_score_matrix).reshape(-1, self.centroids.shape[1])
+        centroid_scores = user_standardized @ self.centroids.T
+        nprobe = min(int(nprobe), len(self))
+        nearest = np.argpartition(-centroid_scores, nprobe - 1, axis=1)[:, :nprobe]
+
+        order, starts, ends = self.groups.order, self.groups.starts, self.ends
+        return [
+            np.concatenate([order[starts[group]:ends[group]] for group in user_groups])
+            for user_groups in nearest
+        ]
+
+    def search(self, user_score_matrix, nprobe, top_k):
+        """
+        가까운 그룹 nprobe개의 공고만 코사인 유사도로 계산해 상위 k개 선택
+
+        Args:
+            user_score_matrix: 사용자 원점수 배열 (N×16)
+            nprobe: 사용자별 탐색할 그룹 수
+            top_k: 사용자별 추천할 공고 수
+
+        Returns:
+            tuple: (사용자별 상위 공고 행 번호 리스트, 사용자별 상위 공고 유사도 리스트)
+        """
+        user_score_matrix = np.asarray(user_score_matrix).reshape(-1, self.centroids.shape[1])
+        ids = self.kernel.posting_info['id']
+        top_indices, top_similarities = [], []
+        for user_scores, rows in zip(user_score_matrix, self.probe(user_score_matrix, nprobe)):
+            similarities = self.kernel.similarities(user_scores[None, :], rows=rows)
+            user_top = select_top_k_batch(similarities, top_k, ids[rows])[0]
+            top_indices.append(rows[user_top])
+            top_similarities.append(similarities[0, user_top])
+        return top_indices, top_similarities
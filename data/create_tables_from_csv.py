@@ -143,8 +143,8 @@ def clean_data_for_insert(df):
     
     return df_cleaned
 
-def process_csv_file(file_path, db_manager):
-    """개별 CSV 파일 처리"""
+def process_csv_file(file_path, db_manager, mode='insert'):
+    """개별 CSV 파일 처리 (mode: DatabaseManager.bulk_insert 삽입 방식)"""
     try:
         print(f"\n📁 처리 중: {os.path.basename(file_path)}")
         
@@ -200,21 +200,12 @@ def process_csv_file(file_path, db_manager):
         # 데이터 삽입
         print(f"💾 데이터 삽입 중...")
         
-        columns = [f"`{col}`" for col in df_cleaned.columns]
-        placeholders = ['%s'] * len(columns)
-        
-        insert_sql = f"""
-            INSERT INTO `{table_name}` ({', '.join(columns)})
-            VALUES ({', '.join(placeholders)})
-        """
-        
-        with db_manager.connection.cursor() as cursor:
-            for _, row in df_cleaned.iterrows():
-                try:
-                    cursor.execute(insert_sql, tuple(row))
-                except Exception as e:
-                    print(f"⚠️ 행 삽입 실패: {e}")
-                    continue
+        # 다중 행 INSERT 묶음 (실패한 묶음은 한 행씩 다시 넣어 실패한 행만 건너뜀) 또는 LOAD DATA LOCAL INFILE
+        inserted = db_manager.bulk_insert(table_name, list(df_cleaned.columns),
+                                          df_cleaned.itertuples(index=False, name=None),
+                                          mode=mode, skip_errors=True)
+        if inserted < len(df_cleaned):
+            print(f"⚠️ 행 삽입 실패: {len(df_cleaned) - inserted}개")
         
         print(f"✅ {table_name} 테이블 생성 완료: {len(df_cleaned)}개 레코드")
         return True
@@ -259,6 +250,10 @@ def main():
     print(f"  데이터베이스: {db_config['database']}")
     print(f"  사용자: {db_config['user']}")
     
+    # 삽입 방식 (load_infile은 서버 local_infile=ON 필요)
+    insert_mode = os.getenv('CSV_INSERT_MODE', 'insert')
+    print(f"  삽입 방식: {insert_mode}")
+    
     # 사용자 확인
     print("\n" + "=" * 60)
     while True:
@@ -281,7 +276,7 @@ def main():
             
             for csv_file in csv_files:
                 file_path = os.path.join(data_dir, csv_file)
-                if process_csv_file(file_path, db_manager):
+                if process_csv_file(file_path, db_manager, insert_mode):
                     success_count += 1
             
             print(f"\n" + "=" * 60)
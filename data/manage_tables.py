@@ -147,20 +147,22 @@ def list_all_tables(db_manager):
 def export_table_to_csv(db_manager, table_name, output_dir):
     """테이블을 CSV로 내보내기"""
     try:
-        with db_manager.connection.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(f"SELECT * FROM `{table_name}`")
-            rows = cursor.fetchall()
-            
-            if not rows:
-                print(f"⚠️ {table_name}: 내보낼 데이터가 없습니다.")
-                return False
-            
-            df = pd.DataFrame(rows)
-            output_file = os.path.join(output_dir, f"{table_name}_export.csv")
-            df.to_csv(output_file, index=False, encoding='utf-8-sig')
-            
-            print(f"✅ {table_name} → {output_file} ({len(rows)}개 레코드)")
-            return True
+        output_file = os.path.join(output_dir, f"{table_name}_export.csv")
+        exported = 0
+        
+        # 서버 측 커서로 배치씩 읽어 이어 쓰기 (BOM은 파일 처음에 한 번만 쓰도록 파일을 한 번만 엶)
+        with open(output_file, 'w', encoding='utf-8-sig', newline='') as csv_file:
+            for rows in db_manager.iter_query(f"SELECT * FROM `{table_name}`", as_dict=True):
+                pd.DataFrame(rows).to_csv(csv_file, index=False, header=exported == 0)
+                exported += len(rows)
+        
+        if not exported:
+            os.remove(output_file)
+            print(f"⚠️ {table_name}: 내보낼 데이터가 없습니다.")
+            return False
+        
+        print(f"✅ {table_name} → {output_file} ({exported}개 레코드)")
+        return True
             
     except Exception as e:
         print(f"❌ {table_name} CSV 내보내기 실패: {e}")
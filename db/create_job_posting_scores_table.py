@@ -11,7 +11,8 @@ import numpy as np
 import re
 import logging
 from datetime import datetime
-from database_manager import DatabaseManager
+from database_manager import DatabaseManager, DB_BULK_CHUNK_SIZE, print_query_stats
+from form_categories import classify_form
 from log_config import setup_logger
 
 # 로거 설정
@@ -197,49 +198,45 @@ class JobPostingScoreGenerator:
         """전형별 특성 분석 및 가중치 계산 (전형명만으로)"""
         weights = {col: 1.0 for col in self.score_columns}
         
-        # 텍스트 전처리
-        form_text = 일반전형.lower()
+        # 전형명 키워드로 분류 판정 (추천 API의 분류 필터와 같은 기준)
+        categories = classify_form(일반전형)
         
         # 1. 기술/전문직 가중치
-        tech_keywords = ['기술', '연구', '개발', 'it', '정보', '시스템', '프로그램', '엔지니어', '전산', '소프트웨어', '기계', '전기', '토목', '건축', '통신', '신호']
-        if any(keyword in form_text for keyword in tech_keywords):
+        if 'technical' in categories:
             weights['기술전문성'] *= 1.5
             weights['인지문제해결'] *= 1.4
             weights['학습속도'] *= 1.3
             weights['자기관리'] *= 1.2
         
         # 2. 행정/사무직 가중치
-        admin_keywords = ['사무', '행정', '관리', '총무', '기획', '회계', '인사']
-        if any(keyword in form_text for keyword in admin_keywords):
+        if 'administrative' in categories:
             weights['성실성'] *= 1.4
             weights['자기관리'] *= 1.3
             weights['공감사회기술'] *= 1.2
             weights['대인영향력'] *= 1.2
         
         # 3. 대인서비스 가중치
-        service_keywords = ['고객', '상담', '민원', '안내', '서비스', '접수']
-        if any(keyword in form_text for keyword in service_keywords):
+        if 'service' in categories:
             weights['외향성'] *= 1.4
             weights['우호성'] *= 1.3
             weights['공감사회기술'] *= 1.3
             weights['대인민첩성'] *= 1.2
         
         # 4. 운전직 가중치
-        if '운전' in form_text:
+        if 'driving' in categories:
             weights['성실성'] *= 1.3
             weights['정서안정성'] *= 1.3
             weights['적응력'] *= 1.2
             weights['자기관리'] *= 1.2
         
         # 5. 공무직 가중치
-        if '공무' in form_text:
+        if 'civil_service' in categories:
             weights['성실성'] *= 1.3
             weights['자기관리'] *= 1.2
             weights['공감사회기술'] *= 1.2
         
         # 6. 관리직 가중치
-        manager_keywords = ['팀장', '과장', '부장', '관리자', '책임자', '리더']
-        if any(keyword in form_text for keyword in manager_keywords):
+        if 'manager' in categories:
             weights['대인영향력'] *= 1.4
             weights['자기조절'] *= 1.3
             weights['성과민첩성'] *= 1.3
@@ -357,24 +354,15 @@ class JobPostingScoreGenerator:
         try:
             logger.info("점수 데이터 삽입 시작")
             
-            insert_query = f"""
-            INSERT INTO TMP_채용공고평가점수 
-            (기관명, 공고명, 일반전형, {', '.join(self.score_columns)})
-            VALUES (%(기관명)s, %(공고명)s, %(일반전형)s, {', '.join([f'%({col})s' for col in self.score_columns])})
-            """
-            
+            columns = ['기관명', '공고명', '일반전형'] + self.score_columns
             success_count = 0
-            batch_size = 50
+            batch_size = DB_BULK_CHUNK_SIZE
             
+            # 묶음마다 다중 행 INSERT 한 번 (실패한 묶음은 한 행씩 다시 넣어 실패한 행만 건너뜀)
             for i in range(0, len(scores_data), batch_size):
                 batch = scores_data[i:i + batch_size]
-                
-                for data in batch:
-                    try:
-                        self.db.execute_query(insert_query, data, fetch=False)
-                        success_count += 1
-                    except Exception as e:
-                        logger.warning(f"데이터 삽입 실패: {data['기관명']} - {e}")
+                success_count += self.db.bulk_insert('TMP_채용공고평가점수', columns, batch,
+                                                     chunk_size=batch_size, skip_errors=True)
                 
                 print(f"  📥 삽입 진행률: {min(i + batch_size, len(scores_data))}/{len(scores_data)} ({min(i + batch_size, len(scores_data))/len(scores_data)*100:.1f}%)")
             
@@ -510,6 +498,7 @@ def main():
     else:
         print("\n❌ 작업 중 오류가 발생했습니다.")
         print("💡 로그 파일을 확인하여 상세 오류를 파악하세요.")
+    print_query_stats()
 
 if __name__ == "__main__":
     main()
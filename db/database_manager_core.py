@@ -1,10 +1,24 @@
 """
 MariaDB 데이터베이스 핵심 연동 모듈
 공통 데이터베이스 연결 및 쿼리 실행 기능 제공
+
+연결은 접속 정보별 커넥션 풀(ConnectionPool)에서 빌려 쓰고 disconnect() 시 반납하므로,
+메서드마다 connect()/disconnect()를 호출하는 관리자 클래스도 TCP 연결/인증을 매번 반복하지 않습니다.
+DB_POOL_MAX_SIZE=0이면 이전처럼 connect()마다 새로 연결합니다.
 """
 
 import pymysql
 import os
+import re
+import math
+import numpy as np
+import time
+import tempfile
+import threading
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 from typing import Any, Optional, Dict, List
 from log_config import get_logger
 from dotenv import load_dotenv
@@ -15,10 +29,428 @@ load_dotenv()
 # 로깅 설정
 logger = get_logger(__name__, 'database_manager.log')
 
+# 커넥션 풀 설정 (DB_POOL_MAX_SIZE=0이면 풀 미사용)
+DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', 1))
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', 10))
+DB_POOL_MAX_IDLE_SECONDS = float(os.getenv('DB_POOL_MAX_IDLE_SECONDS', 300))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
+
+# 스트리밍 조회(iter_query) 기본 배치 크기 (행 수)
+DB_STREAM_BATCH_SIZE = int(os.getenv('DB_STREAM_BATCH_SIZE', 5000))
+
+# 대량 삽입(bulk_insert) 기본 묶음 크기 (executemany 한 번에 보내는 행 수)
+DB_BULK_CHUNK_SIZE = int(os.getenv('DB_BULK_CHUNK_SIZE', 1000))
+
+BULK_INSERT_MODES = ('insert', 'upsert', 'load_infile')
+
+# 쿼리 지표 설정 (DB_SLOW_QUERY_MS 이상 걸린 쿼리는 문장과 파라미터를 로그에 남김, 0이면 끔)
+DB_SLOW_QUERY_MS = float(os.getenv('DB_SLOW_QUERY_MS', 0))
+QUERY_STATS_SAMPLES = 1024  # 문장 유형별 백분위 계산에 쓰는 최근 실행 시간 수
+SLOW_QUERY_PARAMS_LIMIT = 500  # 느린 쿼리 로그에 남길 파라미터 최대 길이 (대량 삽입 묶음 등)
+
+# 쿼리 정규화 규칙 (문자열 자리는 ? → 주석 제거 → 숫자/파라미터 자리는 ? → 값 목록과 다중 행 VALUES는 (...) → 공백 정리)
+_FINGERPRINT_RULES = [
+    (re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\""), '?'),
+    (re.compile(r'/\*.*?\*/|--[^\n]*|#[^\n]*', re.S), ' '),
+    (re.compile(r'%\([^)]*\)s|%s'), '?'),
+    (re.compile(r'(?<![\w`])-?\d+(?:\.\d+)?(?![\w`])'), '?'),
+    (re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*'), '(...)'),
+    (re.compile(r'\s+'), ' ')
+]
+
+@lru_cache(maxsize=4096)
+def fingerprint(sql):
+    """
+    값만 다른 쿼리를 같은 문장 유형으로 묶는 정규화 문자열
+    
+    Args:
+        sql: SQL 쿼리
+        
+    Returns:
+        str: 정규화된 쿼리 (예: "SELECT * FROM t WHERE id IN (...) LIMIT ?")
+    """
+    for pattern, replacement in _FINGERPRINT_RULES:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip().rstrip(';').strip()
+
+class QueryStats:
+    """문장 유형(fingerprint)별 쿼리 실행 지표 (스레드 안전, 프로세스별)"""
+    
+    def __init__(self, samples=QUERY_STATS_SAMPLES):
+        """
+        Args:
+            samples: 문장 유형별로 백분위 계산에 보관할 최근 실행 시간 수
+        """
+        self.samples = samples
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+    
+    def record(self, sql, seconds, rows=0, error=False):
+        """
+        쿼리 한 번의 실행 기록
+        
+        Args:
+            sql: 실행한 SQL 쿼리
+            seconds: 실행 시간 (초)
+            rows: 반환(조회) 또는 변경된 행 수
+            error: 실패 여부
+        """
+        key = fingerprint(sql)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {
+                    'count': 0, 'errors': 0, 'rows': 0, 'total_seconds': 0.0, 'max_seconds': 0.0,
+                    'durations': deque(maxlen=self.samples)
+                }
+            entry['count'] += 1
+            entry['errors'] += int(error)
+            entry['rows'] += max(int(rows or 0), 0)
+            entry['total_seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+            entry['durations'].append(seconds)
+    
+    def reset(self):
+        """지표 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.started_at = time.time()
+    
+    def summary(self, limit=None):
+        """
+        문장 유형별 요약 (총 실행 시간 내림차순)
+        
+        Args:
+            limit: 반환할 최대 문장 유형 수 (없으면 전체)
+            
+        Returns:
+            list: fingerprint, count, errors, rows, total_ms, avg_ms, p50_ms, p95_ms, max_ms 딕셔너리 리스트
+        """
+        with self._lock:
+            entries = [(key, dict(entry, durations=np.array(entry['durations']))) for key, entry in self._entries.items()]
+        entries.sort(key=lambda item: item[1]['total_seconds'], reverse=True)
+        
+        summary = []
+        for key, entry in entries[:limit]:
+            p50, p95 = np.percentile(entry['durations'], [50, 95]) * 1000
+            summary.append({
+                'fingerprint': key,
+                'count': entry['count'],
+                'errors': entry['errors'],
+                'rows': entry['rows'],
+                'total_ms': round(entry['total_seconds'] * 1000, 3),
+                'avg_ms': round(entry['total_seconds'] / entry['count'] * 1000, 3),
+                'p50_ms': round(float(p50), 3),
+                'p95_ms': round(float(p95), 3),
+                'max_ms': round(entry['max_seconds'] * 1000, 3)
+            })
+        return summary
+    
+    def format(self, limit=10, width=100):
+        """
+        파이프라인 종료 시 출력할 요약 표
+        
+        Args:
+            limit: 출력할 최대 문장 유형 수
+            width: 문장 표시 최대 길이
+            
+        Returns:
+            str: 총 실행 시간 상위 문장 유형 표 (기록이 없으면 빈 문자열)
+        """
+        summary = self.summary()
+        if not summary:
+            return ''
+        total_ms = sum(item['total_ms'] for item in summary)
+        lines = [
+            f"🗄️ 쿼리 지표: {len(summary)}개 유형, {sum(item['count'] for item in summary)}회, 총 {total_ms / 1000:.2f}초",
+            f"   {'횟수':>7} | {'총(ms)':>10} | {'비율':>6} | {'p50(ms)':>8} | {'p95(ms)':>8} | {'최대(ms)':>9} | {'행 수':>9} | 문장"
+        ]
+        for item in summary[:limit]:
+            statement = item['fingerprint'] if len(item['fingerprint']) <= width else item['fingerprint'][:width - 3] + '...'
+            lines.append(
+                f"   {item['count']:>7} | {item['total_ms']:>10.1f} | {item['total_ms'] / total_ms if total_ms else 0:>6.1%} | "
+                f"{item['p50_ms']:>8.2f} | {item['p95_ms']:>8.2f} | {item['max_ms']:>9.2f} | {item['rows']:>9} | {statement}"
+            )
+        return '\n'.join(lines)
+
+# 현재 프로세스의 쿼리 지표
+query_stats = QueryStats()
+
+def print_query_stats(limit=10):
+    """파이프라인 종료 시 쿼리 지표 요약 출력 (실행한 쿼리가 없으면 출력하지 않음)"""
+    report = query_stats.format(limit)
+    if report:
+        print(f"\n{report}")
+
+class PoolTimeoutError(Exception):
+    """제한 시간 안에 커넥션 풀에서 커넥션을 빌리지 못한 경우"""
+
+class ConnectionPool:
+    """스레드 안전 커넥션 풀 (최소/최대 크기, 대여 시 생존 확인, 유휴 커넥션 정리, 지표)"""
+    
+    def __init__(self, connect, min_size=1, max_size=10, max_idle_seconds=300, timeout=10.0):
+        """
+        커넥션 풀 초기화
+        
+        Args:
+            connect: 새 커넥션을 여는 함수 (인자 없음)
+            min_size: 유휴 정리 후에도 유지할 최소 커넥션 수
+            max_size: 동시에 열 수 있는 최대 커넥션 수
+            max_idle_seconds: 이 시간보다 오래 쉰 커넥션은 최소 크기를 넘는 만큼 닫음
+            timeout: 모든 커넥션이 사용 중일 때 기다리는 최대 시간 (초)
+        """
+        self._connect = connect
+        self.max_size = max(1, int(max_size))
+        self.min_size = min(max(0, int(min_size)), self.max_size)
+        self.max_idle_seconds = max_idle_seconds
+        self.timeout = timeout
+        self._idle = deque()  # (커넥션, 반납 시각), 오른쪽이 최근 반납
+        self._in_use = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self.metrics = {
+            'created': 0,
+            'reused': 0,
+            'closed': 0,
+            'ping_failures': 0,
+            'recycled': 0,
+            'waits': 0,
+            'wait_seconds': 0.0,
+            'timeouts': 0
+        }
+    
+    def _close_quietly(self, connection):
+        """커넥션 닫기 (이미 끊긴 커넥션의 오류는 무시)"""
+        try:
+            connection.close()
+        except Exception:
+            pass
+    
+    def _open(self):
+        """새 커넥션 열기 (실패하면 예약한 자리를 돌려줌)"""
+        try:
+            connection = self._connect()
+        except Exception:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self.metrics['created'] += 1
+        return connection
+    
+    def _take_expired(self, now):
+        """최소 크기를 넘는 오래 쉰 커넥션을 목록에서 꺼냄 (잠금 안에서 호출, 닫기는 잠금 밖에서)"""
+        expired = []
+        while self._idle and now - self._idle[0][1] > self.max_idle_seconds \
+                and len(self._idle) + self._in_use > self.min_size:
+            expired.append(self._idle.popleft()[0])
+        self.metrics['recycled'] += len(expired)
+        return expired
+    
+    def fill(self):
+        """최소 크기만큼 커넥션을 미리 열어 둠"""
+        while True:
+            with self._condition:
+                if self._closed or len(self._idle) + self._in_use >= self.min_size:
+                    return
+                self._in_use += 1
+            connection = self._open()
+            self.release(connection)
+    
+    def acquire(self, timeout=None):
+        """
+        커넥션 대여
+        
+        최근에 반납된 커넥션부터 재사용하며, 재사용 전 ping으로 연결이 살아 있는지 확인합니다.
+        끊긴 커넥션은 닫고 새로 엽니다.
+        
+        Args:
+            timeout: 최대 대기 시간 (초, 없으면 풀 설정값)
+            
+        Returns:
+            pymysql 커넥션
+            
+        Raises:
+            PoolTimeoutError: 제한 시간 안에 빌리지 못한 경우
+        """
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        connection = None
+        expired = []
+        waited = False
+        start = time.monotonic()
+        
+        try:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise PoolTimeoutError("커넥션 풀이 닫혔습니다")
+                    expired.extend(self._take_expired(time.monotonic()))
+                    if self._idle:
+                        connection = self._idle.pop()[0]
+                        self._in_use += 1
+                        break
+                    if self._in_use < self.max_size:
+                        self._in_use += 1
+                        break
+                    
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.metrics['timeouts'] += 1
+                        raise PoolTimeoutError(
+                            f"{timeout}초 안에 커넥션을 빌리지 못했습니다 (최대 {self.max_size}개 사용 중)"
+                        )
+                    if not waited:
+                        self.metrics['waits'] += 1
+                        waited = True
+                    self._condition.wait(remaining)
+                if waited:
+                    self.metrics['wait_seconds'] += time.monotonic() - start
+        finally:
+            for expired_connection in expired:
+                self._close_quietly(expired_connection)
+        
+        if connection is None:
+            return self._open()
+        
+        # 대여 시 생존 확인 (서버 wait_timeout 등으로 끊긴 커넥션은 새로 연결)
+        try:
+            connection.ping(reconnect=False)
+        except Exception as e:
+            logger.warning(f"⚠️ 끊긴 커넥션을 새로 연결합니다: {str(e)}")
+            self._close_quietly(connection)
+            with self._condition:
+                self.metrics['ping_failures'] += 1
+                self.metrics['closed'] += 1
+            return self._open()
+        
+        with self._condition:
+            self.metrics['reused'] += 1
+        return connection
+    
+    def release(self, connection, discard=False):
+        """
+        커넥션 반납
+        
+        Args:
+            connection: acquire로 빌린 커넥션
+            discard: True이면 재사용하지 않고 닫음 (오류가 난 커넥션)
+        """
+        with self._condition:
+            self._in_use -= 1
+            if discard or self._closed:
+                self.metrics['closed'] += 1
+                expired = [connection]
+            else:
+                self._idle.append((connection, time.monotonic()))
+                expired = self._take_expired(time.monotonic())
+            self._condition.notify()
+        
+        for expired_connection in expired:
+            self._close_quietly(expired_connection)
+    
+    @contextmanager
+    def connection(self, timeout=None):
+        """with 블록 동안 커넥션 대여 (블록에서 예외가 나면 커넥션을 버림)"""
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        except Exception:
+            self.release(connection, discard=True)
+            raise
+        else:
+            self.release(connection)
+    
+    def close(self):
+        """유휴 커넥션을 모두 닫고, 사용 중인 커넥션은 반납될 때 닫음"""
+        with self._condition:
+            self._closed = True
+            idle = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self.metrics['closed'] += len(idle)
+            self._condition.notify_all()
+        for connection in idle:
+            self._close_quietly(connection)
+    
+    def stats(self):
+        """풀 지표 (현재 크기, 사용 중/유휴 수, 누적 생성/재사용/정리 횟수 등)"""
+        with self._condition:
+            return {
+                'size': len(self._idle) + self._in_use,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                **self.metrics,
+                'wait_seconds': round(self.metrics['wait_seconds'], 6)
+            }
+
+# 프로세스별, 접속 정보별 커넥션 풀 (fork된 프로세스는 부모 커넥션을 쓰지 않고 새 풀 생성)
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_connection_pool(host, port, user, password, database):
+    """
+    접속 정보에 해당하는 공유 커넥션 풀 조회 (없으면 생성)
+    
+    Returns:
+        ConnectionPool: 현재 프로세스의 커넥션 풀
+    """
+    key = (os.getpid(), host, port, user, password, database)
+    pool = _pools.get(key)
+    if pool is not None:
+        return pool
+    
+    with _pools_lock:
+        pool = _pools.get(key)
+        created = pool is None
+        if created:
+            pool = ConnectionPool(
+                lambda: pymysql.connect(
+                    host=host,
+                    port=port,
+                    user=user,
+                    password=password,
+                    database=database,
+                    charset='utf8mb4',
+                    autocommit=True
+                ),
+                min_size=DB_POOL_MIN_SIZE,
+                max_size=DB_POOL_MAX_SIZE,
+                max_idle_seconds=DB_POOL_MAX_IDLE_SECONDS,
+                timeout=DB_POOL_TIMEOUT
+            )
+            _pools[key] = pool
+            logger.info(f"🏊 커넥션 풀 생성: {database} (최소 {pool.min_size}, 최대 {pool.max_size})")
+    
+    if created:
+        # 최소 크기만큼 미리 연결 (실패해도 대여 시 다시 연결)
+        try:
+            pool.fill()
+        except Exception as e:
+            logger.warning(f"⚠️ 커넥션 풀 초기 연결 실패: {str(e)}")
+    return pool
+
+def pool_stats():
+    """
+    현재 프로세스의 커넥션 풀 지표
+    
+    Returns:
+        dict: "user@host:port/database" → 풀 지표
+    """
+    pid = os.getpid()
+    return {
+        f"{user}@{host}:{port}/{database}": pool.stats()
+        for (pool_pid, host, port, user, _, database), pool in list(_pools.items())
+        if pool_pid == pid
+    }
+
 class DatabaseManager:
     """MariaDB 데이터베이스 관리 클래스 - 핵심 기능만 포함"""
     
-    def __init__(self, host=None, port=None, user=None, password=None, database=None):
+    def __init__(self, host=None, port=None, user=None, password=None, database=None, pooled=None):
         """
         데이터베이스 연결 초기화
         
@@ -28,6 +460,7 @@ class DatabaseManager:
             user: 데이터베이스 사용자명 (환경변수 DB_USER 우선)
             password: 데이터베이스 비밀번호 (환경변수 DB_PASSWORD 우선)
             database: 데이터베이스 이름 (환경변수 DB_NAME 우선)
+            pooled: 커넥션 풀 사용 여부 (없으면 DB_POOL_MAX_SIZE > 0일 때 사용)
         """
         self.host = host or os.getenv('DB_HOST', 'localhost')
         self.port = int(port or os.getenv('DB_PORT', 3306))
@@ -35,31 +468,84 @@ class DatabaseManager:
         self.password = password or os.getenv('DB_PASSWORD', '')
         self.database = database or os.getenv('DB_NAME', 'dive_recruit')
         self.connection = None
+        self.pooled = DB_POOL_MAX_SIZE > 0 if pooled is None else pooled
+        self._in_transaction = False
+        self._broken = False
     
     def connect(self):
-        """데이터베이스 연결"""
-        try:
-            self.connection = pymysql.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-                charset='utf8mb4',
-                autocommit=True
-            )
+        """데이터베이스 연결 (풀 사용 시 풀에서 커넥션 대여, 이미 연결되어 있으면 그대로 사용)"""
+        if self.connection:
+            return True
+        
+        self._in_transaction = False
+        self._broken = False
+        if self.pooled:
+            try:
+                pool = get_connection_pool(self.host, self.port, self.user, self.password, self.database)
+                self.connection = pool.acquire()
+                logger.debug(f"✅ 커넥션 풀에서 연결 대여: {self.database}")
+                return True
+            except Exception as e:
+                logger.error(f"❌ 데이터베이스 연결 실패: {str(e)}")
+                return False
+        
+        try:
+            self.connection = self._open_connection()
             logger.info(f"✅ 데이터베이스 연결 성공: {self.database}")
             return True
         except Exception as e:
             logger.error(f"❌ 데이터베이스 연결 실패: {str(e)}")
             return False
     
+    def _open_connection(self, **options):
+        """풀을 거치지 않는 새 커넥션 (options는 pymysql.connect 추가 인자)"""
+        return pymysql.connect(
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            charset='utf8mb4',
+            autocommit=True,
+            **options
+        )
+    
     def disconnect(self):
-        """데이터베이스 연결 종료"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """데이터베이스 연결 종료 (풀 사용 시 풀에 반납)"""
+        if not self.connection:
+            return
+        
+        connection, self.connection = self.connection, None
+        if not self.pooled:
+            connection.close()
             logger.info("🔌 데이터베이스 연결 종료")
+            return
+        
+        # 끝나지 않은 트랜잭션은 되돌린 뒤 반납 (다음 대여자에게 넘어가지 않도록)
+        if self._in_transaction and not self._broken:
+            try:
+                connection.rollback()
+            except Exception:
+                self._broken = True
+        self._in_transaction = False
+        get_connection_pool(self.host, self.port, self.user, self.password, self.database).release(
+            connection, discard=self._broken
+        )
+        logger.debug("🔌 커넥션 풀에 연결 반납")
+    
+    def _mark_broken(self, error):
+        """연결 오류가 난 커넥션은 풀에 돌려주지 않고 닫도록 표시"""
+        if isinstance(error, (pymysql.err.OperationalError, pymysql.err.InterfaceError)):
+            self._broken = True
+    
+    def _record_query(self, sql, params, seconds, rows, error=False):
+        """쿼리 지표 기록, DB_SLOW_QUERY_MS 이상 걸렸으면 문장과 파라미터를 로그에 남김"""
+        query_stats.record(sql, seconds, rows, error)
+        if DB_SLOW_QUERY_MS and seconds * 1000 >= DB_SLOW_QUERY_MS:
+            params_text = repr(params)
+            if len(params_text) > SLOW_QUERY_PARAMS_LIMIT:
+                params_text = f"{params_text[:SLOW_QUERY_PARAMS_LIMIT]}... ({len(params_text)}자)"
+            logger.warning(f"🐢 느린 쿼리 {seconds * 1000:.1f}ms ({rows}행): {' '.join(sql.split())} | 파라미터: {params_text}")
     
     def __enter__(self):
         """컨텍스트 매니저 진입"""
@@ -86,18 +572,28 @@ class DatabaseManager:
             logger.error("❌ 데이터베이스 연결이 없습니다")
             return None
             
+        start = time.perf_counter()
+        rows = 0
+        error = False
         try:
             with self.connection.cursor() as cursor:
                 cursor.execute(sql, params)
                 
                 if fetch:
-                    return cursor.fetchall()
+                    result = cursor.fetchall()
+                    rows = len(result)
+                    return result
                 else:
+                    rows = cursor.rowcount
                     return None
                     
         except Exception as e:
+            error = True
             logger.error(f"❌ 쿼리 실행 실패: {str(e)}")
+            self._mark_broken(e)
             raise
+        finally:
+            self._record_query(sql, params, time.perf_counter() - start, rows, error)
     
     def execute_query_dict(self, sql: str, params=None, fetch=True):
         """
@@ -115,35 +611,329 @@ class DatabaseManager:
             logger.error("❌ 데이터베이스 연결이 없습니다")
             return None
             
+        start = time.perf_counter()
+        rows = 0
+        error = False
         try:
             with self.connection.cursor(pymysql.cursors.DictCursor) as cursor:
                 cursor.execute(sql, params)
                 
                 if fetch:
-                    return cursor.fetchall()
+                    result = cursor.fetchall()
+                    rows = len(result)
+                    return result
                 else:
+                    rows = cursor.rowcount
                     return None
                     
         except Exception as e:
+            error = True
             logger.error(f"❌ 쿼리 실행 실패: {str(e)}")
+            self._mark_broken(e)
+            raise
+        finally:
+            self._record_query(sql, params, time.perf_counter() - start, rows, error)
+    
+    def iter_query(self, sql: str, params=None, batch_size=None, as_dict=False):
+        """
+        SQL 쿼리 결과를 서버 측 커서(SSCursor/SSDictCursor)로 batch_size행씩 스트리밍
+        
+        fetchall()과 달리 전체 결과를 메모리에 올리지 않으므로 큰 테이블도 배치 크기만큼의 메모리로 처리합니다.
+        스트리밍 중인 커넥션에서는 다른 쿼리를 실행할 수 없으므로 별도 커넥션(풀 사용 시 풀에서 대여)으로 읽고,
+        이 관리자의 커넥션은 반복 중에도 execute_query 등에 그대로 사용할 수 있습니다.
+        끝까지 읽으면 커넥션을 반납하고, 중간에 멈추면(break, 예외) 남은 결과를 읽지 않도록 커넥션을 닫습니다.
+        
+        Args:
+            sql: 실행할 SQL 쿼리
+            params: 쿼리 파라미터 (dict 또는 tuple)
+            batch_size: 한 번에 가져올 행 수 (없으면 DB_STREAM_BATCH_SIZE 설정값)
+            as_dict: True면 행을 딕셔너리로 반환
+            
+        Yields:
+            list: 최대 batch_size개 행 (튜플 또는 딕셔너리)
+        """
+        batch_size = max(1, int(batch_size or DB_STREAM_BATCH_SIZE))
+        pool = get_connection_pool(self.host, self.port, self.user, self.password, self.database) if self.pooled else None
+        connection = pool.acquire() if pool else self._open_connection()
+        finished = False
+        error = False
+        # 쿼리 지표에는 반복하는 쪽의 처리 시간을 빼고 서버에서 읽는 시간만 합산
+        elapsed = 0.0
+        total_rows = 0
+        try:
+            start = time.perf_counter()
+            cursor = connection.cursor(pymysql.cursors.SSDictCursor if as_dict else pymysql.cursors.SSCursor)
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                elapsed += time.perf_counter() - start
+                if not rows:
+                    break
+                total_rows += len(rows)
+                yield rows
+                start = time.perf_counter()
+            cursor.close()
+            finished = True
+        except Exception as e:
+            error = True
+            elapsed += time.perf_counter() - start
+            logger.error(f"❌ 스트리밍 쿼리 실행 실패: {str(e)}")
+            raise
+        finally:
+            self._record_query(sql, params, elapsed, total_rows, error)
+            # 다 읽지 못한 커넥션에는 남은 결과가 걸려 있으므로 반납하지 않고 닫음
+            if pool:
+                pool.release(connection, discard=not finished)
+            else:
+                connection.close()
+    
+    def fetch_columnar(self, sql: str, layout, params=None, capacity=None, batch_size=None) -> Dict[str, Any]:
+        """
+        SQL 쿼리 결과를 행 튜플 없이 컬럼 배열로 바로 적재
+        
+        iter_query 배치마다 미리 할당한 NumPy 배열의 다음 구간에 복사하므로, 전체 결과는 배열로만 메모리에 남습니다.
+        capacity(예상 행 수, 보통 COUNT(*))가 맞으면 추가 복사가 없고, 모자라면 두 배씩 늘립니다.
+        
+        Args:
+            sql: 실행할 SQL 쿼리
+            layout: SELECT 컬럼 순서대로 (이름, 종류[, 컬럼 수]) 리스트
+                - 종류가 NumPy dtype이면 숫자 배열 (NULL은 0), 컬럼 수 > 1이면 연속 컬럼을 (P×컬럼 수) 배열 하나로
+                - 종류가 'label'이면 문자열 사전 인코딩 (등장 순서 코드, NULL은 사전 끝의 None 라벨)
+            params: 쿼리 파라미터 (dict 또는 tuple)
+            capacity: 미리 할당할 행 수
+            batch_size: 한 번에 가져올 행 수 (없으면 DB_STREAM_BATCH_SIZE 설정값)
+            
+        Returns:
+            dict: 이름 → 배열 ((P,) 또는 (P×컬럼 수)), 'label' 컬럼은 (코드 배열 int32 (P,), 사전 리스트)
+        """
+        fields = []
+        position = 0
+        for name, kind, *rest in layout:
+            width = rest[0] if rest else 1
+            fields.append((name, kind, position, width))
+            position += width
+        
+        capacity = max(1, int(capacity or 0))
+        arrays = {
+            name: np.empty((capacity,) if width == 1 else (capacity, width), dtype=np.int32 if kind == 'label' else kind)
+            for name, kind, _, width in fields
+        }
+        dictionaries = {name: {} for name, kind, _, _ in fields if kind == 'label'}
+        
+        count = 0
+        for rows in self.iter_query(sql, params, batch_size):
+            end = count + len(rows)
+            if end > capacity:
+                capacity = max(end, capacity * 2)
+                for name, array in arrays.items():
+                    grown = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+                    grown[:count] = array[:count]
+                    arrays[name] = grown
+            
+            columns = list(zip(*rows))
+            for name, kind, start, width in fields:
+                target = arrays[name][count:end]
+                if kind == 'label':
+                    lookup = dictionaries[name]
+                    # NULL은 임시 코드 -1, 적재가 끝나면 사전 끝의 None 라벨로 바꿈
+                    target[:] = [-1 if value is None else lookup.setdefault(value, len(lookup))
+                                 for value in columns[start]]
+                elif width == 1:
+                    target[:] = self._numeric_block(columns[start], kind)
+                else:
+                    target[:] = self._numeric_block(columns[start:start + width], kind).T
+            count = end
+        
+        result = {}
+        total_bytes = 0
+        for name, kind, _, _ in fields:
+            # 넉넉히 늘린 배열은 실제 행 수만큼 잘라 남는 공간을 돌려줌
+            array = arrays.pop(name)
+            array = array[:count] if len(array) == count else array[:count].copy()
+            total_bytes += array.nbytes
+            if kind == 'label':
+                labels = list(dictionaries[name])
+                missing = array < 0
+                if missing.any():
+                    array[missing] = len(labels)
+                    labels.append(None)
+                result[name] = (array, labels)
+            else:
+                result[name] = array
+        logger.info(f"📦 컬럼 적재 완료: {count}행, 배열 {total_bytes / 2**20:.1f}MiB")
+        return result
+    
+    @staticmethod
+    def _numeric_block(values, dtype):
+        """튜플 컬럼(들)을 숫자 배열로 변환 (NULL은 0)"""
+        try:
+            return np.array(values, dtype=dtype)
+        except TypeError:
+            if values and isinstance(values[0], tuple):
+                return np.array([[0 if value is None else value for value in column] for column in values], dtype=dtype)
+            return np.array([0 if value is None else value for value in values], dtype=dtype)
+    
+    def bulk_insert(self, table: str, columns: List[str], rows, mode='insert', chunk_size=None,
+                    update_columns=None, update_expressions=None, skip_errors=False) -> int:
+        """
+        여러 행을 한 번에 삽입
+        
+        - insert: chunk_size행씩 executemany (pymysql이 다중 행 INSERT ... VALUES (...), (...) 한 문장으로 보냄)
+        - upsert: insert + ON DUPLICATE KEY UPDATE
+        - load_infile: 행을 임시 TSV 파일로 쓰고 LOAD DATA LOCAL INFILE 한 번으로 적재
+          (서버 local_infile=ON 필요, 클라이언트 파일 읽기를 허용하는 커넥션을 이 적재에만 따로 엶)
+        
+        Args:
+            table: 대상 테이블
+            columns: 삽입할 컬럼 목록
+            rows: 행 반복자 (columns 순서의 시퀀스 또는 컬럼명 키 딕셔너리, 제너레이터면 묶음씩 읽음)
+            mode: 'insert', 'upsert', 'load_infile'
+            chunk_size: executemany 한 번에 보낼 행 수 (없으면 DB_BULK_CHUNK_SIZE 설정값)
+            update_columns: upsert 시 새 값으로 바꿀 컬럼 (없으면 columns 전체)
+            update_expressions: upsert 시 추가로 적용할 {컬럼: SQL 식} (예: {'updated_at': 'CURRENT_TIMESTAMP'})
+            skip_errors: True면 실패한 묶음을 한 행씩 다시 넣어 실패한 행만 건너뜀 (load_infile 제외)
+            
+        Returns:
+            int: 삽입(또는 갱신)된 원본 행 수
+        """
+        if mode not in BULK_INSERT_MODES:
+            raise ValueError(f"mode는 {BULK_INSERT_MODES} 중 하나여야 합니다: {mode}")
+        
+        start = time.perf_counter()
+        rows = (self._row_values(row, columns) for row in rows)
+        column_list = ', '.join(f"`{col}`" for col in columns)
+        if mode == 'load_infile':
+            written = self._load_infile(table, column_list, rows)
+        else:
+            if not self.connection:
+                logger.error("❌ 데이터베이스 연결이 없습니다")
+                return 0
+            
+            sql = f"INSERT INTO `{table}` ({column_list}) VALUES ({', '.join(['%s'] * len(columns))})"
+            if mode == 'upsert':
+                assignments = [f"`{col}`=VALUES(`{col}`)" for col in (update_columns or columns)]
+                assignments += [f"`{col}`={expression}" for col, expression in (update_expressions or {}).items()]
+                sql += f" ON DUPLICATE KEY UPDATE {', '.join(assignments)}"
+            
+            chunk_size = max(1, int(chunk_size or DB_BULK_CHUNK_SIZE))
+            written = 0
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                written += self._execute_chunk(sql, chunk, skip_errors)
+        
+        logger.info(f"📥 대량 삽입 완료: {table} {written}행 ({mode}, {time.perf_counter() - start:.2f}초)")
+        return written
+    
+    @staticmethod
+    def _row_values(row, columns):
+        """columns 순서의 튜플로 변환 (딕셔너리 행 지원, pandas 결측값 NaN은 NULL)"""
+        values = (row.get(col) for col in columns) if isinstance(row, dict) else row
+        return tuple(None if isinstance(value, float) and math.isnan(value) else value for value in values)
+    
+    def _execute_chunk(self, sql, chunk, skip_errors):
+        """
+        한 묶음을 executemany로 삽입
+        
+        묶음이 여러 문장으로 나뉘어도 일부만 반영되지 않도록 트랜잭션으로 감싸고,
+        skip_errors면 실패 시 롤백 후 한 행씩 다시 넣습니다 (이미 트랜잭션 중이면 그대로 실행).
+        
+        Returns:
+            int: 삽입된 행 수
+        """
+        own_transaction = not self._in_transaction
+        start = time.perf_counter()
+        try:
+            if own_transaction:
+                self.connection.begin()
+            with self.connection.cursor() as cursor:
+                cursor.executemany(sql, chunk)
+            if own_transaction:
+                self.connection.commit()
+            self._record_query(sql, chunk, time.perf_counter() - start, len(chunk))
+            return len(chunk)
+        except Exception as e:
+            self._record_query(sql, chunk, time.perf_counter() - start, 0, error=True)
+            self._mark_broken(e)
+            if own_transaction and not self._broken:
+                self.connection.rollback()
+            if not skip_errors or self._broken or not own_transaction:
+                logger.error(f"❌ 대량 삽입 실패: {str(e)}")
+                raise
+            logger.warning(f"⚠️ 대량 삽입 묶음 실패, 한 행씩 다시 삽입: {str(e)}")
+        
+        written = 0
+        with self.connection.cursor() as cursor:
+            for row in chunk:
+                start = time.perf_counter()
+                try:
+                    cursor.execute(sql, row)
+                    written += 1
+                    self._record_query(sql, row, time.perf_counter() - start, 1)
+                except Exception as e:
+                    self._record_query(sql, row, time.perf_counter() - start, 0, error=True)
+                    self._mark_broken(e)
+                    if self._broken:
+                        raise
+                    logger.warning(f"⚠️ 행 삽입 실패: {str(e)}")
+        return written
+    
+    @staticmethod
+    def _tsv_field(value):
+        """LOAD DATA 기본 형식 필드 (NULL은 \\N, 역슬래시/탭/줄바꿈은 이스케이프)"""
+        if value is None:
+            return '\\N'
+        if isinstance(value, bool):
+            return '1' if value else '0'
+        return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+                .replace('\n', '\\n').replace('\r', '\\r'))
+    
+    def _load_infile(self, table, column_list, rows):
+        """행을 임시 TSV로 쓰고 LOAD DATA LOCAL INFILE로 적재 (적재된 행 수 반환)"""
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', newline='', suffix='.tsv', delete=False) as tsv_file:
+            path = tsv_file.name
+            for row in rows:
+                tsv_file.write('\t'.join(self._tsv_field(value) for value in row) + '\n')
+        
+        sql = (f"LOAD DATA LOCAL INFILE %s INTO TABLE `{table}` CHARACTER SET utf8mb4 "
+               f"FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' ({column_list})")
+        connection = None
+        start = time.perf_counter()
+        try:
+            connection = self._open_connection(local_infile=True)
+            with connection.cursor() as cursor:
+                cursor.execute(sql, (path,))
+                self._record_query(sql, (path,), time.perf_counter() - start, cursor.rowcount)
+                return cursor.rowcount
+        except Exception as e:
+            self._record_query(sql, (path,), time.perf_counter() - start, 0, error=True)
+            logger.error(f"❌ LOAD DATA LOCAL INFILE 실패: {str(e)}")
             raise
+        finally:
+            if connection:
+                connection.close()
+            os.remove(path)
     
     def begin_transaction(self):
         """트랜잭션 시작"""
         if self.connection:
             self.connection.begin()
+            self._in_transaction = True
             logger.debug("🔄 트랜잭션 시작")
     
     def commit(self):
         """트랜잭션 커밋"""
         if self.connection:
             self.connection.commit()
+            self._in_transaction = False
             logger.debug("✅ 트랜잭션 커밋")
     
     def rollback(self):
         """트랜잭션 롤백"""
         if self.connection:
             self.connection.rollback()
+            self._in_transaction = False
             logger.debug("↩️ 트랜잭션 롤백")
     
     def get_table_info(self, table_name: str) -> List[Dict[str, Any]]:
@@ -176,29 +176,12 @@ class ScoresManager:
             if not self.db.connect():
                 return 0
                 
-            for score_data in scores_list:
-                try:
-                    sql = """
-                    INSERT INTO scores (
-                        기관명, 일반전형, 성실성, 개방성, 외향성, 우호성, 정서안정성,
-                        기술전문성, 인지문제해결, `대인-영향력`, 자기관리, 적응력,
-                        학습속도, 대인민첩성, 성과민첩성, 자기인식, 자기조절, `공감-사회기술`
-                    ) VALUES (
-                        %(기관명)s, %(일반전형)s, %(성실성)s, %(개방성)s, %(외향성)s, %(우호성)s, %(정서안정성)s,
-                        %(기술전문성)s, %(인지문제해결)s, %(대인-영향력)s, %(자기관리)s, %(적응력)s,
-                        %(학습속도)s, %(대인민첩성)s, %(성과민첩성)s, %(자기인식)s, %(자기조절)s, %(공감-사회기술)s
-                    ) ON DUPLICATE KEY UPDATE
-                        성실성=VALUES(성실성), 개방성=VALUES(개방성), 외향성=VALUES(외향성),
-                        우호성=VALUES(우호성), 정서안정성=VALUES(정서안정성), 기술전문성=VALUES(기술전문성),
-                        인지문제해결=VALUES(인지문제해결), `대인-영향력`=VALUES(`대인-영향력`), 자기관리=VALUES(자기관리),
-                        적응력=VALUES(적응력), 학습속도=VALUES(학습속도), 대인민첩성=VALUES(대인민첩성),
-                        성과민첩성=VALUES(성과민첩성), 자기인식=VALUES(자기인식), 자기조절=VALUES(자기조절),
-                        `공감-사회기술`=VALUES(`공감-사회기술`), updated_at=CURRENT_TIMESTAMP
-                    """
-                    self.db.execute_query(sql, score_data, fetch=False)
-                    success_count += 1
-                except Exception as e:
-                    logger.warning(f"⚠️ 개별 점수 데이터 삽입 실패: {score_data.get('기관명', 'Unknown')} - {e}")
+            # (기관명, 일반전형)이 같은 행은 점수만 갱신, 실패한 묶음은 한 행씩 다시 넣어 실패한 행만 건너뜀
+            success_count = self.db.bulk_insert(
+                'scores', ['기관명', '일반전형'] + self.score_columns, scores_list, mode='upsert',
+                update_columns=self.score_columns, update_expressions={'updated_at': 'CURRENT_TIMESTAMP'},
+                skip_errors=True
+            )
             
             logger.info(f"🔄 대량 점수 데이터 저장 완료: {success_count}/{len(scores_list)}개")
             
@@ -7,7 +7,7 @@ import os
 import sys
 import uuid
 from datetime import datetime
-from database_manager import DatabaseManager
+from database_manager import DatabaseManager, print_query_stats
 from dotenv import load_dotenv
 
 # 환경변수 로드
@@ -139,69 +139,55 @@ def split_and_insert_data(db_manager, source_table, target_table, columns):
     select_columns = ', '.join([f"`{col}`" for col in select_columns_list])
     query = f"SELECT {select_columns} FROM {source_table}"
     
-    print(f"\n📥 {source_table}에서 데이터 로딩 중...")
-    source_data = db_manager.execute_query(query)
-    
-    if not source_data:
-        print("❌ 소스 데이터를 가져올 수 없습니다.")
-        return False
-    
-    print(f"✅ 총 {len(source_data)}개 행 로딩 완료")
-    
     # 데이터 분리 및 삽입
+    source_rows = 0
     total_inserted = 0
     failed_count = 0
     
     # 삽입용 컬럼 (그룹ID 포함, id 제외)
     insert_columns = select_columns_list + ['그룹ID']
-    placeholders = ', '.join(['%s'] * len(insert_columns))
-    insert_query = f"INSERT INTO {target_table} ({', '.join([f'`{col}`' for col in insert_columns])}) VALUES ({placeholders})"
+    job_types_idx = select_columns_list.index('일반전형')
     
-    print(f"\n🔄 데이터 분리 및 삽입 중...")
+    print(f"\n🔄 {source_table}에서 데이터를 읽으며 분리 및 삽입 중...")
     
-    for row_idx, row in enumerate(source_data, 1):
-        try:
+    # 원본은 서버 측 커서로 배치씩 읽고 (전체 테이블을 메모리에 올리지 않음),
+    # 배치에서 분리한 행은 db_manager 커넥션으로 대량 삽입
+    for batch in db_manager.iter_query(query):
+        split_rows = []
+        for row in batch:
+            source_rows += 1
             # 그룹ID 생성 (동일한 원본 행에서 분리된 것들은 같은 ID)
             group_id = str(uuid.uuid4())
             
-            # 일반전형 컬럼 찾기
-            job_types_idx = select_columns_list.index('일반전형')
-            job_types_value = row[job_types_idx] if row[job_types_idx] else ''
-            
             # 콤마로 분리
+            job_types_value = row[job_types_idx] if row[job_types_idx] else ''
             if ',' in job_types_value:
                 job_type_list = [jt.strip() for jt in job_types_value.split(',') if jt.strip()]
             else:
                 job_type_list = [job_types_value.strip()] if job_types_value.strip() else ['']
             
-            # 각 일반전형에 대해 행 생성
+            # 각 일반전형에 대해 행 생성 (분리된 일반전형으로 교체, 그룹ID 추가)
             for job_type in job_type_list:
-                try:
-                    new_row = list(row)
-                    new_row[job_types_idx] = job_type  # 분리된 일반전형으로 교체
-                    new_row.append(group_id)  # 그룹ID 추가
-                    
-                    # 개별 삽입
-                    db_manager.execute_query(insert_query, new_row, fetch=False)
-                    total_inserted += 1
-                    
-                except Exception as insert_error:
-                    print(f"   ❌ 개별 삽입 실패 (행 {row_idx}, 전형: {job_type}): {insert_error}")
-                    failed_count += 1
-            
-            if row_idx % 50 == 0:
-                print(f"   🔄 {row_idx}/{len(source_data)} 행 처리 완료... (분리된 행: {total_inserted})")
-                
-        except Exception as e:
-            print(f"   ❌ 행 {row_idx} 처리 오류: {e}")
-            failed_count += 1
-            continue
+                new_row = list(row)
+                new_row[job_types_idx] = job_type
+                new_row.append(group_id)
+                split_rows.append(new_row)
+        
+        # 실패한 묶음은 한 행씩 다시 넣어 실패한 행만 건너뜀
+        inserted = db_manager.bulk_insert(target_table, insert_columns, split_rows, skip_errors=True)
+        total_inserted += inserted
+        failed_count += len(split_rows) - inserted
+        print(f"   🔄 {source_rows} 행 처리 완료... (분리된 행: {total_inserted})")
+    
+    if not source_rows:
+        print("❌ 소스 데이터를 가져올 수 없습니다.")
+        return False
     
     print(f"\n📊 데이터 분리 및 삽입 완료:")
-    print(f"   - 원본 행 수: {len(source_data)}")
+    print(f"   - 원본 행 수: {source_rows}")
     print(f"   - 분리된 행 수: {total_inserted}")
     print(f"   - 실패 수: {failed_count}")
-    print(f"   - 확장 비율: {total_inserted / len(source_data):.1f}배")
+    print(f"   - 확장 비율: {total_inserted / source_rows:.1f}배")
     
     return total_inserted > 0
 
@@ -308,6 +294,7 @@ def main():
         if db_manager:
             db_manager.disconnect()
             print("🔌 데이터베이스 연결 종료")
+        print_query_stats()
 
 if __name__ == "__main__":
     main()
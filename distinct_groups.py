@@ -0,0 +1,113 @@
+"""
+그룹별 중복 제거 추천 모듈
+같은 (기관명, 일반전형) 공고가 상위 결과를 모두 차지하지 않도록, 그룹마다 유사도가 가장 높은 공고 하나만 남긴 뒤
+그룹 대표 공고 중에서 상위 k개를 고릅니다.
+
+그룹 번호와 그룹 순 정렬(그룹 번호, 공고 id 순)은 기준별로 한 번만 계산하고,
+요청 시에는 정렬된 열 순서로 유사도를 모아 np.maximum.reduceat으로 그룹 최댓값을 구합니다.
+"""
+
+import numpy as np
+from scoring_kernel import select_top_k_batch
+from posting_records import missing_rows
+
+# distinct_by 기준 이름 → 설명
+DISTINCT_MODES = {
+    'form': '일반전형',
+    'agency_form': '기관명 + 일반전형',
+    'agency': '기관명'
+}
+
+def posting_group_ids(records, mode):
+    """
+    기준별 공고 그룹 번호
+
+    Args:
+        records: 응답용 공고 레코드 (PostingRecords)
+        mode: distinct_by 기준 (DISTINCT_MODES 키)
+
+    Returns:
+        np.ndarray: 공고별 그룹 번호 (P,), 기준 라벨이 결측(None)인 공고는 각자 별도 그룹
+    """
+    agency_codes = np.asarray(records.agency_codes, dtype=np.int64)
+    form_codes = np.asarray(records.form_codes, dtype=np.int64)
+    if mode == 'form':
+        group_ids, missing = form_codes, missing_rows(form_codes, records.forms)
+    elif mode == 'agency':
+        group_ids, missing = agency_codes, missing_rows(agency_codes, records.agencies)
+    elif mode == 'agency_form':
+        group_ids = agency_codes * len(records.forms) + form_codes
+        missing = missing_rows(agency_codes, records.agencies) | missing_rows(form_codes, records.forms)
+    else:
+        raise ValueError(f"지원하지 않는 distinct_by 기준입니다: {mode}")
+
+    # 결측 라벨끼리 한 그룹으로 묶이지 않도록 기존 그룹 번호 뒤에 공고마다 번호 부여
+    if missing.any():
+        group_ids = group_ids.copy()
+        group_ids[missing] = len(records.agencies) * len(records.forms) + np.arange(np.count_nonzero(missing))
+    return group_ids
+
+def _group_layout(group_ids, ids):
+    """그룹 번호, id 순 정렬 순서와 그룹 시작 위치"""
+    order = np.lexsort((ids, group_ids))
+    sorted_groups = group_ids[order]
+    starts = np.flatnonzero(np.concatenate(([True], sorted_groups[1:] != sorted_groups[:-1])))
+    return order, starts
+
+class PostingGroups:
+    """한 중복 제거 기준의 공고 그룹 배치"""
+
+    def __init__(self, group_ids, ids):
+        """
+        Args:
+            group_ids: 공고별 그룹 번호 (P,)
+            ids: 공고 id 배열 (P,), 그룹 안 동점 처리 기준
+        """
+        self.group_ids = np.asarray(group_ids)
+        self.ids = np.asarray(ids)
+        self.order, self.starts = _group_layout(self.group_ids, self.ids)
+        self.order.flags.writeable = False
+        self.starts.flags.writeable = False
+
+    def __len__(self):
+        return len(self.starts)
+
+    def select(self, similarities, top_k, rows=None):
+        """
+        그룹별 최고 공고 중 상위 k개 선택
+
+        그룹 안에서는 유사도가 가장 높은 공고(동점이면 id가 작은 공고)를 대표로 고르고,
+        대표 공고끼리는 유사도 내림차순, 동점이면 id 오름차순으로 정렬합니다.
+
+        Args:
+            similarities: 유사도 행렬 (N×P), rows가 있으면 (N×len(rows))
+            top_k: 사용자별 추천할 그룹 수
+            rows: similarities 열에 해당하는 공고 행 번호 (없으면 전체 공고)
+
+        Returns:
+            tuple: (similarities 열 번호 (N×k), 유사도 (N×k))
+        """
+        similarities = np.asarray(similarities)
+        num_users, num_columns = similarities.shape
+        if num_columns == 0 or num_users == 0:
+            return np.empty((num_users, 0), dtype=np.intp), np.empty((num_users, 0), dtype=similarities.dtype)
+
+        if rows is None:
+            order, starts, column_ids = self.order, self.starts, self.ids
+        else:
+            # 필터된 행만 다시 그룹 순으로 정렬 (비용은 선택된 행 수에 비례)
+            column_ids = self.ids[rows]
+            order, starts = _group_layout(self.group_ids[rows], column_ids)
+
+        # 그룹 순으로 모은 유사도에서 그룹별 최댓값 (N×G)
+        grouped = similarities[:, order]
+        group_best = np.maximum.reduceat(grouped, starts, axis=1)
+
+        # 최댓값을 가진 첫 위치 = 그룹 안에서 id가 가장 작은 최고 공고
+        sizes = np.diff(np.append(starts, num_columns))
+        positions = np.where(grouped == np.repeat(group_best, sizes, axis=1), np.arange(num_columns), num_columns)
+        best_columns = order[np.minimum.reduceat(positions, starts, axis=1)]
+
+        top_groups = select_top_k_batch(group_best, top_k, column_ids[best_columns])
+        return (np.take_along_axis(best_columns, top_groups, axis=1),
+                np.take_along_axis(group_best, top_groups, axis=1))
@@ -0,0 +1,41 @@
+"""
+일반전형 분류 모듈
+전형명 키워드로 직무 분류(기술/전문직, 행정/사무직, 대인서비스, 운전직, 공무직, 관리직)를 판정합니다.
+채용공고 평가점수 생성(db/create_job_posting_scores_table.py)과 추천 API의 분류 필터가 같은 기준을 사용합니다.
+"""
+
+# 분류 이름 → 전형명 키워드 (전형명을 소문자로 바꾼 뒤 부분 문자열로 비교)
+FORM_CATEGORY_KEYWORDS = {
+    'technical': ['기술', '연구', '개발', 'it', '정보', '시스템', '프로그램', '엔지니어', '전산', '소프트웨어', '기계', '전기', '토목', '건축', '통신', '신호'],
+    'administrative': ['사무', '행정', '관리', '총무', '기획', '회계', '인사'],
+    'service': ['고객', '상담', '민원', '안내', '서비스', '접수'],
+    'driving': ['운전'],
+    'civil_service': ['공무'],
+    'manager': ['팀장', '과장', '부장', '관리자', '책임자', '리더']
+}
+
+# 분류 이름 → 표시 이름
+FORM_CATEGORY_LABELS = {
+    'technical': '기술/전문직',
+    'administrative': '행정/사무직',
+    'service': '대인서비스',
+    'driving': '운전직',
+    'civil_service': '공무직',
+    'manager': '관리직'
+}
+
+def classify_form(일반전형):
+    """
+    전형명이 속한 분류 목록 조회
+
+    Args:
+        일반전형 (str): 전형명
+
+    Returns:
+        list: 해당하는 분류 이름 리스트 (FORM_CATEGORY_KEYWORDS 순서, 없으면 빈 리스트)
+    """
+    form_text = str(일반전형).lower()
+    return [
+        category for category, keywords in FORM_CATEGORY_KEYWORDS.items()
+        if any(keyword in form_text for keyword in keywords)
+    ]
@@ -0,0 +1,57 @@
+"""
+gunicorn 설정 (프리포크 멀티 워커 서빙)
+
+환경변수:
+    API_HOST      : 바인딩 주소 (기본 0.0.0.0)
+    API_PORT      : 포트 (기본 8888)
+    API_WORKERS   : 워커 프로세스 수 (기본 CPU 코어 수)
+    API_THREADS   : 워커당 스레드 수 (기본 1)
+    API_TIMEOUT   : 워커 응답 제한 시간 (초, 기본 30)
+
+.env 파일이 있으면 먼저 읽습니다 (개발 서버와 같은 설정 사용).
+모델 다시 로딩: kill -HUP <마스터 pid> 또는 POST /reload_model (워커가 마스터에 HUP 신호 전송)
+"""
+
+import gc
+import os
+import multiprocessing
+from dotenv import load_dotenv
+
+load_dotenv()
+
+bind = f"{os.getenv('API_HOST', '0.0.0.0')}:{os.getenv('API_PORT', 8888)}"
+workers = int(os.getenv('API_WORKERS', multiprocessing.cpu_count()))
+threads = int(os.getenv('API_THREADS', 1))
+timeout = int(os.getenv('API_TIMEOUT', 30))
+
+# 마스터에서 앱(모델 포함)을 로딩한 뒤 fork → 모델 배열은 copy-on-write로 공유
+preload_app = True
+
+accesslog = None
+errorlog = '-'
+loglevel = 'info'
+
+def when_ready(server):
+    """워커 fork 직전(마스터): 로딩된 객체를 GC 대상에서 제외해 공유 페이지가 복사되지 않도록 함"""
+    gc.collect()
+    gc.freeze()
+    server.log.info(f"🚀 모델 로딩 완료, 워커 {workers}개 시작")
+
+def on_reload(server):
+    """HUP 신호(마스터): 새 워커를 fork 하기 전에 마스터의 모델을 다시 로딩"""
+    # preload_app이 아니면 새 워커가 앱과 모델을 직접 로딩함
+    if not server.cfg.preload_app:
+        return
+    import job_recommendation_api
+    if job_recommendation_api.load_similarity_model():
+        gc.collect()
+        gc.freeze()
+        server.log.info(f"🔄 모델 다시 로딩 완료 (버전: {job_recommendation_api.active_snapshot.version}), 워커 교체")
+    else:
+        server.log.error("❌ 모델 다시 로딩 실패, 이전 모델로 워커를 교체합니다")
+
+def post_fork(server, worker):
+    """워커 시작 로그, /reload_model이 신호를 보낼 마스터 pid 등록"""
+    import job_recommendation_api
+    job_recommendation_api.gunicorn_master_pid = server.pid
+    server.log.info(f"👷 워커 시작 (pid: {worker.pid})")
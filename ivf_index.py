@@ -0,0 +1,167 @@
+"""
+IVF(역색인) 벡터 인덱스 모듈
+모델 빌드 시 L2 정규화된 공고 행렬을 구면 k-means로 군집화하고, 공고를 군집 순으로 연속 저장합니다.
+
+요청 시에는 사용자와 군집 중심점의 코사인 유사도로 가까운 군집 nprobe개를 고른 뒤,
+각 군집의 연속 구간(cluster_postings[start:end])만 행렬 곱으로 계산합니다.
+공고 행 번호로 흩어진 행을 모으는(gather) 2단계 추천(coarse_index)과 달리 구간 복사만 하므로
+수백만 건 공고에서도 후보 수에 비례하는 비용으로 계산됩니다.
+
+군집 탐색은 근사이므로 재현율은 test/benchmark_ivf_index.py로 전체 계산과 비교해 확인합니다.
+"""
+
+import numpy as np
+from scoring_kernel import select_top_k_batch
+
+# 군집 할당 시 한 번에 계산할 공고 수 (공고 수 × 군집 수 유사도 행렬 메모리 제한)
+ASSIGN_CHUNK_SIZE = 65536
+
+def _assign_clusters(postings, centroids):
+    """공고별 가장 가까운 군집 번호와 그 유사도 (메모리 제한을 위해 나누어 계산)"""
+    assignments = np.empty(len(postings), dtype=np.int64)
+    best_similarities = np.empty(len(postings), dtype=np.float32)
+    for start in range(0, len(postings), ASSIGN_CHUNK_SIZE):
+        similarities = postings[start:start + ASSIGN_CHUNK_SIZE] @ centroids.T
+        assignments[start:start + ASSIGN_CHUNK_SIZE] = similarities.argmax(axis=1)
+        best_similarities[start:start + ASSIGN_CHUNK_SIZE] = similarities.max(axis=1)
+    return assignments, best_similarities
+
+def train_ivf(postings, num_clusters, iterations=20, sample_size=None, seed=42):
+    """
+    구면 k-means로 공고 군집화
+
+    공고 행렬은 이미 L2 정규화되어 있으므로 내적 = 코사인 유사도로 할당하고,
+    중심점은 군집 합을 다시 정규화합니다. 학습은 표본(기본 군집당 256개)으로 하고 전체 공고는 마지막에 할당합니다.
+
+    Args:
+        postings: L2 정규화된 공고 행렬 (P×16)
+        num_clusters: 군집 수
+        iterations: k-means 반복 횟수
+        sample_size: 학습 표본 수 (없으면 군집 수 × 256)
+        seed: 난수 시드
+
+    Returns:
+        tuple: (중심점 (C×16, float32), 군집 순 공고 행 번호 order (P,), 군집별 구간 경계 offsets (C+1,))
+    """
+    postings = np.ascontiguousarray(postings, dtype=np.float32)
+    num_clusters = int(num_clusters)
+    if not 0 < num_clusters <= len(postings):
+        raise ValueError(f"군집 수는 1 이상 공고 수({len(postings)}) 이하여야 합니다: {num_clusters}")
+
+    rng = np.random.default_rng(seed)
+    sample_size = min(len(postings), sample_size or num_clusters * 256)
+    sample = postings[np.sort(rng.choice(len(postings), sample_size, replace=False))]
+    centroids = sample[rng.choice(len(sample), num_clusters, replace=False)].copy()
+
+    for _ in range(iterations):
+        assignments, best_similarities = _assign_clusters(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, sample)
+
+        # 빈 군집은 현재 중심점과 가장 먼 표본으로 다시 시작
+        empty = np.flatnonzero(np.bincount(assignments, minlength=num_clusters) == 0)
+        if len(empty):
+            sums[empty] = sample[np.argsort(best_similarities)[:len(empty)]]
+
+        norms = np.linalg.norm(sums, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        centroids = sums / norms
+
+    assignments, _ = _assign_clusters(postings, centroids)
+    order = np.argsort(assignments, kind='stable').astype(np.int64)
+    offsets = np.zeros(num_clusters + 1, dtype=np.int64)
+    np.cumsum(np.bincount(assignments, minlength=num_clusters), out=offsets[1:])
+    return centroids.astype(np.float32), order, offsets
+
+class IVFIndex:
+    """군집별로 공고를 연속 저장한 IVF 인덱스"""
+
+    def __init__(self, kernel, centroids, order, offsets, cluster_postings=None, cluster_ids=None):
+        """
+        Args:
+            kernel: 공고 단위 유사도 커널 (표준화 파라미터, 공고 행렬, id)
+            centroids: L2 정규화된 군집 중심점 (C×16)
+            order: 군집 순 공고 행 번호 (P,)
+            offsets: 군집별 order 구간 경계 (C+1,)
+            cluster_postings: 군집 순으로 연속 저장한 공고 행렬 (없으면 kernel.postings[order])
+            cluster_ids: 군집 순 공고 id (없으면 id[order])
+        """
+        self.kernel = kernel
+        self.centroids = np.ascontiguousarray(centroids, dtype=np.float32)
+        self.order = np.asarray(order)
+        self.offsets = np.asarray(offsets)
+        if cluster_postings is None:
+            cluster_postings = kernel.postings[self.order]
+        if cluster_ids is None:
+            cluster_ids = np.asarray(kernel.posting_info['id'])[self.order]
+        self.cluster_postings = np.asarray(cluster_postings)
+        self.cluster_ids = np.asarray(cluster_ids)
+        for values in (self.centroids, self.cluster_postings, self.cluster_ids):
+            if values.flags.writeable:
+                values.flags.writeable = False
+
+    def __len__(self):
+        return len(self.centroids)
+
+    @property
+    def sizes(self):
+        """군집별 공고 수"""
+        return np.diff(self.offsets)
+
+    def _nearest_clusters(self, user_standardized, nprobe):
+        """사용자별 중심점 유사도가 높은 군집 nprobe개 (구간 순서대로 정렬)"""
+        nprobe = min(int(nprobe), len(self))
+        centroid_scores = user_standardized @ self.centroids.T
+        nearest = np.argpartition(-centroid_scores, nprobe - 1, axis=1)[:, :nprobe]
+        return np.sort(nearest, axis=1)
+
+    def probe(self, user_score_matrix, nprobe):
+        """
+        사용자별 가까운 군집의 공고 행 번호 (코사인 외 지표/가중치 계산용)
+
+        Args:
+            user_score_matrix: 사용자 원점수 배열 (N×16)
+            nprobe: 사용자별 선택할 군집 수
+
+        Returns:
+            list: 사용자별 후보 공고 행 번호 배열
+        """
+        user_standardized = self.kernel.standardize(user_score_matrix).reshape(-1, self.centroids.shape[1])
+        return [
+            np.concatenate([self.order[self.offsets[cluster]:self.offsets[cluster + 1]] for cluster in clusters])
+            for clusters in self._nearest_clusters(user_standardized, nprobe)
+        ]
+
+    def search(self, user_score_matrix, nprobe, top_k):
+        """
+        가까운 군집 nprobe개의 연속 구간만 코사인 유사도로 계산해 상위 k개 선택
+
+        Args:
+            user_score_matrix: 사용자 원점수 배열 (N×16)
+            nprobe: 사용자별 탐색할 군집 수
+            top_k: 사용자별 추천할 공고 수
+
+        Returns:
+            tuple: (사용자별 상위 공고 행 번호 리스트, 사용자별 상위 공고 유사도 리스트)
+        """
+        user_standardized = self.kernel.standardize(user_score_matrix).reshape(-1, self.centroids.shape[1])
+        user_norms = np.linalg.norm(user_standardized, axis=1)
+        user_norms[user_norms == 0] = 1.0
+
+        top_indices, top_similarities = [], []
+        for user, norm, clusters in zip(user_standardized, user_norms,
+                                        self._nearest_clusters(user_standardized, nprobe)):
+            starts, ends = self.offsets[clusters], self.offsets[clusters + 1]
+            # 군집 구간을 이어 붙여 한 번의 행렬-벡터 곱으로 계산 (구간 단위 복사)
+            candidates = np.concatenate([self.cluster_postings[s:e] for s, e in zip(starts, ends)])
+            candidate_ids = np.concatenate([self.cluster_ids[s:e] for s, e in zip(starts, ends)])
+            similarities = (candidates @ user / norm)[None, :]
+
+            user_top = select_top_k_batch(similarities, top_k, candidate_ids)[0]
+            # 후보 위치 → 군집 순 위치 → 공고 행 번호
+            boundaries = np.cumsum(ends - starts)
+            segments = np.searchsorted(boundaries, user_top, side='right')
+            positions = starts[segments] + user_top - (boundaries[segments] - (ends - starts)[segments])
+            top_indices.append(self.order[positions])
+            top_similarities.append(similarities[0, user_top])
+        return top_indices, top_similarities
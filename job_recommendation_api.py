@@ -5,12 +5,23 @@
 """
 
 import os
-import pickle
+import json
+import math
+import signal
+import threading
+from datetime import datetime
 import numpy as np
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from sklearn.metrics.pairwise import cosine_similarity
-from database_manager import DatabaseManager
+from database_manager import DatabaseManager, pool_stats, query_stats, DB_SLOW_QUERY_MS
+from scoring_kernel import select_top_k_batch
+from model_snapshot import load_model_snapshot, SCORING_ENGINES
+from similarity_metrics import METRICS
+from posting_filters import FILTER_FIELDS
+from distinct_groups import DISTINCT_MODES
+from form_categories import FORM_CATEGORY_KEYWORDS
+from recommendation_cache import RecommendationCache
+from request_coalescer import RequestCoalescer
 from log_config import get_logger
 
 # 로깅 설정
@@ -19,42 +30,131 @@ logger = get_logger(__name__, 'job_recommendation_api.log')
 app = Flask(__name__)
 CORS(app)
 
-# 글로벌 변수로 모델 저장
-similarity_model = None
+# 글로벌 변수로 현재 서빙 중인 모델 스냅샷 저장 (참조 교체로만 갱신)
+active_snapshot = None
+MODEL_DIR = os.getenv('MODEL_DIR', './models')
 score_columns = [
     '성실성', '개방성', '외향성', '우호성', '정서안정성', '기술전문성',
     '인지문제해결', '대인영향력', '자기관리', '적응력', '학습속도',
     '대인민첩성', '성과민첩성', '자기인식', '자기조절', '공감사회기술'
 ]
 
+# 일괄 추천 요청당 최대 구직자 수
+MAX_BATCH_SIZE = int(os.getenv('MAX_BATCH_SIZE', 10000))
+
+# 요청당 최대 추천 공고 수 (top_k 상한)
+MAX_TOP_K = int(os.getenv('MAX_TOP_K', 100))
+
+# 추천 결과 캐시 (RECOMMENDATION_CACHE_SIZE=0이면 비활성화)
+recommendation_cache = RecommendationCache(
+    max_size=int(os.getenv('RECOMMENDATION_CACHE_SIZE', 10000)),
+    ttl_seconds=int(os.getenv('RECOMMENDATION_CACHE_TTL', 3600))
+)
+
+# 기본 유사도 계산 엔진 (kernel: 표준화 + 행렬 곱, lattice: 정수 점수 조회표)
+DEFAULT_SCORING_ENGINE = os.getenv('SCORING_ENGINE', 'kernel')
+
+# 기본 유사도 지표 (cosine/euclidean/weighted_cosine/hybrid)
+DEFAULT_SIMILARITY_METRIC = os.getenv('SIMILARITY_METRIC', 'cosine')
+
+# 동시 단건 추천 요청 묶음 처리 (COALESCE_WINDOW_MS=0이면 비활성화)
+COALESCE_WINDOW_MS = float(os.getenv('COALESCE_WINDOW_MS', 0))
+COALESCE_MAX_BATCH = int(os.getenv('COALESCE_MAX_BATCH', 64))
+
+# 샤딩 유사도 계산 샤드 수 (0이면 비활성화, 필터/2단계 추천이 없는 기본 코사인 계산을 워커 프로세스로 분산)
+SCORING_SHARDS = int(os.getenv('SCORING_SHARDS', 0))
+
+# 2단계 추천 기본 탐색 그룹 수 (0이면 전체 공고 계산, 요청의 nprobe로 변경 가능)
+DEFAULT_COARSE_NPROBE = int(os.getenv('COARSE_NPROBE', 0))
+
+# gunicorn 워커로 실행 중이면 마스터 프로세스 pid (gunicorn.conf.py의 post_fork에서 설정)
+gunicorn_master_pid = None
+
+# 백그라운드 모델 리로드 상태
+reload_lock = threading.Lock()
+reload_thread = None
+reload_status = {
+    'state': 'idle',
+    'started_at': None,
+    'finished_at': None,
+    'error': None
+}
+
 def load_similarity_model():
-    """유사도 모델 로드"""
-    global similarity_model
+    """
+    유사도 모델 로드
+    
+    새 스냅샷을 완전히 만든 뒤 active_snapshot 참조 한 번으로 교체합니다.
+    처리 중인 요청은 시작할 때 잡은 이전 스냅샷으로 끝까지 처리됩니다.
+    """
+    global active_snapshot
     try:
-        model_path = './models/similarity_model.pkl'
+        snapshot = load_model_snapshot(MODEL_DIR, score_columns)
         
-        if not os.path.exists(model_path):
-            logger.error(f"❌ 모델 파일이 존재하지 않습니다: {model_path}")
-            return False
+        active_snapshot = snapshot
         
-        with open(model_path, 'rb') as f:
-            similarity_model = pickle.load(f)
+        # 이전 모델의 추천 결과 캐시 무효화
+        recommendation_cache.clear()
         
-        logger.info("✅ 유사도 모델 로딩 완료")
-        logger.info(f"📊 총 공고 수: {len(similarity_model['job_posting_scores'])}")
+        logger.info(f"✅ 유사도 모델 로딩 완료 (버전: {snapshot.version}, {snapshot.load_seconds:.3f}초)")
+        logger.info(f"📊 총 공고 수: {len(snapshot)}")
+        
+        # 샤딩 계산이 켜져 있으면 공고 행렬을 공유 메모리로 미리 복사 (gunicorn 워커는 fork 후 같은 블록 사용)
+        if SCORING_SHARDS > 0:
+            snapshot.sharded_scorer(SCORING_SHARDS)
+            logger.info(f"🧩 샤딩 유사도 계산 사용: 샤드 {SCORING_SHARDS}개")
         return True
         
     except Exception as e:
         logger.error(f"❌ 모델 로딩 실패: {e}")
         return False
 
+def _reload_in_background():
+    """백그라운드 스레드에서 모델 로딩 후 상태 기록"""
+    succeeded = load_similarity_model()
+    with reload_lock:
+        reload_status['state'] = 'succeeded' if succeeded else 'failed'
+        reload_status['finished_at'] = datetime.now().isoformat()
+        reload_status['error'] = None if succeeded else '모델 로딩에 실패했습니다. 로그를 확인하세요.'
+
+def start_model_reload():
+    """
+    백그라운드 모델 리로드 시작
+    
+    Returns:
+        threading.Thread: 리로드 스레드 (이미 진행 중이면 None)
+    """
+    global reload_thread
+    with reload_lock:
+        if reload_thread is not None and reload_thread.is_alive():
+            return None
+        reload_status.update({
+            'state': 'loading',
+            'started_at': datetime.now().isoformat(),
+            'finished_at': None,
+            'error': None
+        })
+        reload_thread = threading.Thread(target=_reload_in_background, name='model-reload', daemon=True)
+        reload_thread.start()
+        return reload_thread
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """헬스 체크"""
+    snapshot = active_snapshot
+    with reload_lock:
+        reload_state = dict(reload_status)
+    
     return jsonify({
         'status': 'healthy',
         'service': 'job_recommendation_api',
-        'model_loaded': similarity_model is not None
+        'model_loaded': snapshot is not None,
+        'model_version': snapshot.version if snapshot else None,
+        'model': snapshot.describe() if snapshot else None,
+        'reload': reload_state,
+        'cache': recommendation_cache.stats(),
+        'coalescer': request_coalescer.stats() if request_coalescer else None,
+        'db_pools': pool_stats()
     })
 
 @app.route('/recommend', methods=['POST'])
@@ -69,11 +169,19 @@ def recommend_jobs():
             "개방성": 3,
             ...
         },
-        "top_k": 5  // 선택사항, 기본값 5
+        "top_k": 5,  // 선택사항, 기본값 5 (1~MAX_TOP_K)
+        "engine": "lattice",  // 선택사항, 유사도 계산 엔진 (kernel/lattice)
+        "metric": "hybrid",  // 선택사항, 유사도 지표 (cosine/euclidean/weighted_cosine/hybrid)
+        "weights": {"기술전문성": 2.0},  // 선택사항, 항목별 가중치 (생략한 항목은 1.0)
+        "filters": {"기관명": ["부산교통공사"], "category": ["technical"]},  // 선택사항, 추천 대상 공고 필터
+        "constraints": {"기술전문성": {"min": 4}, "성실성": 3},  // 선택사항, 공고 점수 조건 (숫자는 최소 점수)
+        "distinct_by": "agency_form",  // 선택사항, 그룹별 최고 공고 하나만 추천 (form/agency_form/agency)
+        "nprobe": 8  // 선택사항, 2단계 추천에서 탐색할 IVF 군집 또는 (기관명, 일반전형) 그룹 수 (0이면 전체 공고)
     }
     """
     try:
-        if similarity_model is None:
+        snapshot = active_snapshot
+        if snapshot is None:
             return jsonify({
                 'success': False,
                 'error': '모델이 로딩되지 않았습니다. 서버를 다시 시작해주세요.'
@@ -88,34 +196,29 @@ def recommend_jobs():
             }), 400
         
         user_scores = data['user_scores']
-        top_k = data.get('top_k', 5)
-        
-        # 점수 유효성 검사
-        missing_scores = [col for col in score_columns if col not in user_scores]
-        if missing_scores:
-            return jsonify({
-                'success': False,
-                'error': f'다음 점수가 누락되었습니다: {missing_scores}'
-            }), 400
         
-        # 점수 범위 검사 (1~5)
-        invalid_scores = [col for col in score_columns 
-                         if not (1 <= user_scores[col] <= 5)]
-        if invalid_scores:
+        # 점수/옵션 유효성 검사
+        options, error = parse_scoring_options(data)
+        error = error or validate_user_scores(user_scores)
+        if error:
             return jsonify({
                 'success': False,
-                'error': f'점수는 1~5 범위여야 합니다. 잘못된 점수: {invalid_scores}'
+                'error': error
             }), 400
+        top_k = options.pop('top_k')
         
         # 추천 수행
-        recommendations = get_recommendations(user_scores, top_k)
+        top_indices, top_similarities = rank_single(snapshot, user_scores, top_k, **options)
         
-        return jsonify({
-            'success': True,
-            'user_scores': user_scores,
-            'recommendations': recommendations,
-            'total_count': len(recommendations)
-        })
+        # 미리 인코딩된 공고 JSON 조각으로 응답 구성
+        body = b''.join((
+            b'{"success":true,"user_scores":',
+            json.dumps(user_scores, ensure_ascii=False).encode('utf-8'),
+            b',"recommendations":',
+            snapshot.records.encode(top_indices, top_similarities),
+            b',"total_count":%d}' % len(top_indices)
+        ))
+        return app.response_class(body, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"❌ 추천 실패: {e}")
@@ -124,80 +227,552 @@ def recommend_jobs():
             'error': str(e)
         }), 500
 
-def get_recommendations(user_scores, top_k=5):
-    """실제 추천 로직"""
+def validate_user_scores(user_scores):
+    """
+    사용자 점수 유효성 검사
+    
+    Args:
+        user_scores (dict): 사용자의 16가지 점수
+    
+    Returns:
+        str: 오류 메시지 (유효하면 None)
+    """
+    if not isinstance(user_scores, dict):
+        return 'user_scores는 객체 형식이어야 합니다.'
+    
+    missing_scores = [col for col in score_columns if col not in user_scores]
+    if missing_scores:
+        return f'다음 점수가 누락되었습니다: {missing_scores}'
+    
+    # 점수 형식 검사 (숫자만, bool 제외)
+    non_numeric_scores = [col for col in score_columns
+                          if isinstance(user_scores[col], bool) or not isinstance(user_scores[col], (int, float))]
+    if non_numeric_scores:
+        return f'점수는 숫자여야 합니다. 잘못된 점수: {non_numeric_scores}'
+    
+    # 점수 범위 검사 (1~5)
+    invalid_scores = [col for col in score_columns 
+                     if not (1 <= user_scores[col] <= 5)]
+    if invalid_scores:
+        return f'점수는 1~5 범위여야 합니다. 잘못된 점수: {invalid_scores}'
+    
+    return None
+
+def parse_scoring_options(data):
+    """
+    요청 본문의 추천 계산 옵션 파싱
+    
+    Args:
+        data (dict): 요청 본문
+    
+    Returns:
+        tuple: (top_k와 rank_postings에 전달할 옵션 딕셔너리, 오류 메시지 또는 None)
+    """
+    top_k = data.get('top_k', 5)
+    if isinstance(top_k, bool) or not isinstance(top_k, int) or not 1 <= top_k <= MAX_TOP_K:
+        return None, f'top_k는 1~{MAX_TOP_K} 범위의 정수여야 합니다.'
+    
+    engine = data.get('engine', DEFAULT_SCORING_ENGINE)
+    if engine not in SCORING_ENGINES:
+        return None, f'engine은 {sorted(SCORING_ENGINES)} 중 하나여야 합니다.'
+    
+    metric = data.get('metric', DEFAULT_SIMILARITY_METRIC)
+    if metric not in METRICS:
+        return None, f'metric은 {list(METRICS)} 중 하나여야 합니다.'
+    
+    weights, error = parse_weights(data.get('weights'))
+    if error:
+        return None, error
+    
+    filters, error = parse_filters(data.get('filters'))
+    if error:
+        return None, error
+    
+    constraints, error = parse_constraints(data.get('constraints'))
+    if error:
+        return None, error
+    
+    distinct_by = data.get('distinct_by')
+    if distinct_by is not None and distinct_by not in DISTINCT_MODES:
+        return None, f'distinct_by는 {list(DISTINCT_MODES)} 중 하나여야 합니다.'
+    
+    nprobe = data.get('nprobe', DEFAULT_COARSE_NPROBE)
+    if isinstance(nprobe, bool) or not isinstance(nprobe, int) or nprobe < 0:
+        return None, 'nprobe는 0 이상의 정수여야 합니다.'
+    
+    return {'top_k': top_k, 'engine': engine, 'metric': metric, 'weights': weights, 'filters': filters,
+            'constraints': constraints, 'distinct_by': distinct_by, 'nprobe': nprobe}, None
+
+def parse_weights(weights):
+    """
+    항목별 가중치 객체를 16개 가중치 튜플로 변환
+    
+    Args:
+        weights (dict): 항목명 → 가중치 (생략한 항목은 1.0, None이면 가중치 없음)
+    
+    Returns:
+        tuple: (가중치 튜플 또는 None, 오류 메시지 또는 None)
+    """
+    if weights is None:
+        return None, None
+    if not isinstance(weights, dict):
+        return None, 'weights는 객체 형식이어야 합니다.'
+    
+    unknown = [col for col in weights if col not in score_columns]
+    if unknown:
+        return None, f'알 수 없는 가중치 항목입니다: {unknown}'
+    
+    invalid = [col for col, value in weights.items()
+               if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 <= value < float('inf')]
+    if invalid:
+        return None, f'가중치는 0 이상의 숫자여야 합니다. 잘못된 가중치: {invalid}'
+    
+    vector = tuple(float(weights.get(col, 1.0)) for col in score_columns)
+    if not any(vector):
+        return None, '가중치가 모두 0일 수는 없습니다.'
+    return vector, None
+
+def parse_filters(filters):
+    """
+    추천 대상 공고 필터 객체를 해시 가능한 필터 조건으로 변환
+    
+    Args:
+        filters (dict): 필드(기관명/일반전형/category) → 값 또는 값 배열
+            같은 필드 안의 값은 하나라도 일치하면 되고, 필드끼리는 모두 만족해야 합니다.
+    
+    Returns:
+        tuple: (((필드, (값, ...)), ...) 필터 조건 또는 None, 오류 메시지 또는 None)
+    """
+    if filters is None:
+        return None, None
+    if not isinstance(filters, dict):
+        return None, 'filters는 객체 형식이어야 합니다.'
+    
+    unknown = [field for field in filters if field not in FILTER_FIELDS]
+    if unknown:
+        return None, f'알 수 없는 필터 항목입니다: {unknown} (지원 항목: {list(FILTER_FIELDS)})'
+    
+    conditions = []
+    for field, values in filters.items():
+        if isinstance(values, str):
+            values = [values]
+        if not isinstance(values, list) or not values or not all(isinstance(value, str) for value in values):
+            return None, f'{field} 필터는 문자열 또는 비어 있지 않은 문자열 배열이어야 합니다.'
+        if field == 'category':
+            invalid = [value for value in values if value not in FORM_CATEGORY_KEYWORDS]
+            if invalid:
+                return None, f'category는 {list(FORM_CATEGORY_KEYWORDS)} 중 하나여야 합니다. 잘못된 값: {invalid}'
+        conditions.append((field, tuple(sorted(set(values)))))
+    
+    return tuple(sorted(conditions)) or None, None
+
+def parse_constraints(constraints):
+    """
+    공고 점수 조건 객체를 해시 가능한 조건으로 변환
+    
+    Args:
+        constraints (dict): 항목명 → 최소 점수 또는 {"min": 최소, "max": 최대} (생략한 경계는 1/5)
+    
+    Returns:
+        tuple: (((항목 번호, 최소 점수, 최대 점수), ...) 또는 None, 오류 메시지 또는 None)
+    """
+    if constraints is None:
+        return None, None
+    if not isinstance(constraints, dict):
+        return None, 'constraints는 객체 형식이어야 합니다.'
+    
+    unknown = [col for col in constraints if col not in score_columns]
+    if unknown:
+        return None, f'알 수 없는 조건 항목입니다: {unknown}'
+    
+    conditions = []
+    for col, bounds in constraints.items():
+        if not isinstance(bounds, dict):
+            bounds = {'min': bounds}
+        low, high = bounds.get('min', 1), bounds.get('max', 5)
+        if (set(bounds) - {'min', 'max'}
+                or any(isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value)
+                       for value in (low, high))):
+            return None, f'{col} 조건은 숫자 또는 {{"min": 숫자, "max": 숫자}} 형식이어야 합니다.'
+        
+        # 공고 점수는 1~5점 정수이므로 정수 범위로 변환
+        low, high = max(1, math.ceil(low)), min(5, math.floor(high))
+        if low > high:
+            return None, f'{col} 조건을 만족하는 점수가 없습니다 (1~5 범위).'
+        if (low, high) != (1, 5):
+            conditions.append((score_columns.index(col), low, high))
+    
+    return tuple(sorted(conditions)) or None, None
+
+@app.route('/recommend/batch', methods=['POST'])
+def recommend_jobs_batch():
+    """
+    여러 구직자의 점수를 한 번에 받아 각각의 유사 채용공고 추천
+    
+    Request Body:
+    {
+        "user_scores_list": [
+            {"성실성": 4, "개방성": 3, ...},
+            {"성실성": 5, "개방성": 2, ...}
+        ],
+        "top_k": 5,  // 선택사항, 기본값 5 (1~MAX_TOP_K)
+        "engine": "kernel",  // 선택사항, 유사도 계산 엔진 (kernel/lattice)
+        "metric": "cosine",  // 선택사항, 유사도 지표 (cosine/euclidean/weighted_cosine/hybrid)
+        "weights": {"기술전문성": 2.0},  // 선택사항, 항목별 가중치 (생략한 항목은 1.0)
+        "filters": {"기관명": ["부산교통공사"], "category": ["technical"]},  // 선택사항, 추천 대상 공고 필터
+        "constraints": {"기술전문성": {"min": 4}, "성실성": 3},  // 선택사항, 공고 점수 조건 (숫자는 최소 점수)
+        "distinct_by": "agency_form",  // 선택사항, 그룹별 최고 공고 하나만 추천 (form/agency_form/agency)
+        "nprobe": 8  // 선택사항, 2단계 추천에서 탐색할 IVF 군집 또는 (기관명, 일반전형) 그룹 수 (0이면 전체 공고)
+    }
+    """
     try:
-        scaler = similarity_model['scaler']
-        normalized_scores = similarity_model['normalized_scores']
-        job_posting_scores = similarity_model['job_posting_scores']
+        snapshot = active_snapshot
+        if snapshot is None:
+            return jsonify({
+                'success': False,
+                'error': '모델이 로딩되지 않았습니다. 서버를 다시 시작해주세요.'
+            }), 500
         
-        # 사용자 점수를 배열로 변환 및 정규화
-        user_score_array = np.array([user_scores.get(col, 3) for col in score_columns])
-        user_score_normalized = scaler.transform([user_score_array])
+        data = request.get_json()
         
-        # 코사인 유사도 계산
-        similarities = cosine_similarity(user_score_normalized, normalized_scores)[0]
+        if not data or not isinstance(data.get('user_scores_list'), list):
+            return jsonify({
+                'success': False,
+                'error': 'user_scores_list(배열)가 필요합니다.'
+            }), 400
         
-        # 상위 k개 추천
-        top_indices = similarities.argsort()[-top_k:][::-1]
+        user_scores_list = data['user_scores_list']
         
-        recommendations = []
-        for rank, idx in enumerate(top_indices, 1):
-            posting = job_posting_scores.iloc[idx]
-            similarity = float(similarities[idx])
-            
-            # 해당 공고의 실제 점수도 포함
-            posting_scores = {}
-            for col in score_columns:
-                posting_scores[col] = int(posting[col])
+        if not user_scores_list:
+            return jsonify({
+                'success': False,
+                'error': 'user_scores_list는 비어 있지 않은 배열이어야 합니다.'
+            }), 400
+        
+        if len(user_scores_list) > MAX_BATCH_SIZE:
+            return jsonify({
+                'success': False,
+                'error': f'한 번에 최대 {MAX_BATCH_SIZE}명까지 요청할 수 있습니다.'
+            }), 400
+        
+        options, error = parse_scoring_options(data)
+        if error:
+            return jsonify({
+                'success': False,
+                'error': error
+            }), 400
+        top_k = options.pop('top_k')
+        
+        # 점수 유효성 검사 (몇 번째 구직자인지 함께 반환)
+        for i, user_scores in enumerate(user_scores_list):
+            error = validate_user_scores(user_scores)
+            if error:
+                return jsonify({
+                    'success': False,
+                    'error': f'[{i}] {error}'
+                }), 400
+        
+        # 일괄 추천 수행
+        top_indices, top_similarities = rank_postings(snapshot, user_scores_list, top_k, **options)
+        
+        # 미리 인코딩된 공고 JSON 조각으로 응답 구성
+        results = []
+        for i, (user_top_indices, user_top_similarities) in enumerate(zip(top_indices, top_similarities)):
+            results.append(b''.join((
+                b'{"index":%d,"recommendations":' % i,
+                snapshot.records.encode(user_top_indices, user_top_similarities),
+                b',"total_count":%d}' % len(user_top_indices)
+            )))
+        
+        body = b''.join((
+            b'{"success":true,"results":[',
+            b','.join(results),
+            b'],"user_count":%d}' % len(results)
+        ))
+        return app.response_class(body, mimetype='application/json')
+        
+    except Exception as e:
+        logger.error(f"❌ 일괄 추천 실패: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+def get_recommendations(user_scores, top_k=5, engine=None, metric=None, weights=None,
+                        filters=None, constraints=None, distinct_by=None, nprobe=None):
+    """
+    실제 추천 로직
+    
+    Args:
+        user_scores (dict): 사용자의 16가지 점수
+        top_k (int): 추천할 공고 수
+        engine (str): 유사도 계산 엔진 (없으면 SCORING_ENGINE 설정값)
+        metric (str): 유사도 지표 (없으면 SIMILARITY_METRIC 설정값)
+        weights (dict): 항목별 가중치 (생략한 항목은 1.0)
+        filters (dict): 추천 대상 공고 필터 (기관명/일반전형/category)
+        constraints (dict): 공고 점수 조건 (항목명 → 최소 점수 또는 {"min", "max"})
+        distinct_by (str): 그룹별 최고 공고 하나만 추천할 기준 (form/agency_form/agency)
+        nprobe (int): 2단계 추천에서 탐색할 그룹 수 (없으면 COARSE_NPROBE 설정값, 0이면 전체 공고)
+    """
+    snapshot = active_snapshot
+    weights, error = parse_weights(weights)
+    filters, filter_error = parse_filters(filters)
+    constraints, constraint_error = parse_constraints(constraints)
+    if error or filter_error or constraint_error:
+        raise ValueError(error or filter_error or constraint_error)
+    if distinct_by is not None and distinct_by not in DISTINCT_MODES:
+        raise ValueError(f'distinct_by는 {list(DISTINCT_MODES)} 중 하나여야 합니다.')
+    top_indices, top_similarities = rank_single(snapshot, user_scores, top_k, engine=engine, metric=metric,
+                                                weights=weights, filters=filters, constraints=constraints,
+                                                distinct_by=distinct_by, nprobe=nprobe)
+    return snapshot.records.build(top_indices, top_similarities)
+
+def get_batch_recommendations(user_scores_list, top_k=5, engine=None, metric=None, weights=None,
+                              filters=None, constraints=None, distinct_by=None, nprobe=None):
+    """
+    일괄 추천 로직
+    
+    Args:
+        user_scores_list (list): 사용자 점수 딕셔너리 리스트
+        top_k (int): 사용자별 추천할 공고 수
+        engine (str): 유사도 계산 엔진 (없으면 SCORING_ENGINE 설정값)
+        metric (str): 유사도 지표 (없으면 SIMILARITY_METRIC 설정값)
+        weights (dict): 항목별 가중치 (생략한 항목은 1.0)
+        filters (dict): 추천 대상 공고 필터 (기관명/일반전형/category)
+        constraints (dict): 공고 점수 조건 (항목명 → 최소 점수 또는 {"min", "max"})
+        distinct_by (str): 그룹별 최고 공고 하나만 추천할 기준 (form/agency_form/agency)
+        nprobe (int): 2단계 추천에서 탐색할 그룹 수 (없으면 COARSE_NPROBE 설정값, 0이면 전체 공고)
+    
+    Returns:
+        list: 사용자별 추천 결과 리스트
+    """
+    snapshot = active_snapshot
+    weights, error = parse_weights(weights)
+    filters, filter_error = parse_filters(filters)
+    constraints, constraint_error = parse_constraints(constraints)
+    if error or filter_error or constraint_error:
+        raise ValueError(error or filter_error or constraint_error)
+    if distinct_by is not None and distinct_by not in DISTINCT_MODES:
+        raise ValueError(f'distinct_by는 {list(DISTINCT_MODES)} 중 하나여야 합니다.')
+    top_indices, top_similarities = rank_postings(snapshot, user_scores_list, top_k, engine=engine, metric=metric,
+                                                  weights=weights, filters=filters, constraints=constraints,
+                                                  distinct_by=distinct_by, nprobe=nprobe)
+    return [
+        snapshot.records.build(user_top_indices, user_top_similarities)
+        for user_top_indices, user_top_similarities in zip(top_indices, top_similarities)
+    ]
+
+def compute_similarities(snapshot, user_score_matrix, engine, metric, weights=None, rows=None, unique=False):
+    """
+    사용자 점수 (N×16)와 공고 간 유사도 (N×P) 계산
+    
+    가중치 없는 코사인은 선택한 엔진(kernel/lattice)으로, 그 외 지표와 가중치가 있는 경우는
+    공고 노름/항목별 제곱을 캐시한 지표 계산기로 계산합니다.
+    lattice 엔진은 정수가 아닌 점수가 섞여 있으면 기본 커널을 사용합니다.
+    rows가 있으면 해당 공고 행만 계산하고 (N×len(rows)),
+    unique가 True이면 고유 점수 프로필에 대해 계산합니다 (N×U).
+    """
+    if metric != 'cosine' or weights is not None:
+        return snapshot.metric_scorer(unique).similarities(user_score_matrix, metric, weights, rows=rows)
+    
+    scorer = snapshot.engine(engine, unique)
+    if not scorer.supports(user_score_matrix):
+        scorer = snapshot.engine('kernel', unique)
+    return scorer.similarities(user_score_matrix, rows=rows)
+
+def rank_postings(snapshot, user_scores_list, top_k=5, engine=None, metric=None, weights=None, filters=None,
+                  constraints=None, distinct_by=None, nprobe=None):
+    """
+    사용자별 상위 공고 행 번호와 유사도 계산
+    
+    캐시에 없는 사용자만 모아 (N×16) 배열로 한 번에 표준화하고, L2 정규화된
+    공고 행렬과의 유사도를 단일 행렬 곱으로 계산합니다.
+    필터/점수 조건이 있으면 필터 인덱스와 점수 비트맵으로 고른 공고 행만 계산하고,
+    조건이 없고 같은 점수 벡터의 공고가 있으면 고유 점수 프로필만 계산한 뒤 공고로 펼칩니다.
+    distinct_by가 있으면 그룹별 최고 공고 중에서 상위 k개를 고릅니다.
+    nprobe가 있으면 (필터/점수 조건/distinct_by가 없을 때) 가까운 군집/그룹의 공고만 계산하는 2단계 추천을 사용합니다.
+    SCORING_SHARDS가 설정되어 있으면 조건 없는 기본 코사인 계산을 샤드별 워커 프로세스로 나누어 계산합니다.
+    
+    Args:
+        snapshot (ModelSnapshot): 요청 처리에 사용할 모델 스냅샷
+        user_scores_list (list): 사용자 점수 딕셔너리 리스트
+        top_k (int): 사용자별 추천할 공고 수
+        engine (str): 유사도 계산 엔진 (없으면 SCORING_ENGINE 설정값)
+        metric (str): 유사도 지표 (없으면 SIMILARITY_METRIC 설정값)
+        weights (tuple): 항목별 가중치 16개 (없으면 가중치 없음)
+        filters (tuple): parse_filters로 변환한 필터 조건 (없으면 전체 공고)
+        constraints (tuple): parse_constraints로 변환한 점수 조건 (없으면 조건 없음)
+        distinct_by (str): 그룹별 중복 제거 기준 (없으면 중복 제거 안 함)
+        nprobe (int): 2단계 추천에서 탐색할 그룹 수 (없으면 COARSE_NPROBE 설정값, 0이면 전체 공고)
+    
+    Returns:
+        tuple: (사용자별 상위 공고 행 번호 리스트, 사용자별 상위 공고 유사도 리스트)
+    """
+    try:
+        # 사용자 점수를 (N×16) 배열로 변환
+        user_score_matrix = np.array([
+            [user_scores.get(col, 3) for col in score_columns]
+            for user_scores in user_scores_list
+        ], dtype=np.float32).reshape(-1, len(score_columns))
+        
+        # 캐시 조회 (모델 버전 + 점수 벡터 + top_k + 계산 옵션)
+        engine = engine or DEFAULT_SCORING_ENGINE
+        metric = metric or DEFAULT_SIMILARITY_METRIC
+        nprobe = DEFAULT_COARSE_NPROBE if nprobe is None else nprobe
+        cache_keys = [
+            RecommendationCache.make_key(snapshot.version, score_vector, top_k, engine, metric, weights, filters,
+                                         constraints, distinct_by, nprobe)
+            for score_vector in user_score_matrix.tolist()
+        ]
+        results = [recommendation_cache.get(key) for key in cache_keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        
+        if missing:
+            # 필터/점수 조건에 맞는 공고 행 선택 (둘 다 없으면 None = 전체 공고)
+            rows = snapshot.score_bitmaps.select(constraints, snapshot.filters.select(filters))
             
-            recommendation = {
-                'rank': rank,
-                'id': int(posting['id']),  # int64를 int로 변환
-                '기관명': posting['기관명'],
-                '일반전형': posting['일반전형'],
-                '유사도': round(similarity, 3),
-                '공고점수': posting_scores
-            }
-            recommendations.append(recommendation)
+            if distinct_by is not None:
+                # 그룹별 최고 공고 (동점이면 id 오름차순) 중 상위 k개
+                similarities = compute_similarities(snapshot, user_score_matrix[missing], engine, metric, weights,
+                                                    rows)
+                top_indices, top_similarities = snapshot.distinct_groups(distinct_by).select(similarities, top_k, rows)
+                if rows is not None:
+                    top_indices = rows[top_indices]
+            elif nprobe and rows is None and nprobe < len(snapshot.coarse_index()):
+                # 2단계 추천: 가까운 군집/그룹 nprobe개의 공고만 정확히 계산 (사용자마다 후보가 다름)
+                top_indices, top_similarities = rank_probed(snapshot, user_score_matrix[missing], top_k,
+                                                            engine, metric, weights, nprobe)
+            elif SCORING_SHARDS > 0 and rows is None and engine == 'kernel' and metric == 'cosine' \
+                    and weights is None:
+                # 샤드별 워커가 공유 메모리 구간의 상위 k개를 계산 → 이어 붙여 상위 k개 병합
+                top_indices, top_similarities = snapshot.sharded_scorer(SCORING_SHARDS).top_k(
+                    user_score_matrix[missing], top_k
+                )
+            elif rows is None and snapshot.profiles is not None:
+                # 고유 점수 프로필 유사도 (M×U) → 상위 프로필을 공고로 펼침 (동점이면 공고 id 오름차순)
+                similarities = compute_similarities(snapshot, user_score_matrix[missing], engine, metric, weights,
+                                                    unique=True)
+                top_indices, top_similarities = snapshot.profiles.top_k(similarities, top_k)
+            else:
+                tie_breaker = snapshot.kernel.posting_info['id']
+                if rows is not None:
+                    tie_breaker = tie_breaker[rows]
+                
+                # 유사도 계산 (M×P) - 사전 계산된 커널/조회표/공고 노름 사용
+                similarities = compute_similarities(snapshot, user_score_matrix[missing], engine, metric, weights,
+                                                    rows)
+                
+                # 사용자별 상위 k개 추천 (동점이면 공고 id 오름차순)
+                top_indices = select_top_k_batch(similarities, top_k, tie_breaker)
+                top_similarities = np.take_along_axis(similarities, top_indices, axis=1)
+                if rows is not None:
+                    # 필터된 행 안의 위치 → 전체 공고 행 번호
+                    top_indices = rows[top_indices]
+            for row, i in enumerate(missing):
+                results[i] = (top_indices[row], top_similarities[row])
+                for values in results[i]:
+                    values.flags.writeable = False
+                recommendation_cache.put(cache_keys[i], results[i])
         
-        return recommendations
+        return [result[0] for result in results], [result[1] for result in results]
         
     except Exception as e:
         logger.error(f"❌ 추천 로직 실패: {e}")
         raise
 
+def rank_probed(snapshot, user_score_matrix, top_k, engine, metric, weights, nprobe):
+    """
+    2단계 추천: 2단계 추천 인덱스로 고른 후보 공고만 정확한 유사도로 계산
+    
+    아티팩트에 IVF 인덱스가 있으면 가까운 군집의 연속 구간을, 없으면 가까운 (기관명, 일반전형) 그룹의 공고를 계산합니다.
+    
+    Args:
+        snapshot (ModelSnapshot): 요청 처리에 사용할 모델 스냅샷
+        user_score_matrix (np.ndarray): 사용자 점수 배열 (N×16)
+        top_k (int): 사용자별 추천할 공고 수
+        engine, metric, weights: compute_similarities 계산 옵션
+        nprobe (int): 사용자별 탐색할 군집/그룹 수
+    
+    Returns:
+        tuple: (사용자별 상위 공고 행 번호 리스트, 사용자별 상위 공고 유사도 리스트)
+    """
+    index = snapshot.coarse_index()
+    if engine == 'kernel' and metric == 'cosine' and weights is None:
+        # 기본 코사인은 인덱스가 직접 계산 (IVF는 군집 구간 복사만으로 후보를 모음)
+        return index.search(user_score_matrix, nprobe, top_k)
+    
+    ids = snapshot.kernel.posting_info['id']
+    top_indices, top_similarities = [], []
+    for user_scores, rows in zip(user_score_matrix, index.probe(user_score_matrix, nprobe)):
+        similarities = compute_similarities(snapshot, user_scores[None, :], engine, metric, weights, rows)
+        user_top = select_top_k_batch(similarities, top_k, ids[rows])
+        top_indices.append(rows[user_top[0]])
+        top_similarities.append(similarities[0, user_top[0]])
+    return top_indices, top_similarities
+
+def rank_single(snapshot, user_scores, top_k=5, **options):
+    """
+    사용자 한 명의 상위 공고 행 번호와 유사도 계산
+    
+    묶음 처리가 켜져 있으면 동시에 들어온 다른 요청과 모아 한 번의 행렬 곱으로 계산합니다.
+    
+    Args:
+        options: rank_postings 계산 옵션 (engine, metric, weights, filters, constraints, distinct_by, nprobe)
+    
+    Returns:
+        tuple: (상위 공고 행 번호 (k,), 상위 공고 유사도 (k,))
+    """
+    if request_coalescer is not None:
+        return request_coalescer.submit((snapshot, user_scores, int(top_k), tuple(sorted(options.items()))))
+    top_indices, top_similarities = rank_postings(snapshot, [user_scores], top_k, **options)
+    return top_indices[0], top_similarities[0]
+
+def _rank_coalesced(items):
+    """묶음 처리기 콜백: (스냅샷, top_k, 계산 옵션)이 같은 요청끼리 모아 rank_postings 호출"""
+    groups = {}
+    for i, (snapshot, _, top_k, options) in enumerate(items):
+        groups.setdefault((id(snapshot), top_k, options), []).append(i)
+    
+    results = [None] * len(items)
+    for positions in groups.values():
+        snapshot, _, top_k, options = items[positions[0]]
+        try:
+            top_indices, top_similarities = rank_postings(
+                snapshot, [items[i][1] for i in positions], top_k, **dict(options)
+            )
+        except Exception as e:
+            # 실패한 묶음의 요청에만 예외 전달
+            for i in positions:
+                results[i] = e
+            continue
+        for i, user_top_indices, user_top_similarities in zip(positions, top_indices, top_similarities):
+            results[i] = (user_top_indices, user_top_similarities)
+    return results
+
+request_coalescer = (
+    RequestCoalescer(_rank_coalesced, window_ms=COALESCE_WINDOW_MS, max_batch_size=COALESCE_MAX_BATCH)
+    if COALESCE_WINDOW_MS > 0 else None
+)
+
 @app.route('/statistics', methods=['GET'])
 def get_statistics():
-    """시스템 통계 정보"""
+    """
+    시스템 통계 정보
+    
+    통계는 모델 로딩 시 한 번 인코딩해 둔 응답을 그대로 반환합니다.
+    ETag는 모델 버전이므로, If-None-Match가 같으면 304를 반환합니다.
+    """
     try:
-        if similarity_model is None:
+        snapshot = active_snapshot
+        if snapshot is None:
             return jsonify({
                 'success': False,
                 'error': '모델이 로딩되지 않았습니다.'
             }), 500
         
-        job_posting_scores = similarity_model['job_posting_scores']
-        
-        # 기본 통계
-        stats = {
-            'total_postings': len(job_posting_scores),
-            'unique_agencies': job_posting_scores['기관명'].nunique(),
-            'unique_forms': job_posting_scores['일반전형'].nunique()
-        }
-        
-        # 전형별 분포
-        form_distribution = job_posting_scores['일반전형'].value_counts().to_dict()
-        
-        # 기관별 분포
-        agency_distribution = job_posting_scores['기관명'].value_counts().to_dict()
-        
-        return jsonify({
-            'success': True,
-            'statistics': stats,
-            'form_distribution': form_distribution,
-            'agency_distribution': agency_distribution
-        })
+        response = app.response_class(snapshot.statistics_body, mimetype='application/json')
+        response.set_etag(f"stats-{snapshot.version}")
+        return response.make_conditional(request)
         
     except Exception as e:
         logger.error(f"❌ 통계 조회 실패: {e}")
@@ -245,14 +820,84 @@ def get_sample_scores():
         'score_columns': score_columns
     })
 
+@app.route('/query_stats', methods=['GET'])
+def get_query_stats():
+    """
+    DB 쿼리 지표 (문장 유형별 횟수, 총/p50/p95/최대 시간, 행 수)
+    
+    지표는 프로세스별이므로 운영 모드에서는 요청을 처리한 워커(pid)의 값입니다.
+    ?limit=N으로 총 실행 시간 상위 N개 유형만 반환합니다.
+    """
+    try:
+        limit = request.args.get('limit', type=int)
+        return jsonify({
+            'success': True,
+            'pid': os.getpid(),
+            'since': datetime.fromtimestamp(query_stats.started_at).isoformat(),
+            'slow_query_ms': DB_SLOW_QUERY_MS,
+            'queries': query_stats.summary(limit)
+        })
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/query_stats/reset', methods=['POST'])
+def reset_query_stats():
+    """DB 쿼리 지표 초기화 (요청을 처리한 워커 프로세스)"""
+    query_stats.reset()
+    return jsonify({
+        'success': True,
+        'pid': os.getpid(),
+        'message': '쿼리 지표를 초기화했습니다.'
+    })
+
 @app.route('/reload_model', methods=['POST'])
 def reload_model():
-    """모델 다시 로딩"""
+    """
+    모델 다시 로딩
+    
+    새 모델은 백그라운드 스레드에서 로딩되며, 완료되는 순간 한 번에 교체됩니다.
+    진행 상태는 GET /health의 reload 항목에서 확인할 수 있습니다.
+    ?wait=true를 지정하면 로딩이 끝날 때까지 기다렸다가 결과를 반환합니다.
+    
+    gunicorn 운영 모드에서는 워커마다 모델을 따로 들고 있으므로, 마스터에 HUP 신호를 보내
+    마스터가 모델을 다시 로딩한 뒤 모든 워커를 새로 fork 하도록 합니다 (wait 미지원).
+    """
     try:
-        if load_similarity_model():
+        if gunicorn_master_pid is not None:
+            os.kill(gunicorn_master_pid, signal.SIGHUP)
+            logger.info(f"🔄 gunicorn 마스터(pid: {gunicorn_master_pid})에 모델 다시 로딩 신호(HUP) 전송")
+            return jsonify({
+                'success': True,
+                'message': 'gunicorn 마스터에 HUP 신호를 보냈습니다. 마스터가 모델을 다시 로딩한 뒤 모든 워커를 교체합니다. '
+                           '진행 상태는 /health의 model.version에서 확인하세요.'
+            }), 202
+        
+        thread = start_model_reload()
+        if thread is None:
+            return jsonify({
+                'success': False,
+                'error': '이미 모델을 다시 로딩하는 중입니다.'
+            }), 409
+        
+        if request.args.get('wait', 'false').lower() not in ['true', '1', 'yes']:
+            return jsonify({
+                'success': True,
+                'message': '모델 다시 로딩을 시작했습니다. 진행 상태는 /health에서 확인하세요.'
+            }), 202
+        
+        thread.join()
+        with reload_lock:
+            succeeded = reload_status['state'] == 'succeeded'
+        
+        if succeeded:
+            snapshot = active_snapshot
             return jsonify({
                 'success': True,
-                'message': '모델이 성공적으로 다시 로딩되었습니다.'
+                'message': '모델이 성공적으로 다시 로딩되었습니다.',
+                'model': snapshot.describe()
             })
         else:
             return jsonify({
@@ -282,9 +927,11 @@ if __name__ == '__main__':
         print("📋 API 엔드포인트:")
         print("   - GET  /health         : 헬스 체크")
         print("   - POST /recommend      : 채용공고 추천")
+        print("   - POST /recommend/batch: 채용공고 일괄 추천")
         print("   - GET  /statistics     : 시스템 통계")
         print("   - GET  /sample_scores  : 샘플 점수")
         print("   - POST /reload_model   : 모델 다시 로딩")
+        print("   - GET  /query_stats    : DB 쿼리 지표")
         print("=" * 50)
         
         app.run(host=host, port=port, debug=False)
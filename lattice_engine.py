@@ -0,0 +1,80 @@
+"""
+정수 격자 조회표 기반 유사도 엔진
+사용자 점수는 16개 항목 각각 1~5점 정수이므로, 표준화된 사용자 점수가 각 공고와의 내적에
+기여하는 값을 (16×5×P) 조회표로 미리 계산해 둘 수 있습니다.
+요청 시에는 표준화나 곱셈 없이 조회표의 16개 행을 더하고, 사용자 노름도 (16×5) 표에서 구합니다.
+"""
+
+import numpy as np
+
+class LatticeEngine:
+    """정수 점수 조회표로 코사인 유사도를 계산하는 엔진"""
+
+    def __init__(self, kernel, min_score=1, max_score=5):
+        """
+        유사도 커널에서 조회표 생성
+
+        Args:
+            kernel: 사전 계산된 유사도 커널 (ScoringKernel)
+            min_score: 최소 점수
+            max_score: 최대 점수
+        """
+        self.min_score = min_score
+        self.max_score = max_score
+        self.num_levels = max_score - min_score + 1
+        self.num_dims = len(kernel.mean)
+        self.posting_info = kernel.posting_info
+
+        # 점수 단계별 표준화 값 (16×5), 커널과 같은 float32 연산으로 계산
+        levels = np.arange(min_score, max_score + 1, dtype=np.float32)
+        standardized = (levels[None, :] - kernel.mean[:, None]) / kernel.scale[:, None]
+
+        # 내적 기여 조회표: 행 (d×5 + v) = 항목 d가 v점일 때 전체 공고와의 내적 기여 (80×P)
+        self.table = np.ascontiguousarray(
+            (standardized[:, :, None] * kernel.postings.T[:, None, :]).reshape(-1, len(kernel)),
+            dtype=np.float32
+        )
+        self.table.flags.writeable = False
+
+        # 사용자 노름 조회표: 항목별 표준화 값의 제곱 (16×5)
+        self.square_table = (standardized.astype(np.float64) ** 2).reshape(-1)
+        self.row_offsets = np.arange(self.num_dims) * self.num_levels
+
+    def __len__(self):
+        return self.table.shape[1]
+
+    def supports(self, user_score_matrix):
+        """모든 점수가 조회표 범위의 정수인지 확인"""
+        user_score_matrix = np.asarray(user_score_matrix)
+        return bool(np.all((user_score_matrix == np.round(user_score_matrix))
+                           & (user_score_matrix >= self.min_score)
+                           & (user_score_matrix <= self.max_score)))
+
+    def similarities(self, user_score_matrix, rows=None):
+        """
+        사용자 점수와 공고 간 코사인 유사도 계산
+
+        Args:
+            user_score_matrix: 사용자 정수 점수 배열 (N×16)
+            rows: 계산할 공고 행 번호 배열 (없으면 전체 공고)
+
+        Returns:
+            np.ndarray: 유사도 행렬 (N×P), rows가 있으면 (N×len(rows))
+        """
+        user_score_matrix = np.asarray(user_score_matrix).reshape(-1, self.num_dims)
+        table_rows = (user_score_matrix.astype(np.intp) - self.min_score) + self.row_offsets
+
+        if rows is None:
+            dot_products = self.table[table_rows[:, 0]].copy()
+            for dim in range(1, self.num_dims):
+                dot_products += self.table[table_rows[:, dim]]
+        else:
+            # 선택된 공고 열만 조회 (N×len(rows))
+            dot_products = self.table[np.ix_(table_rows[:, 0], rows)]
+            for dim in range(1, self.num_dims):
+                dot_products += self.table[np.ix_(table_rows[:, dim], rows)]
+
+        user_norms = np.sqrt(self.square_table[table_rows].sum(axis=1)).astype(np.float32)
+        user_norms[user_norms == 0] = 1.0
+        dot_products /= user_norms[:, None]
+        return dot_products
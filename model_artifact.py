@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+서빙용 모델 아티팩트 모듈
+pickle(similarity_model.pkl) 대신 버전이 붙은 디렉토리에 원시 배열(.npy)과 JSON 매니페스트를 저장합니다.
+서버는 .npy 파일을 mmap_mode로 열기 때문에 pandas/sklearn 없이 즉시 로딩되며,
+배열 데이터는 운영체제 페이지 캐시를 통해 모든 워커 프로세스가 공유합니다.
+
+디렉토리 구성 (models/serving_artifact/):
+    manifest.json     : 포맷 버전, 모델 버전, 점수 컬럼, 스케일러 파라미터, 기관명/일반전형 사전, 공고 통계
+    postings.npy      : 표준화 후 L2 정규화된 공고 행렬 (P×16, float32)
+    scores.npy        : 공고 원점수 (P×16, int8)
+    ids.npy           : 공고 id (P, int64)
+    agency_codes.npy  : 기관명 코드 (P, int32)
+    form_codes.npy    : 일반전형 코드 (P, int32)
+    profile_order.npy    : 고유 점수 프로필, id 순으로 정렬한 공고 행 번호 (P, int64)
+    profile_offsets.npy  : 프로필별 profile_order 구간 경계 (U+1, int64)
+    unique_postings.npy  : 프로필별 정규화 공고 벡터 (U×16, float32)
+    ivf_centroids.npy    : (선택) IVF 군집 중심점 (C×16, float32)
+    ivf_offsets.npy      : (선택) 군집별 ivf_order 구간 경계 (C+1, int64)
+    ivf_order.npy        : (선택) 군집 순 공고 행 번호 (P, int64)
+    ivf_postings.npy     : (선택) 군집 순으로 연속 저장한 정규화 공고 행렬 (P×16, float32)
+    ivf_ids.npy          : (선택) 군집 순 공고 id (P, int64)
+
+기존 pickle 모델 변환: python model_artifact.py --model-dir ./models [--ivf-clusters 1024]
+"""
+
+import os
+import json
+import time
+import shutil
+import pickle
+import argparse
+from datetime import datetime
+import numpy as np
+from scoring_kernel import ScoringKernel
+from posting_records import PostingRecords
+from unique_profiles import UniqueProfiles, group_profiles
+from ivf_index import IVFIndex, train_ivf
+
+ARTIFACT_DIRNAME = 'serving_artifact'
+MANIFEST_FILENAME = 'manifest.json'
+FORMAT_VERSION = 1
+
+ARRAY_FILES = {
+    'postings': ('postings.npy', np.float32),
+    'scores': ('scores.npy', np.int8),
+    'ids': ('ids.npy', np.int64),
+    'agency_codes': ('agency_codes.npy', np.int32),
+    'form_codes': ('form_codes.npy', np.int32)
+}
+
+# 고유 점수 프로필 배열 (길이: profile_order = P, profile_offsets = U+1, unique_postings = U)
+PROFILE_ARRAY_FILES = {
+    'profile_order': ('profile_order.npy', np.int64),
+    'profile_offsets': ('profile_offsets.npy', np.int64),
+    'unique_postings': ('unique_postings.npy', np.float32)
+}
+
+# IVF 인덱스 배열 (ivf_clusters > 0으로 빌드한 경우만, 길이: centroids = C, offsets = C+1, 나머지 = P)
+IVF_ARRAY_FILES = {
+    'ivf_centroids': ('ivf_centroids.npy', np.float32),
+    'ivf_offsets': ('ivf_offsets.npy', np.int64),
+    'ivf_order': ('ivf_order.npy', np.int64),
+    'ivf_postings': ('ivf_postings.npy', np.float32),
+    'ivf_ids': ('ivf_ids.npy', np.int64)
+}
+
+class ModelArtifact:
+    """메모리 매핑으로 연 서빙용 모델 아티팩트"""
+
+    def __init__(self, manifest, arrays):
+        """
+        Args:
+            manifest: manifest.json 내용
+            arrays: 배열 이름 → np.ndarray (읽기 전용 memmap)
+        """
+        self.manifest = manifest
+        self.arrays = arrays
+
+    @property
+    def version(self):
+        return self.manifest['version']
+
+    def __len__(self):
+        return self.manifest['total_postings']
+
+    def build_kernel(self):
+        """유사도 커널 생성 (공고 행렬은 복사 없이 memmap 그대로 사용)"""
+        scaler = self.manifest['scaler']
+        return ScoringKernel(
+            scaler['mean'],
+            scaler['scale'],
+            self.arrays['postings'],
+            {'id': self.arrays['ids']}
+        )
+
+    def build_profiles(self, kernel):
+        """
+        고유 점수 프로필 생성 (프로필 배열이 없는 이전 아티팩트면 None)
+
+        Args:
+            kernel: build_kernel로 만든 공고 단위 커널
+        """
+        if 'profile_order' not in self.arrays:
+            return None
+        return UniqueProfiles(
+            kernel,
+            self.arrays['scores'],
+            self.arrays['profile_order'],
+            self.arrays['profile_offsets'],
+            self.arrays['unique_postings']
+        )
+
+    def build_ivf(self, kernel):
+        """
+        IVF 인덱스 생성 (IVF 없이 빌드한 아티팩트면 None)
+
+        Args:
+            kernel: build_kernel로 만든 공고 단위 커널
+        """
+        if 'ivf_order' not in self.arrays:
+            return None
+        return IVFIndex(
+            kernel,
+            self.arrays['ivf_centroids'],
+            self.arrays['ivf_order'],
+            self.arrays['ivf_offsets'],
+            self.arrays['ivf_postings'],
+            self.arrays['ivf_ids']
+        )
+
+    def build_records(self):
+        """응답용 공고 레코드 생성"""
+        return PostingRecords(
+            ids=self.arrays['ids'],
+            agency_codes=self.arrays['agency_codes'],
+            form_codes=self.arrays['form_codes'],
+            agencies=self.manifest['agencies'],
+            forms=self.manifest['forms'],
+            posting_scores=self.arrays['scores'],
+            score_columns=self.manifest['score_columns']
+        )
+
+def artifact_path(model_dir):
+    """모델 디렉토리 안의 아티팩트 경로"""
+    return os.path.join(model_dir, ARTIFACT_DIRNAME)
+
+def save_model_artifact(model_dir, version, scaler, normalized_scores, job_posting_scores, score_columns,
+                        statistics=None, ivf_clusters=0):
+    """
+    서빙용 아티팩트 저장
+
+    새 디렉토리에 모두 기록한 뒤 이름을 바꿔 교체하므로, 기존 아티팩트를 memmap으로 열고 있는
+    프로세스는 교체 후에도 이전 파일을 그대로 읽을 수 있습니다.
+
+    Args:
+        model_dir: 모델 디렉토리 경로
+        version: 모델 버전
+        scaler: 학습된 StandardScaler
+        normalized_scores: 표준화된 공고 점수 (P×16)
+        job_posting_scores: 채용공고평가점수 DataFrame 또는 컬럼 배열 공고 레코드(PostingRecords)
+        score_columns: 16가지 점수 컬럼명 리스트
+        statistics: /statistics 응답용 공고 통계 (없으면 레코드에서 계산)
+        ivf_clusters: IVF 군집 수 (0이면 IVF 인덱스를 만들지 않음)
+
+    Returns:
+        str: 저장된 아티팩트 디렉토리 경로
+    """
+    kernel = ScoringKernel.from_scaler(scaler, normalized_scores)
+    records = job_posting_scores
+    if not isinstance(records, PostingRecords):
+        records = PostingRecords.from_dataframe(job_posting_scores, score_columns, preload=False)
+    agency_codes, agencies = records.agency_codes, records.agencies
+    form_codes, forms = records.form_codes, records.forms
+
+    arrays = {
+        'postings': kernel.postings,
+        'scores': records.posting_scores,
+        'ids': records.ids,
+        'agency_codes': agency_codes,
+        'form_codes': form_codes
+    }
+
+    # 같은 점수 벡터의 공고를 고유 프로필로 묶음
+    profile_order, profile_offsets = group_profiles(arrays['scores'], arrays['ids'])
+    arrays['profile_order'] = profile_order
+    arrays['profile_offsets'] = profile_offsets
+    arrays['unique_postings'] = kernel.postings[profile_order[profile_offsets[:-1]]]
+    array_files = {**ARRAY_FILES, **PROFILE_ARRAY_FILES}
+
+    # 대규모 공고용 IVF 인덱스 (군집 순 연속 저장)
+    if ivf_clusters:
+        centroids, ivf_order, ivf_offsets = train_ivf(kernel.postings, min(int(ivf_clusters), len(kernel)))
+        arrays['ivf_centroids'] = centroids
+        arrays['ivf_offsets'] = ivf_offsets
+        arrays['ivf_order'] = ivf_order
+        arrays['ivf_postings'] = kernel.postings[ivf_order]
+        arrays['ivf_ids'] = arrays['ids'][ivf_order]
+        array_files.update(IVF_ARRAY_FILES)
+    if statistics is None:
+        statistics = records.statistics()
+
+    manifest = {
+        'format_version': FORMAT_VERSION,
+        'version': version,
+        'created_at': datetime.now().isoformat(),
+        'total_postings': len(records),
+        'score_columns': list(score_columns),
+        'scaler': {
+            'mean': np.asarray(scaler.mean_, dtype=np.float64).tolist(),
+            'scale': np.asarray(scaler.scale_, dtype=np.float64).tolist()
+        },
+        'agencies': agencies,
+        'forms': forms,
+        'statistics': statistics,
+        'unique_profiles': len(profile_offsets) - 1,
+        'ivf_clusters': len(arrays['ivf_centroids']) if 'ivf_centroids' in arrays else 0,
+        'files': {name: filename for name, (filename, _) in array_files.items()}
+    }
+
+    target_dir = artifact_path(model_dir)
+    staging_dir = f"{target_dir}.tmp-{os.getpid()}"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    os.makedirs(staging_dir)
+
+    for name, (filename, dtype) in array_files.items():
+        np.save(os.path.join(staging_dir, filename), np.ascontiguousarray(arrays[name], dtype=dtype))
+    with open(os.path.join(staging_dir, MANIFEST_FILENAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    # 기존 디렉토리는 옆으로 옮긴 뒤 삭제 (열려 있는 memmap은 삭제 후에도 유효)
+    if os.path.exists(target_dir):
+        retired_dir = f"{target_dir}.old-{os.getpid()}"
+        os.rename(target_dir, retired_dir)
+        os.rename(staging_dir, target_dir)
+        shutil.rmtree(retired_dir, ignore_errors=True)
+    else:
+        os.rename(staging_dir, target_dir)
+    return target_dir
+
+def load_model_artifact(model_dir):
+    """
+    아티팩트를 메모리 매핑으로 로딩
+
+    Args:
+        model_dir: 모델 디렉토리 경로
+
+    Returns:
+        ModelArtifact: 로딩된 아티팩트
+
+    Raises:
+        FileNotFoundError: 아티팩트가 없는 경우
+        ValueError: 지원하지 않는 포맷이거나 배열 크기가 맞지 않는 경우
+    """
+    target_dir = artifact_path(model_dir)
+    manifest_path = os.path.join(target_dir, MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        raise FileNotFoundError(f"모델 아티팩트가 존재하지 않습니다: {target_dir}")
+
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 아티팩트 포맷입니다: {manifest.get('format_version')}")
+
+    arrays = {}
+    for name, (filename, dtype) in ARRAY_FILES.items():
+        array = np.load(os.path.join(target_dir, manifest['files'][name]), mmap_mode='r')
+        if array.dtype != dtype or len(array) != manifest['total_postings']:
+            raise ValueError(f"아티팩트 배열이 매니페스트와 맞지 않습니다: {filename}")
+        arrays[name] = array
+
+    # 고유 점수 프로필 (이전 아티팩트에는 없음)
+    if 'unique_profiles' in manifest:
+        num_profiles = manifest['unique_profiles']
+        expected_lengths = {
+            'profile_order': manifest['total_postings'],
+            'profile_offsets': num_profiles + 1,
+            'unique_postings': num_profiles
+        }
+        for name, (filename, dtype) in PROFILE_ARRAY_FILES.items():
+            array = np.load(os.path.join(target_dir, manifest['files'][name]), mmap_mode='r')
+            if array.dtype != dtype or len(array) != expected_lengths[name]:
+                raise ValueError(f"아티팩트 배열이 매니페스트와 맞지 않습니다: {filename}")
+            arrays[name] = array
+
+    # IVF 인덱스 (IVF 군집 수를 지정해 빌드한 경우만)
+    if manifest.get('ivf_clusters'):
+        num_clusters = manifest['ivf_clusters']
+        expected_lengths = {
+            'ivf_centroids': num_clusters,
+            'ivf_offsets': num_clusters + 1,
+            'ivf_order': manifest['total_postings'],
+            'ivf_postings': manifest['total_postings'],
+            'ivf_ids': manifest['total_postings']
+        }
+        for name, (filename, dtype) in IVF_ARRAY_FILES.items():
+            array = np.load(os.path.join(target_dir, manifest['files'][name]), mmap_mode='r')
+            if array.dtype != dtype or len(array) != expected_lengths[name]:
+                raise ValueError(f"아티팩트 배열이 매니페스트와 맞지 않습니다: {filename}")
+            arrays[name] = array
+
+    return ModelArtifact(manifest, arrays)
+
+def convert_pickle_model(model_dir, score_columns=None, ivf_clusters=0):
+    """
+    기존 similarity_model.pkl을 서빙용 아티팩트로 변환
+
+    Args:
+        model_dir: 모델 디렉토리 경로
+        score_columns: 16가지 점수 컬럼명 리스트 (없으면 model_info.json에서 조회)
+        ivf_clusters: IVF 군집 수 (0이면 IVF 인덱스를 만들지 않음)
+
+    Returns:
+        str: 저장된 아티팩트 디렉토리 경로
+    """
+    model_path = os.path.join(model_dir, 'similarity_model.pkl')
+    with open(model_path, 'rb') as f:
+        model = pickle.load(f)
+
+    version = f"mtime-{int(os.path.getmtime(model_path))}"
+    info_path = os.path.join(model_dir, 'model_info.json')
+    if os.path.exists(info_path):
+        with open(info_path, 'r', encoding='utf-8') as f:
+            model_info = json.load(f)
+        version = model_info.get('version', version)
+        score_columns = score_columns or model_info.get('score_columns')
+    if not score_columns:
+        raise ValueError("점수 컬럼 정보가 없습니다. score_columns를 지정하세요.")
+
+    return save_model_artifact(
+        model_dir,
+        version,
+        model['scaler'],
+        model['normalized_scores'],
+        model['job_posting_scores'],
+        score_columns,
+        ivf_clusters=ivf_clusters
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description='pickle 모델을 서빙용 아티팩트로 변환')
+    parser.add_argument('--model-dir', default='./models', help='모델 디렉토리 경로')
+    parser.add_argument('--ivf-clusters', type=int, default=0, help='IVF 군집 수 (0이면 IVF 인덱스 없음)')
+    args = parser.parse_args()
+
+    print(f"🔄 {args.model_dir}/similarity_model.pkl 변환 중...")
+    start_time = time.perf_counter()
+    target_dir = convert_pickle_model(args.model_dir, ivf_clusters=args.ivf_clusters)
+    print(f"✅ 변환 완료: {target_dir} ({time.perf_counter() - start_time:.2f}초)")
+
+    start_time = time.perf_counter()
+    artifact = load_model_artifact(args.model_dir)
+    print(f"⚡ 아티팩트 로딩: 공고 {len(artifact)}개 (고유 점수 프로필 {artifact.manifest['unique_profiles']}개, "
+          f"IVF 군집 {artifact.manifest.get('ivf_clusters', 0)}개), "
+          f"버전 {artifact.version} "
+          f"({(time.perf_counter() - start_time) * 1000:.1f}ms)")
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,10 @@ import os
 import warnings
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.preprocessing import StandardScaler
-from database_manager import DatabaseManager
+from database_manager import DatabaseManager, print_query_stats
+from scoring_kernel import ScoringKernel, KERNEL_FILENAME, posting_info_from_records, select_top_k
+from model_artifact import save_model_artifact
+from posting_records import PostingRecords, missing_rows
 from log_config import get_logger
 warnings.filterwarnings('ignore')
 
@@ -23,7 +26,7 @@ logger = get_logger(__name__, 'model_builder.log')
 class JobRecommendationModelBuilder:
     """채용 공고 유사도 기반 추천 모델 생성 클래스"""
     
-    def __init__(self, data_source='database', api_url='http://mysite.com/recruits', scores_api_url='http://mysite.com/scores', csv_path='./data/all_data.csv'):
+    def __init__(self, data_source='database', api_url='http://mysite.com/recruits', scores_api_url='http://mysite.com/scores', csv_path='./data/all_data.csv', ivf_clusters=0):
         """
         모델 빌더 초기화
         
@@ -32,8 +35,10 @@ class JobRecommendationModelBuilder:
             api_url (str): 채용 데이터 API 엔드포인트 URL (하위 호환성)
             scores_api_url (str): 점수 데이터 API 엔드포인트 URL (하위 호환성)
             csv_path (str): CSV 파일 경로 (data_source가 'csv'일 때 사용)
+            ivf_clusters (int): 서빙용 아티팩트의 IVF 군집 수 (0이면 IVF 인덱스를 만들지 않음)
         """
         self.data_source = data_source
+        self.ivf_clusters = ivf_clusters
         self.api_url = api_url
         self.scores_api_url = scores_api_url
         self.csv_path = csv_path
@@ -42,50 +47,55 @@ class JobRecommendationModelBuilder:
             '인지문제해결', '대인영향력', '자기관리', '적응력', '학습속도', 
             '대인민첩성', '성과민첩성', '자기인식', '자기조절', '공감사회기술'
         ]
-        self.job_posting_scores = None  # 채용공고평가점수 데이터
+        self.posting_records = None  # 채용공고평가점수 컬럼 배열 (id, 기관/전형 코드, int8 점수)
         self.scaler = StandardScaler()  # 점수 정규화를 위한 스케일러
         self.model_info = {}
         
     def load_data_from_database(self):
-        """데이터베이스에서 TMP_채용공고평가점수 테이블 로딩"""
+        """데이터베이스에서 TMP_채용공고평가점수 테이블을 컬럼 배열로 로딩"""
         try:
             print("🗄️ 데이터베이스에서 TMP_채용공고평가점수 데이터 로딩 중...")
             
+            # TMP_채용공고평가점수 테이블 조회
+            from_clause = """
+            FROM TMP_채용공고평가점수
+            WHERE 성실성 IS NOT NULL 
+            AND 개방성 IS NOT NULL 
+            AND 외향성 IS NOT NULL
+            """
+            query = f"""
+            SELECT id, 기관명, 일반전형, {', '.join(self.score_columns)}
+            {from_clause}
+            ORDER BY id
+            """
+            
             with DatabaseManager() as db:
-                # TMP_채용공고평가점수 테이블 조회
-                query = """
-                SELECT id, 기관명, 일반전형,
-                       성실성, 개방성, 외향성, 우호성, 정서안정성, 기술전문성,
-                       인지문제해결, 대인영향력, 자기관리, 적응력, 학습속도,
-                       대인민첩성, 성과민첩성, 자기인식, 자기조절, 공감사회기술
-                FROM TMP_채용공고평가점수
-                WHERE 성실성 IS NOT NULL 
-                AND 개방성 IS NOT NULL 
-                AND 외향성 IS NOT NULL
-                ORDER BY id
-                """
-                
-                result = db.execute_query(query)
-                if not result:
-                    print("❌ TMP_채용공고평가점수 테이블에서 데이터를 찾을 수 없습니다.")
-                    return False
-                
-                # DataFrame으로 변환
-                columns = [
-                    'id', '기관명', '일반전형',
-                    '성실성', '개방성', '외향성', '우호성', '정서안정성', '기술전문성',
-                    '인지문제해결', '대인영향력', '자기관리', '적응력', '학습속도',
-                    '대인민첩성', '성과민첩성', '자기인식', '자기조절', '공감사회기술'
-                ]
-                
-                self.job_posting_scores = pd.DataFrame(result, columns=columns)
-                
-                print(f"✅ 데이터베이스 데이터 로딩 완료: {len(self.job_posting_scores)}개 채용공고")
-                print(f"📊 컬럼: {list(self.job_posting_scores.columns)}")
-                print(f"📋 고유 기관 수: {self.job_posting_scores['기관명'].nunique()}")
-                print(f"📋 고유 전형 수: {self.job_posting_scores['일반전형'].nunique()}")
-                
-                return True
+                # 행 수만큼 배열을 미리 할당하고, 배치마다 id/기관·전형 코드/int8 점수 배열에 바로 복사
+                count_result = db.execute_query(f"SELECT COUNT(*) {from_clause}")
+                columns = db.fetch_columnar(query, [
+                    ('id', np.int64),
+                    ('기관명', 'label'),
+                    ('일반전형', 'label'),
+                    ('scores', np.int8, len(self.score_columns))
+                ], capacity=count_result[0][0] if count_result else None)
+            
+            if not len(columns['id']):
+                print("❌ TMP_채용공고평가점수 테이블에서 데이터를 찾을 수 없습니다.")
+                return False
+            
+            agency_codes, agencies = columns['기관명']
+            form_codes, forms = columns['일반전형']
+            self.posting_records = PostingRecords(
+                columns['id'], agency_codes, form_codes, agencies, forms,
+                columns['scores'], self.score_columns, preload=False
+            )
+            
+            print(f"✅ 데이터베이스 데이터 로딩 완료: {len(self.posting_records)}개 채용공고")
+            print(f"📊 점수 배열: {columns['scores'].shape} int8 ({columns['scores'].nbytes / 2**20:.1f}MiB)")
+            print(f"📋 고유 기관 수: {len(agencies)}")
+            print(f"📋 고유 전형 수: {len(forms)}")
+            
+            return True
                 
         except Exception as e:
             print(f"❌ 데이터베이스 데이터 로딩 실패: {e}")
@@ -149,18 +159,22 @@ class JobRecommendationModelBuilder:
         try:
             print("🔄 유사도 모델 준비 중...")
             
-            if self.job_posting_scores is None:
+            if self.posting_records is None:
                 print("❌ 채용공고평가점수 데이터가 없습니다.")
                 return False
             
-            # 점수 데이터만 추출하여 정규화
-            score_data = self.job_posting_scores[self.score_columns].copy()
-            
-            # 결측값 처리 (평균값으로 대체)
-            score_data = score_data.fillna(score_data.mean())
+            # int8 점수를 float64로 한 번만 변환 (결측값 NULL=0은 컬럼 평균으로 대체)
+            score_data = self.posting_records.posting_scores.astype(np.float64)
+            missing = self.posting_records.posting_scores == 0
+            if missing.any():
+                score_data[missing] = np.nan
+                score_data = np.where(missing, np.nanmean(score_data, axis=0), score_data)
             
-            # 데이터 정규화 (표준화)
-            self.normalized_scores = self.scaler.fit_transform(score_data)
+            # 데이터 정규화 (표준화, transform과 같은 계산을 변환한 배열에 바로 적용)
+            self.scaler.fit(score_data)
+            score_data -= self.scaler.mean_
+            score_data /= self.scaler.scale_
+            self.normalized_scores = score_data
             
             print(f"✅ 유사도 모델 준비 완료: {len(self.normalized_scores)}개 공고 데이터")
             return True
@@ -181,7 +195,7 @@ class JobRecommendationModelBuilder:
             list: 추천 공고일련번호 리스트
         """
         try:
-            if self.job_posting_scores is None or self.normalized_scores is None:
+            if self.posting_records is None or self.normalized_scores is None:
                 print("❌ 모델이 준비되지 않았습니다.")
                 return []
             
@@ -192,16 +206,17 @@ class JobRecommendationModelBuilder:
             # 코사인 유사도 계산
             similarities = cosine_similarity(user_score_normalized, self.normalized_scores)[0]
             
-            # 유사도 순으로 정렬하여 상위 k개 추출
-            top_indices = similarities.argsort()[-top_k:][::-1]
+            # 유사도 순으로 상위 k개 추출 (동점이면 공고 id 오름차순)
+            top_indices = select_top_k(similarities, top_k, self.posting_records.ids)
             
             # 추천 결과 생성
             recommendations = []
             for idx in top_indices:
+                record = self.posting_records[idx]
                 posting_info = {
-                    'id': self.job_posting_scores.iloc[idx]['id'],
-                    '기관명': self.job_posting_scores.iloc[idx]['기관명'],
-                    '일반전형': self.job_posting_scores.iloc[idx]['일반전형'],
+                    'id': record['id'],
+                    '기관명': record['기관명'],
+                    '일반전형': record['일반전형'],
                     '유사도': float(similarities[idx])
                 }
                 recommendations.append(posting_info)
@@ -431,18 +446,22 @@ class JobRecommendationModelBuilder:
         try:
             print("📊 데이터베이스 기반 프로파일 생성 중...")
             
-            if self.job_posting_scores is None:
+            if self.posting_records is None:
                 print("❌ 채용공고평가점수 데이터가 없습니다.")
                 return False
             
             # 기관명 + 일반전형별 평균 점수 계산
-            self.form_profiles = self.job_posting_scores.groupby(['기관명', '일반전형'])[self.score_columns].mean()
+            self.form_profiles = self._group_mean_profiles(self.posting_records)
+            
+            # API /statistics 응답용 공고 통계 (모델과 함께 저장되어 서버에서 다시 계산하지 않음, 분포는 공고 수 내림차순)
+            self.posting_statistics = self.posting_records.statistics()
+            for key in ('form_distribution', 'agency_distribution'):
+                distribution = self.posting_statistics[key]
+                self.posting_statistics[key] = dict(sorted(distribution.items(), key=lambda item: -item[1]))
             
             # 전형별 통계 정보도 생성
             self.form_stats = {
-                'total_postings': len(self.job_posting_scores),
-                'unique_agencies': self.job_posting_scores['기관명'].nunique(),
-                'unique_forms': self.job_posting_scores['일반전형'].nunique(),
+                **self.posting_statistics['statistics'],
                 'agency_form_combinations': len(self.form_profiles)
             }
             
@@ -458,6 +477,35 @@ class JobRecommendationModelBuilder:
             print(f"❌ 데이터베이스 프로파일 생성 실패: {e}")
             return False
     
+    def _group_mean_profiles(self, records):
+        """
+        (기관명, 일반전형) 코드 쌍별 평균 점수 (DataFrame groupby().mean()과 같은 결과, 결측값 0은 평균에서 제외)
+        
+        기관명이나 일반전형이 결측(None 라벨)인 공고는 groupby처럼 그룹에 넣지 않습니다.
+        
+        Returns:
+            DataFrame: (기관명, 일반전형) MultiIndex × 16가지 점수
+        """
+        valid = ~(missing_rows(records.agency_codes, records.agencies) | missing_rows(records.form_codes, records.forms))
+        num_forms = max(len(records.forms), 1)
+        keys, groups = np.unique(records.agency_codes[valid].astype(np.int64) * num_forms + records.form_codes[valid],
+                                 return_inverse=True)
+        groups = groups.reshape(-1)
+        sums = np.empty((len(keys), len(self.score_columns)))
+        counts = np.empty_like(sums)
+        for column in range(len(self.score_columns)):
+            scores = records.posting_scores[valid, column]
+            sums[:, column] = np.bincount(groups, weights=scores, minlength=len(keys))
+            counts[:, column] = np.bincount(groups, weights=scores != 0, minlength=len(keys))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / counts
+        
+        index = pd.MultiIndex.from_arrays([
+            np.array(records.agencies, dtype=object)[keys // num_forms],
+            np.array(records.forms, dtype=object)[keys % num_forms]
+        ], names=['기관명', '일반전형'])
+        return pd.DataFrame(means, index=index, columns=self.score_columns).sort_index()
+    
     def create_legacy_profiles(self):
         """기존 방식: 전형별 평균 프로파일 생성"""
         try:
@@ -505,13 +553,34 @@ class JobRecommendationModelBuilder:
                 similarity_model = {
                     'scaler': self.scaler,
                     'normalized_scores': self.normalized_scores,
-                    'job_posting_scores': self.job_posting_scores
+                    'job_posting_scores': self.posting_records.to_dataframe()
                 }
                 similarity_path = os.path.join(model_dir, 'similarity_model.pkl')
                 with open(similarity_path, 'wb') as f:
                     pickle.dump(similarity_model, f)
                 
-                # 2. 전형 프로파일 저장 (pickle)
+                # 2. 서빙용 사전 계산 커널 저장 (스케일러 파라미터 + L2 정규화 공고 행렬)
+                kernel = ScoringKernel.from_scaler(
+                    self.scaler,
+                    self.normalized_scores,
+                    posting_info_from_records(self.posting_records)
+                )
+                kernel_path = os.path.join(model_dir, KERNEL_FILENAME)
+                kernel.save(kernel_path)
+                
+                # 3. 서빙용 아티팩트 저장 (.npy + manifest.json, API 서버가 메모리 매핑으로 로딩)
+                artifact_dir = save_model_artifact(
+                    model_dir,
+                    self.model_info['version'],
+                    self.scaler,
+                    self.normalized_scores,
+                    self.posting_records,
+                    self.score_columns,
+                    statistics=self.posting_statistics,
+                    ivf_clusters=self.ivf_clusters
+                )
+                
+                # 4. 전형 프로파일 저장 (pickle)
                 profile_path = os.path.join(model_dir, 'form_profiles.pkl')
                 with open(profile_path, 'wb') as f:
                     pickle.dump(self.form_profiles, f)
@@ -519,6 +588,8 @@ class JobRecommendationModelBuilder:
                 print(f"✅ 데이터베이스 모델 저장 완료:")
                 print(f"   📁 디렉토리: {model_dir}")
                 print(f"   🎯 유사도 모델: {similarity_path}")
+                print(f"   ⚡ 유사도 커널: {kernel_path}")
+                print(f"   🗂️ 서빙용 아티팩트: {artifact_dir}")
                 print(f"   📊 전형 프로파일: {profile_path}")
                 
             else:
@@ -577,17 +648,12 @@ def recommend_job_postings(user_scores, model_dir='./models', top_k=5):
     Returns:
         list: 추천 공고일련번호와 유사도 정보
     \"\"\"
-    import pickle
     import numpy as np
-    from sklearn.metrics.pairwise import cosine_similarity
-    
-    # 모델 로딩
-    with open(f'{model_dir}/similarity_model.pkl', 'rb') as f:
-        model = pickle.load(f)
+    from scoring_kernel import load_scoring_kernel, select_top_k
     
-    scaler = model['scaler']
-    normalized_scores = model['normalized_scores']
-    job_posting_scores = model['job_posting_scores']
+    # 사전 계산된 커널 로딩 (sklearn 불필요)
+    kernel = load_scoring_kernel(model_dir)
+    posting_info = kernel.posting_info
     
     score_columns = [
         '성실성', '개방성', '외향성', '우호성', '정서안정성', '기술전문성',
@@ -595,22 +661,21 @@ def recommend_job_postings(user_scores, model_dir='./models', top_k=5):
         '대인민첩성', '성과민첩성', '자기인식', '자기조절', '공감사회기술'
     ]
     
-    # 사용자 점수 정규화
+    # 사용자 점수 배열 변환
     user_score_array = np.array([user_scores.get(col, 3) for col in score_columns])
-    user_score_normalized = scaler.transform([user_score_array])
     
-    # 유사도 계산
-    similarities = cosine_similarity(user_score_normalized, normalized_scores)[0]
+    # 유사도 계산 (표준화 → 행렬 곱 → 노름)
+    similarities = kernel.similarities([user_score_array])[0]
     
-    # 상위 k개 추천
-    top_indices = similarities.argsort()[-top_k:][::-1]
+    # 상위 k개 추천 (동점이면 공고 id 오름차순)
+    top_indices = select_top_k(similarities, top_k, posting_info['id'])
     
     recommendations = []
     for idx in top_indices:
         recommendations.append({
-            'id': job_posting_scores.iloc[idx]['id'],
-            '기관명': job_posting_scores.iloc[idx]['기관명'],
-            '일반전형': job_posting_scores.iloc[idx]['일반전형'],
+            'id': int(posting_info['id'][idx]),
+            '기관명': str(posting_info['기관명'][idx]),
+            '일반전형': str(posting_info['일반전형'][idx]),
             '유사도': float(similarities[idx])
         })
     
@@ -680,6 +745,8 @@ def main():
                         help='CSV 파일 경로 (레거시)')
     parser.add_argument('--output-dir', default='./models',
                         help='모델 저장 디렉토리')
+    parser.add_argument('--ivf-clusters', type=int, default=0,
+                        help='IVF 군집 수 (대규모 공고용, 0이면 IVF 인덱스 없음, 권장: 공고 수의 제곱근 정도)')
     
     args = parser.parse_args()
     
@@ -706,7 +773,8 @@ def main():
         data_source=args.source,
         api_url=args.api_url,
         scores_api_url=args.scores_api_url,
-        csv_path=args.csv_path
+        csv_path=args.csv_path,
+        ivf_clusters=args.ivf_clusters
     )
     
     # 모델 빌드 및 저장
@@ -748,6 +816,8 @@ def main():
         elif args.source == 'api':
             print("💡 API 연결 문제일 수 있습니다. CSV 모드로 시도해보세요:")
             print("   python3 model_builder.py --source csv")
+    
+    print_query_stats()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,282 @@
+"""
+서빙용 모델 스냅샷 모듈
+유사도 커널, 응답용 공고 레코드, 모델 버전을 하나의 불변 객체로 묶어
+API 서버가 참조 한 번의 교체로 모델을 바꿀 수 있게 합니다.
+"""
+
+import os
+import json
+import time
+import pickle
+import threading
+from datetime import datetime
+from scoring_kernel import ScoringKernel, KERNEL_FILENAME, posting_info_from_dataframe
+from posting_records import PostingRecords
+from posting_filters import PostingFilterIndex, ScoreBitmapIndex
+from lattice_engine import LatticeEngine
+from similarity_metrics import MetricScorer
+from unique_profiles import UniqueProfiles, group_profiles
+from distinct_groups import DISTINCT_MODES, PostingGroups, posting_group_ids
+from coarse_index import CoarseIndex
+from ivf_index import IVFIndex
+from sharded_scorer import ShardedScorer
+from model_artifact import load_model_artifact, artifact_path
+from log_config import get_logger
+
+# 로깅 설정
+logger = get_logger(__name__, 'model_snapshot.log')
+
+# 유사도 계산 엔진 ('kernel'은 스냅샷의 기본 커널, 나머지는 처음 사용할 때 커널에서 생성)
+SCORING_ENGINES = {
+    'kernel': None,
+    'lattice': LatticeEngine
+}
+
+class ModelSnapshot:
+    """한 번 생성되면 바뀌지 않는 서빙용 모델 묶음"""
+
+    __slots__ = ('version', 'kernel', 'records', 'filters', 'score_bitmaps', 'profiles', 'source', 'statistics',
+                 'statistics_body', 'model_dir', 'loaded_at', 'load_seconds', '_engines', '_engine_lock')
+
+    def __init__(self, version, kernel, records, source, model_dir,
+                 loaded_at, load_seconds, statistics=None, profiles=None, ivf=None):
+        """
+        스냅샷 생성
+
+        Args:
+            version: 모델 버전
+            kernel: 사전 계산된 유사도 커널 (ScoringKernel)
+            records: 응답용 공고 레코드 (PostingRecords)
+            source: 로딩 경로 ('artifact' 또는 'pickle')
+            model_dir: 모델 디렉토리 경로
+            loaded_at: 로딩 완료 시각 (ISO 형식)
+            load_seconds: 로딩 소요 시간 (초)
+            statistics: 빌드 시 계산된 공고 통계 (없으면 레코드에서 계산)
+            profiles: 빌드 시 계산된 고유 점수 프로필 (UniqueProfiles, 없으면 레코드에서 계산)
+            ivf: 빌드 시 학습된 IVF 인덱스 (IVFIndex, 없으면 form_profiles.pkl 중심점 인덱스 사용)
+        """
+        # 공유 배열이 요청 처리 중 수정되지 않도록 읽기 전용으로 고정
+        kernel.mean.flags.writeable = False
+        kernel.scale.flags.writeable = False
+        kernel.postings.flags.writeable = False
+
+        # /statistics 응답은 모델이 바뀔 때만 달라지므로 로딩 시 한 번만 인코딩
+        if statistics is None:
+            statistics = records.statistics()
+        statistics_body = json.dumps(
+            {'success': True, **statistics}, ensure_ascii=False, sort_keys=True, separators=(',', ':')
+        ).encode('utf-8')
+
+        # 기관명/일반전형/전형 분류 필터 인덱스와 항목별 점수 제약 비트맵
+        filters = PostingFilterIndex(records)
+        score_bitmaps = ScoreBitmapIndex(records.posting_scores)
+
+        # 같은 점수 벡터의 공고 묶음 (중복 벡터가 없으면 사용하지 않음)
+        if profiles is None:
+            profiles = UniqueProfiles(kernel, records.posting_scores,
+                                      *group_profiles(records.posting_scores, kernel.posting_info['id']))
+        if len(profiles) == len(kernel):
+            profiles = None
+        engines = {'kernel': kernel}
+        if profiles is not None:
+            engines['kernel@unique'] = profiles.kernel
+        if ivf is not None:
+            engines['coarse'] = ivf
+
+        for name, value in (('version', version), ('kernel', kernel), ('records', records), ('filters', filters),
+                            ('score_bitmaps', score_bitmaps), ('profiles', profiles),
+                            ('source', source), ('statistics', statistics),
+                            ('statistics_body', statistics_body), ('model_dir', model_dir),
+                            ('loaded_at', loaded_at), ('load_seconds', load_seconds),
+                            ('_engines', engines), ('_engine_lock', threading.Lock())):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ModelSnapshot은 변경할 수 없습니다. 새 스냅샷을 생성하세요.")
+
+    def __len__(self):
+        return len(self.kernel)
+
+    def engine(self, name, unique=False):
+        """
+        유사도 계산 엔진 조회 (처음 요청 시 생성 후 재사용)
+
+        Args:
+            name: 엔진 이름 (SCORING_ENGINES 키)
+            unique: True이면 고유 점수 프로필 (U×16) 기준 엔진
+
+        Raises:
+            ValueError: 지원하지 않는 엔진인 경우
+        """
+        key = f"{name}@unique" if unique else name
+        engine = self._engines.get(key)
+        if engine is not None:
+            return engine
+        if name not in SCORING_ENGINES:
+            raise ValueError(f"지원하지 않는 엔진입니다: {name}")
+
+        kernel = self.profiles.kernel if unique else self.kernel
+        return self._build_once(key, lambda snapshot: SCORING_ENGINES[name](kernel))
+
+    def metric_scorer(self, unique=False):
+        """코사인 외 유사도 지표 계산기 (처음 요청 시 공고 노름을 계산해 재사용)"""
+        key = 'metrics@unique' if unique else 'metrics'
+        scorer = self._engines.get(key)
+        if scorer is not None:
+            return scorer
+        if unique:
+            return self._build_once(key, lambda snapshot: MetricScorer(snapshot.profiles.kernel,
+                                                                       snapshot.profiles.posting_scores))
+        return self._build_once(key, lambda snapshot: MetricScorer(snapshot.kernel, snapshot.records.posting_scores))
+
+    def distinct_groups(self, mode):
+        """
+        distinct_by 기준별 공고 그룹 배치 (처음 요청 시 그룹 순 정렬을 계산해 재사용)
+
+        Args:
+            mode: distinct_by 기준 (DISTINCT_MODES 키)
+
+        Raises:
+            ValueError: 지원하지 않는 기준인 경우
+        """
+        key = f"distinct:{mode}"
+        groups = self._engines.get(key)
+        if groups is not None:
+            return groups
+        if mode not in DISTINCT_MODES:
+            raise ValueError(f"지원하지 않는 distinct_by 기준입니다: {mode}")
+        return self._build_once(key, lambda snapshot: PostingGroups(posting_group_ids(snapshot.records, mode),
+                                                                    snapshot.kernel.posting_info['id']))
+
+    def coarse_index(self):
+        """
+        2단계 추천용 인덱스
+
+        아티팩트에 IVF 인덱스가 있으면 그 인덱스를, 없으면 처음 요청 시 form_profiles.pkl의
+        (기관명, 일반전형) 중심점으로 만든 인덱스를 재사용합니다.
+        """
+        index = self._engines.get('coarse')
+        if index is not None:
+            return index
+        return self._build_once('coarse', lambda snapshot: CoarseIndex.build(snapshot.kernel, snapshot.records,
+                                                                             snapshot.model_dir))
+
+    def sharded_scorer(self, num_shards):
+        """
+        샤딩 유사도 계산기 (처음 요청 시 공고 행렬을 공유 메모리로 복사해 재사용, 워커 풀은 프로세스별로 시작)
+
+        Args:
+            num_shards: 샤드 수 (= 워커 프로세스 수)
+        """
+        key = f"sharded:{num_shards}"
+        scorer = self._engines.get(key)
+        if scorer is not None:
+            return scorer
+        return self._build_once(key, lambda snapshot: ShardedScorer(snapshot.kernel, num_shards))
+
+    def _build_once(self, name, builder):
+        """여러 요청이 동시에 처음 요청해도 한 번만 생성"""
+        with self._engine_lock:
+            if name not in self._engines:
+                self._engines[name] = builder(self)
+            return self._engines[name]
+
+    def describe(self):
+        """헬스 체크용 요약 정보"""
+        return {
+            'version': self.version,
+            'total_postings': len(self),
+            'source': self.source,
+            'loaded_at': self.loaded_at,
+            'load_seconds': round(self.load_seconds, 3),
+            'engines': sorted(self._engines),
+            'unique_profiles': len(self.profiles) if self.profiles is not None else None,
+            'ivf_clusters': len(self._engines['coarse']) if isinstance(self._engines.get('coarse'), IVFIndex) else None,
+            'filters': self.filters.describe()
+        }
+
+def read_model_version(model_dir, fallback):
+    """model_info.json의 버전 조회 (없으면 fallback)"""
+    info_path = os.path.join(model_dir, 'model_info.json')
+    if os.path.exists(info_path):
+        with open(info_path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('version', fallback)
+    return fallback
+
+def load_model_snapshot(model_dir, score_columns):
+    """
+    모델 디렉토리에서 스냅샷 로딩
+
+    서빙용 아티팩트(serving_artifact/)가 있으면 메모리 매핑으로 열고,
+    없으면 이전 방식의 similarity_model.pkl을 읽습니다.
+
+    Args:
+        model_dir: 모델 디렉토리 경로
+        score_columns: 16가지 점수 컬럼명 리스트
+
+    Returns:
+        ModelSnapshot: 로딩된 스냅샷
+
+    Raises:
+        FileNotFoundError: 모델 파일이 없는 경우
+    """
+    start_time = time.perf_counter()
+
+    if os.path.exists(artifact_path(model_dir)):
+        artifact = load_model_artifact(model_dir)
+        if artifact.manifest['score_columns'] != list(score_columns):
+            raise ValueError("아티팩트의 점수 컬럼이 서버 설정과 다릅니다.")
+        kernel = artifact.build_kernel()
+        return ModelSnapshot(
+            version=artifact.version,
+            kernel=kernel,
+            records=artifact.build_records(),
+            source='artifact',
+            model_dir=model_dir,
+            loaded_at=datetime.now().isoformat(),
+            load_seconds=time.perf_counter() - start_time,
+            statistics=artifact.manifest.get('statistics'),
+            profiles=artifact.build_profiles(kernel),
+            ivf=artifact.build_ivf(kernel)
+        )
+
+    model_path = os.path.join(model_dir, 'similarity_model.pkl')
+    if not os.path.exists(model_path):
+        raise FileNotFoundError(f"모델 파일이 존재하지 않습니다: {model_path}")
+
+    logger.warning("⚠️ 서빙용 아티팩트가 없어 pickle 모델을 로딩합니다 (python model_artifact.py 로 변환 권장)")
+    with open(model_path, 'rb') as f:
+        model = pickle.load(f)
+    job_posting_scores = model['job_posting_scores']
+
+    # 사전 계산된 커널 로딩 (없으면 모델에서 생성)
+    kernel_path = os.path.join(model_dir, KERNEL_FILENAME)
+    kernel = None
+    if os.path.exists(kernel_path):
+        kernel = ScoringKernel.load(kernel_path)
+        if len(kernel) != len(job_posting_scores):
+            logger.warning("⚠️ 커널 파일과 모델의 공고 수가 다릅니다. 커널을 다시 생성합니다.")
+            kernel = None
+    if kernel is None:
+        logger.warning(f"⚠️ {KERNEL_FILENAME}이 없어 모델에서 커널을 생성합니다 (model_builder.py 재실행 권장)")
+        kernel = ScoringKernel.from_scaler(
+            model['scaler'],
+            model['normalized_scores'],
+            posting_info_from_dataframe(job_posting_scores)
+        )
+
+    # 응답용 공고 레코드 미리 생성
+    records = PostingRecords.from_dataframe(job_posting_scores, score_columns)
+
+    # 모델 버전 확인 (model_info.json이 없으면 파일 수정 시각 사용)
+    version = read_model_version(model_dir, f"mtime-{int(os.path.getmtime(model_path))}")
+
+    return ModelSnapshot(
+        version=version,
+        kernel=kernel,
+        records=records,
+        source='pickle',
+        model_dir=model_dir,
+        loaded_at=datetime.now().isoformat(),
+        load_seconds=time.perf_counter() - start_time
+    )
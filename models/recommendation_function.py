@@ -1,4 +1,3 @@
-
 def recommend_job_postings(user_scores, model_dir='./models', top_k=5):
     """
     사용자 점수를 받아 유사한 채용공고 추천
@@ -11,17 +10,12 @@ def recommend_job_postings(user_scores, model_dir='./models', top_k=5):
     Returns:
         list: 추천 공고일련번호와 유사도 정보
     """
-    import pickle
     import numpy as np
-    from sklearn.metrics.pairwise import cosine_similarity
+    from scoring_kernel import load_scoring_kernel, select_top_k
     
-    # 모델 로딩
-    with open(f'{model_dir}/similarity_model.pkl', 'rb') as f:
-        model = pickle.load(f)
-    
-    scaler = model['scaler']
-    normalized_scores = model['normalized_scores']
-    job_posting_scores = model['job_posting_scores']
+    # 사전 계산된 커널 로딩 (sklearn 불필요)
+    kernel = load_scoring_kernel(model_dir)
+    posting_info = kernel.posting_info
     
     score_columns = [
         '성실성', '개방성', '외향성', '우호성', '정서안정성', '기술전문성',
@@ -29,22 +23,21 @@ def recommend_job_postings(user_scores, model_dir='./models', top_k=5):
         '대인민첩성', '성과민첩성', '자기인식', '자기조절', '공감사회기술'
     ]
     
-    # 사용자 점수 정규화
+    # 사용자 점수 배열 변환
     user_score_array = np.array([user_scores.get(col, 3) for col in score_columns])
-    user_score_normalized = scaler.transform([user_score_array])
     
-    # 유사도 계산
-    similarities = cosine_similarity(user_score_normalized, normalized_scores)[0]
+    # 유사도 계산 (표준화 → 행렬 곱 → 노름)
+    similarities = kernel.similarities([user_score_array])[0]
     
-    # 상위 k개 추천
-    top_indices = similarities.argsort()[-top_k:][::-1]
+    # 상위 k개 추천 (동점이면 공고 id 오름차순)
+    top_indices = select_top_k(similarities, top_k, posting_info['id'])
     
     recommendations = []
     for idx in top_indices:
         recommendations.append({
-            'id': job_posting_scores.iloc[idx]['id'],
-            '기관명': job_posting_scores.iloc[idx]['기관명'],
-            '일반전형': job_posting_scores.iloc[idx]['일반전형'],
+            'id': int(posting_info['id'][idx]),
+            '기관명': str(posting_info['기관명'][idx]),
+            '일반전형': str(posting_info['일반전형'][idx]),
             '유사도': float(similarities[idx])
         })
     
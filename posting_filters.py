@@ -0,0 +1,172 @@
+"""
+공고 필터 인덱스 모듈
+모델 로딩 시 기관명, 일반전형, 전형 분류(form_categories)별 공고 행 번호 배열과
+항목별 점수 값 비트맵(16×5)을 미리 만들어 두고, 요청 시에는 배열의 합집합/교집합과
+비트맵 AND/OR만 계산해 점수를 매길 행을 고릅니다.
+"""
+
+import numpy as np
+from form_categories import FORM_CATEGORY_KEYWORDS, classify_form
+
+# 요청 필터 필드 (같은 필드 안의 값은 OR, 필드끼리는 AND)
+FILTER_FIELDS = ('기관명', '일반전형', 'category')
+
+def _group_rows(codes, num_labels):
+    """
+    코드별 행 번호 배열 생성
+
+    코드 순으로 한 번 정렬한 배열을 코드별 구간으로 나눈 뷰를 반환하므로 추가 복사가 없습니다.
+
+    Returns:
+        list: 코드 → 오름차순 행 번호 배열
+    """
+    order = np.argsort(codes, kind='stable').astype(np.int64)
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=num_labels))))
+    order.flags.writeable = False
+    return [order[bounds[code]:bounds[code + 1]] for code in range(num_labels)]
+
+class PostingFilterIndex:
+    """기관명/일반전형/전형 분류별 공고 행 번호 인덱스"""
+
+    def __init__(self, records):
+        """
+        응답용 공고 레코드에서 인덱스 생성
+
+        Args:
+            records: 응답용 공고 레코드 (PostingRecords)
+        """
+        self.num_postings = len(records)
+        agency_rows = _group_rows(np.asarray(records.agency_codes), len(records.agencies))
+        form_rows = _group_rows(np.asarray(records.form_codes), len(records.forms))
+
+        # 분류별 행 번호: 전형명 사전만 분류한 뒤 해당 전형 코드에 속한 행을 선택
+        form_categories = [classify_form(form) for form in records.forms]
+        category_rows = {}
+        for category in FORM_CATEGORY_KEYWORDS:
+            in_category = np.array([category in categories for categories in form_categories], dtype=bool)
+            rows = np.flatnonzero(in_category[np.asarray(records.form_codes)]).astype(np.int64)
+            rows.flags.writeable = False
+            category_rows[category] = rows
+
+        self.indexes = {
+            '기관명': dict(zip(records.agencies, agency_rows)),
+            '일반전형': dict(zip(records.forms, form_rows)),
+            'category': category_rows
+        }
+
+    def __len__(self):
+        return self.num_postings
+
+    def rows(self, field, values):
+        """
+        한 필드에서 값 중 하나라도 일치하는 행 번호 (오름차순)
+
+        Args:
+            field: 필터 필드 (FILTER_FIELDS)
+            values: 허용할 값 목록 (사전에 없는 값은 무시)
+        """
+        index = self.indexes[field]
+        groups = [index[value] for value in values if value in index]
+        if not groups:
+            return np.empty(0, dtype=np.int64)
+        if len(groups) == 1:
+            return groups[0]
+        return np.unique(np.concatenate(groups))
+
+    def select(self, filters):
+        """
+        필터 조건을 만족하는 행 번호 계산
+
+        Args:
+            filters: ((필드, (값, ...)), ...) 형태의 필터 조건 (None이면 필터 없음)
+
+        Returns:
+            np.ndarray: 오름차순 행 번호 배열 (필터가 없으면 None)
+        """
+        if not filters:
+            return None
+
+        # 가장 작은 집합의 행만 나머지 집합의 표시 배열로 걸러냄 (정렬 없이 선택된 행 수에 비례)
+        selected = sorted((self.rows(field, values) for field, values in filters), key=len)
+        rows = selected[0]
+        if len(selected) > 1 and len(rows):
+            hits = np.zeros(self.num_postings, dtype=np.uint8)
+            for other in selected[1:]:
+                hits[other] += 1
+            rows = rows[hits[rows] == len(selected) - 1]
+        return rows
+
+    def describe(self):
+        """헬스 체크용 요약 정보 (필드별 인덱스 항목 수)"""
+        return {field: len(index) for field, index in self.indexes.items()}
+
+class ScoreBitmapIndex:
+    """항목별 점수 값 비트맵 인덱스 (16개 항목 × 5개 점수 값)"""
+
+    def __init__(self, posting_scores, min_score=1, max_score=5):
+        """
+        공고 원점수에서 비트맵 생성
+
+        비트맵 (항목 d, 점수 v)의 i번째 비트는 공고 i의 항목 d 점수가 v인지 나타냅니다.
+        64비트 단위로 저장해 AND/OR 한 번에 공고 64개를 처리합니다.
+        범위 밖의 점수는 어느 비트맵에도 포함되지 않아 제약 조건과 일치하지 않습니다.
+
+        Args:
+            posting_scores: 공고 원점수 배열 (P×16)
+            min_score: 최소 점수
+            max_score: 최대 점수
+        """
+        posting_scores = np.asarray(posting_scores)
+        self.num_postings, self.num_dims = posting_scores.shape
+        self.min_score = min_score
+        self.max_score = max_score
+
+        # (16×5×P) 불리언 → (16×5×워드 수) uint64, 워드 경계까지 0으로 채움
+        levels = np.arange(min_score, max_score + 1)
+        matches = posting_scores.T[:, None, :] == levels[None, :, None]
+        packed = np.packbits(matches, axis=2, bitorder='little')
+        num_bytes = -(-packed.shape[2] // 8) * 8
+        padded = np.zeros(packed.shape[:2] + (num_bytes,), dtype=np.uint8)
+        padded[:, :, :packed.shape[2]] = packed
+        self.bitmaps = padded.view(np.uint64)
+        self.bitmaps.flags.writeable = False
+
+    def __len__(self):
+        return self.num_postings
+
+    def mask(self, constraints):
+        """
+        제약 조건을 만족하는 공고 비트맵 계산
+
+        항목별로 허용 점수 값의 비트맵을 OR하고, 항목끼리는 AND합니다.
+
+        Args:
+            constraints: ((항목 번호, 최소 점수, 최대 점수), ...)
+
+        Returns:
+            np.ndarray: 공고별 일치 여부 (P,) bool
+        """
+        combined = None
+        for dim, low, high in constraints:
+            allowed = np.bitwise_or.reduce(self.bitmaps[dim, low - self.min_score:high - self.min_score + 1], axis=0)
+            combined = allowed if combined is None else combined & allowed
+        bits = np.unpackbits(combined.view(np.uint8), count=self.num_postings, bitorder='little')
+        return bits.view(bool)
+
+    def select(self, constraints, rows=None):
+        """
+        제약 조건을 만족하는 행 번호 계산
+
+        Args:
+            constraints: ((항목 번호, 최소 점수, 최대 점수), ...) (None이면 제약 없음)
+            rows: 먼저 선택된 행 번호 배열 (없으면 전체 공고)
+
+        Returns:
+            np.ndarray: 오름차순 행 번호 배열 (제약과 rows가 모두 없으면 None)
+        """
+        if not constraints:
+            return rows
+        matches = self.mask(constraints)
+        if rows is None:
+            return np.flatnonzero(matches)
+        return rows[matches[rows]]
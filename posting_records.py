@@ -0,0 +1,242 @@
+"""
+추천 응답용 공고 레코드 모듈
+공고 메타데이터를 컬럼 배열(id, 기관/전형 코드, 공고점수)로 보관하고,
+응답 레코드(id, 기관명, 일반전형, 공고점수)와 JSON 조각은 공고가 처음 추천될 때 한 번만 만들어 재사용합니다.
+(로딩 시 전체를 만들지 않으므로 메모리에는 배열만 남고, gunicorn 워커로 복사되는 파이썬 객체도 늘지 않습니다.)
+요청 시에는 DataFrame 조회 없이 배열/딕셔너리 인덱싱만으로 응답을 구성합니다.
+"""
+
+import json
+import numpy as np
+
+_SIMILARITY_KEY = ',"유사도":'.encode('utf-8')
+
+def _encode_fragment(values):
+    """딕셔너리를 중괄호 없는 JSON 조각(bytes)으로 인코딩"""
+    return json.dumps(values, ensure_ascii=False, separators=(',', ':'))[1:-1].encode('utf-8')
+
+class PostingRecords:
+    """응답용 공고 레코드 모음"""
+
+    def __init__(self, ids, agency_codes, form_codes, agencies, forms, posting_scores, score_columns,
+                 preload=False):
+        """
+        컬럼 배열로 레코드 생성
+
+        Args:
+            ids: 공고 id 배열 (P,)
+            agency_codes: 기관명 코드 배열 (P,), agencies의 인덱스
+            form_codes: 일반전형 코드 배열 (P,), forms의 인덱스
+            agencies: 기관명 사전 (코드 → 기관명)
+            forms: 일반전형 사전 (코드 → 일반전형)
+            posting_scores: 공고 원점수 배열 (P×16)
+            score_columns: 16가지 점수 컬럼명 리스트
+            preload: 전체 레코드 미리 생성 여부 (기본은 처음 조회될 때 생성)
+        """
+        self.ids = ids
+        self.agency_codes = agency_codes
+        self.form_codes = form_codes
+        self.agencies = list(agencies)
+        self.forms = list(forms)
+        self.posting_scores = posting_scores
+        self.score_columns = list(score_columns)
+
+        # 공고별 (레코드, 앞쪽 JSON 조각, 뒤쪽 JSON 조각)
+        self._entries = {}
+        if preload:
+            for idx in range(len(ids)):
+                self._entry(idx)
+
+    @classmethod
+    def from_dataframe(cls, job_posting_scores, score_columns, preload=False):
+        """
+        채용공고평가점수 DataFrame으로 레코드 생성
+
+        Args:
+            job_posting_scores: 채용공고평가점수 DataFrame
+            score_columns: 16가지 점수 컬럼명 리스트
+            preload: 전체 레코드 미리 생성 여부 (기본은 처음 조회될 때 생성)
+        """
+        agency_codes, agencies = _encode_column(job_posting_scores['기관명'])
+        form_codes, forms = _encode_column(job_posting_scores['일반전형'])
+        return cls(
+            ids=job_posting_scores['id'].to_numpy(dtype=np.int64),
+            agency_codes=agency_codes,
+            form_codes=form_codes,
+            agencies=agencies,
+            forms=forms,
+            posting_scores=job_posting_scores[score_columns].to_numpy(dtype=np.int8),
+            score_columns=score_columns,
+            preload=preload
+        )
+
+    def to_dataframe(self):
+        """
+        채용공고평가점수 DataFrame (id, 기관명, 일반전형, 16가지 점수)
+
+        기관명/일반전형은 사전 코드를 그대로 쓰는 범주형, 점수는 int8이라 원본 행 DataFrame보다 작습니다.
+        None 라벨(결측값)은 범주형의 NaN으로 되돌립니다.
+        """
+        import pandas as pd
+
+        columns = {
+            'id': self.ids,
+            '기관명': _categorical(self.agency_codes, self.agencies),
+            '일반전형': _categorical(self.form_codes, self.forms)
+        }
+        columns.update({col: self.posting_scores[:, i] for i, col in enumerate(self.score_columns)})
+        return pd.DataFrame(columns)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, idx):
+        return self._entry(idx)[0]
+
+    def _entry(self, idx):
+        """공고 하나의 레코드와 JSON 조각 (처음 조회 시 생성)"""
+        entry = self._entries.get(idx)
+        if entry is None:
+            # 응답 필드 순서: rank, id, 기관명, 일반전형, 유사도, 공고점수
+            head = {
+                'id': int(self.ids[idx]),
+                '기관명': self.agencies[self.agency_codes[idx]],
+                '일반전형': self.forms[self.form_codes[idx]]
+            }
+            tail = {'공고점수': dict(zip(self.score_columns, self.posting_scores[idx].tolist()))}
+            entry = ({**head, **tail}, _encode_fragment(head), _encode_fragment(tail))
+            self._entries[idx] = entry
+        return entry
+
+    def statistics(self):
+        """
+        공고 통계 계산 (/statistics 응답 내용)
+
+        Returns:
+            dict: statistics(총 공고/고유 기관/고유 전형 수), form_distribution, agency_distribution
+        """
+        # 결측 라벨(None)은 고유 수/분포에서 제외 (pandas nunique/value_counts와 같음)
+        agency_distribution = _label_counts(self.agency_codes, self.agencies)
+        form_distribution = _label_counts(self.form_codes, self.forms)
+        return {
+            'statistics': {
+                'total_postings': len(self),
+                'unique_agencies': len(agency_distribution),
+                'unique_forms': len(form_distribution)
+            },
+            'form_distribution': form_distribution,
+            'agency_distribution': agency_distribution
+        }
+
+    def build(self, top_indices, top_similarities):
+        """
+        추천 결과 딕셔너리 리스트 생성
+
+        Args:
+            top_indices: 상위 공고 행 번호 (k,)
+            top_similarities: 상위 공고 유사도 (k,)
+
+        Returns:
+            list: rank/유사도가 포함된 추천 결과 리스트
+        """
+        recommendations = []
+        for rank, (idx, similarity) in enumerate(zip(top_indices.tolist(), top_similarities.tolist()), 1):
+            record = self._entry(idx)[0]
+            recommendations.append({
+                'rank': rank,
+                'id': record['id'],
+                '기관명': record['기관명'],
+                '일반전형': record['일반전형'],
+                '유사도': round(similarity, 3),
+                '공고점수': record['공고점수']
+            })
+        return recommendations
+
+    def encode(self, top_indices, top_similarities):
+        """
+        추천 결과를 JSON 배열(bytes)로 직접 인코딩
+
+        Args:
+            top_indices: 상위 공고 행 번호 (k,)
+            top_similarities: 상위 공고 유사도 (k,)
+
+        Returns:
+            bytes: 추천 결과 JSON 배열
+        """
+        items = []
+        for rank, (idx, similarity) in enumerate(zip(top_indices.tolist(), top_similarities.tolist()), 1):
+            _, head_fragment, tail_fragment = self._entry(idx)
+            items.append(b''.join((
+                b'{"rank":%d,' % rank,
+                head_fragment,
+                _SIMILARITY_KEY,
+                repr(round(similarity, 3)).encode('ascii'),
+                b',',
+                tail_fragment,
+                b'}'
+            )))
+        return b'[' + b','.join(items) + b']'
+
+def encode_labels(values):
+    """
+    문자열 배열을 사전 인코딩 (등장 순서 유지)
+
+    Args:
+        values: 문자열 배열 (P,)
+
+    Returns:
+        tuple: (코드 배열 int32 (P,), 사전 리스트)
+    """
+    labels, first_index, codes = np.unique(values, return_index=True, return_inverse=True)
+    order = np.argsort(first_index, kind='stable')
+    remap = np.empty(len(order), dtype=np.int32)
+    remap[order] = np.arange(len(order), dtype=np.int32)
+    return remap[codes.reshape(-1)], labels[order].tolist()
+
+def _encode_column(column):
+    """
+    DataFrame 문자열 컬럼 사전 인코딩 (등장 순서 유지, 결측값은 None 라벨로 두어 응답에서 null)
+
+    Args:
+        column: 기관명/일반전형 Series
+
+    Returns:
+        tuple: (코드 배열 int32 (P,), 사전 리스트)
+    """
+    codes, uniques = column.factorize()
+    codes = codes.astype(np.int32)
+    labels = [str(label) for label in uniques]
+    if (codes < 0).any():
+        codes[codes < 0] = len(labels)
+        labels.append(None)
+    return codes, labels
+
+def missing_rows(codes, labels):
+    """
+    None 라벨(결측값)인 공고 마스크
+
+    Args:
+        codes: 코드 배열 (P,)
+        labels: 사전 리스트
+
+    Returns:
+        np.ndarray: 결측 공고 여부 (P,) bool
+    """
+    if None not in labels:
+        return np.zeros(len(codes), dtype=bool)
+    return np.asarray(codes) == labels.index(None)
+
+def _label_counts(codes, labels):
+    """라벨별 공고 수 (공고가 없는 라벨과 None 라벨 제외)"""
+    counts = np.bincount(codes, minlength=len(labels))
+    return {label: int(count) for label, count in zip(labels, counts) if count and label is not None}
+
+def _categorical(codes, labels):
+    """사전 코드 배열을 범주형으로 변환 (None 라벨은 NaN)"""
+    import pandas as pd
+
+    if None in labels:
+        missing = labels.index(None)
+        codes = np.where(codes == missing, -1, codes - (codes > missing))
+        labels = labels[:missing] + labels[missing + 1:]
+    return pd.Categorical.from_codes(codes, labels)
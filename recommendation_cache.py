@@ -0,0 +1,100 @@
+"""
+추천 결과 캐시 모듈
+(모델 버전, 점수 벡터, top_k)를 키로 추천 결과를 프로세스 메모리에 보관하는 LRU 캐시
+"""
+
+import time
+import threading
+from collections import OrderedDict
+
+class RecommendationCache:
+    """크기 제한과 TTL이 있는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_size=10000, ttl_seconds=3600):
+        """
+        캐시 초기화
+
+        Args:
+            max_size: 최대 보관 항목 수 (0이면 캐시 비활성화)
+            ttl_seconds: 항목 유효 시간 (초, 0이면 만료 없음)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self):
+        return self.max_size > 0
+
+    @staticmethod
+    def make_key(model_version, score_vector, top_k, *options):
+        """
+        캐시 키 생성
+
+        Args:
+            model_version: 모델 버전
+            score_vector: 16가지 점수 시퀀스
+            top_k: 추천 개수
+            options: 결과에 영향을 주는 계산 옵션 (엔진 이름 등, 해시 가능한 값)
+        """
+        return (model_version, tuple(score_vector), int(top_k), *options)
+
+    def get(self, key):
+        """캐시 조회 (없거나 만료되었으면 None)"""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, value = entry
+            if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """캐시 저장 (크기 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """전체 항목 삭제 (모델 교체 시 호출)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """캐시 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 4) if total else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations
+            }
@@ -6,7 +6,7 @@ recommendations 테이블 관련 CRUD 작업 및 데이터 처리
 import json
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from database_manager import DatabaseManager
+from database_manager import DatabaseManager, print_query_stats
 from log_config import get_logger
 
 # 로깅 설정
@@ -307,6 +307,8 @@ def main():
         
     except Exception as e:
         print(f"❌ 테스트 실패: {e}")
+    
+    print_query_stats()
 
 if __name__ == "__main__":
     main()
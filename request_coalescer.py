@@ -0,0 +1,120 @@
+"""
+요청 묶음 처리(마이크로 배칭) 모듈
+짧은 시간 창(window) 안에 동시에 들어온 요청을 모아 한 번에 처리한 뒤,
+각 요청 스레드에 자기 결과를 돌려줍니다.
+"""
+
+import os
+import time
+import queue
+import threading
+from collections import Counter
+from concurrent.futures import Future
+
+class RequestCoalescer:
+    """시간 창/최대 크기 기준으로 요청을 묶어 처리하는 스레드 안전 배처"""
+
+    def __init__(self, process_batch, window_ms=2.0, max_batch_size=64):
+        """
+        묶음 처리기 초기화
+
+        Args:
+            process_batch: 요청 항목 리스트를 받아 같은 순서의 결과 리스트를 반환하는 함수
+                (결과가 예외 객체이면 해당 요청에서 그 예외가 발생)
+            window_ms: 첫 요청 이후 추가 요청을 기다리는 시간 (밀리초)
+            max_batch_size: 한 번에 처리할 최대 요청 수
+        """
+        self.process_batch = process_batch
+        self.window_ms = window_ms
+        self.max_batch_size = max(1, int(max_batch_size))
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+        self._worker_pid = None
+
+        # 지표
+        self.batch_sizes = Counter()
+        self.total_requests = 0
+        self.total_batches = 0
+        self.total_wait_seconds = 0.0
+
+    def submit(self, item, timeout=None):
+        """
+        요청 항목을 묶음 처리 대기열에 넣고 결과를 기다림
+
+        Args:
+            item: process_batch에 전달할 요청 항목
+            timeout: 최대 대기 시간 (초, None이면 무제한)
+
+        Returns:
+            process_batch가 이 항목에 대해 반환한 결과
+
+        Raises:
+            Exception: 묶음 처리 중 발생한 예외
+        """
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((item, future, time.perf_counter()))
+        return future.result(timeout)
+
+    def _ensure_worker(self):
+        """처리 스레드 시작 (fork된 워커 프로세스에서는 새로 시작)"""
+        pid = os.getpid()
+        if self._worker is not None and self._worker_pid == pid and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker_pid == pid and self._worker.is_alive():
+                return
+            if self._worker_pid != pid:
+                self._queue = queue.Queue()
+            self._worker = threading.Thread(target=self._run, name='request-coalescer', daemon=True)
+            self._worker_pid = pid
+            self._worker.start()
+
+    def _run(self):
+        """대기열에서 요청을 모아 묶음 단위로 처리"""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.perf_counter() + self.window_ms / 1000
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._dispatch(batch)
+
+    def _dispatch(self, batch):
+        """묶음 처리 후 요청별 결과 전달"""
+        started = time.perf_counter()
+        with self._lock:
+            self.batch_sizes[len(batch)] += 1
+            self.total_requests += len(batch)
+            self.total_batches += 1
+            self.total_wait_seconds += sum(started - submitted for _, _, submitted in batch)
+
+        try:
+            results = self.process_batch([item for item, _, _ in batch])
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self):
+        """묶음 처리 통계"""
+        with self._lock:
+            return {
+                'window_ms': self.window_ms,
+                'max_batch_size': self.max_batch_size,
+                'total_requests': self.total_requests,
+                'total_batches': self.total_batches,
+                'avg_batch_size': round(self.total_requests / self.total_batches, 2) if self.total_batches else 0.0,
+                'avg_wait_ms': round(self.total_wait_seconds / self.total_requests * 1000, 3) if self.total_requests else 0.0,
+                'batch_size_histogram': {str(size): count for size, count in sorted(self.batch_sizes.items())}
+            }
@@ -25,12 +25,13 @@ echo ""
 # 메뉴 선택
 echo "실행할 작업을 선택하세요:"
 echo "1) 추천 API 서버 실행"
-echo "2) 모델 생성/업데이트"
-echo "3) API 서버 상태 확인"
-echo "4) 종료"
+echo "2) 추천 API 서버 실행 (운영 모드, 멀티 워커)"
+echo "3) 모델 생성/업데이트"
+echo "4) API 서버 상태 확인"
+echo "5) 종료"
 echo ""
 
-read -p "선택 (1-4): " choice
+read -p "선택 (1-5): " choice
 
 case $choice in
     1)
@@ -41,15 +42,23 @@ case $choice in
         python job_recommendation_api.py
         ;;
     2)
+        echo "🌐 추천 API 서버를 운영 모드로 시작합니다..."
+        echo "서버 주소: http://localhost:${API_PORT:-8888}"
+        echo "워커 수: ${API_WORKERS:-$(nproc)}"
+        echo "종료하려면 Ctrl+C를 누르세요."
+        echo ""
+        gunicorn -c gunicorn.conf.py wsgi:app
+        ;;
+    3)
         echo "🤖 유사도 모델을 생성/업데이트합니다..."
         python model_builder.py --source database
         ;;
 
-    3)
+    4)
         echo "🔍 API 서버 상태를 확인합니다..."
         curl -s http://localhost:8888/health | python -m json.tool 2>/dev/null || echo "❌ 서버가 실행되지 않았거나 응답하지 않습니다."
         ;;
-    4)
+    5)
         echo "👋 종료합니다."
         exit 0
         ;;
@@ -0,0 +1,211 @@
+"""
+추천 점수 계산 커널 모듈
+StandardScaler 파라미터(mean_/scale_)와 L2 정규화된 공고 행렬을 미리 계산해 두어,
+요청 시에는 뺄셈 → 나눗셈 → 행렬 곱 → 노름 계산만으로 코사인 유사도를 구합니다.
+서빙 경로에서는 sklearn을 사용하지 않습니다.
+"""
+
+import os
+import pickle
+import numpy as np
+
+KERNEL_FILENAME = 'scoring_kernel.npz'
+POSTING_INFO_PREFIX = 'posting_'
+
+class ScoringKernel:
+    """사전 계산된 코사인 유사도 커널"""
+
+    def __init__(self, mean, scale, postings, posting_info=None):
+        """
+        커널 초기화
+
+        Args:
+            mean: 점수 컬럼별 평균 (StandardScaler.mean_)
+            scale: 점수 컬럼별 표준편차 (StandardScaler.scale_)
+            postings: 표준화 후 행 단위 L2 정규화된 공고 행렬 (P×16)
+            posting_info: 공고 메타데이터 배열 딕셔너리 (id, 기관명, 일반전형)
+        """
+        self.mean = np.ascontiguousarray(mean, dtype=np.float32)
+        self.scale = np.ascontiguousarray(scale, dtype=np.float32)
+        self.postings = np.ascontiguousarray(postings, dtype=np.float32)
+        self.posting_info = posting_info or {}
+
+    @classmethod
+    def from_scaler(cls, scaler, normalized_scores, posting_info=None):
+        """
+        학습된 StandardScaler와 표준화된 공고 점수로 커널 생성
+
+        Args:
+            scaler: 학습된 StandardScaler
+            normalized_scores: 표준화된 공고 점수 (P×16)
+            posting_info: 공고 메타데이터 배열 딕셔너리
+        """
+        normalized_scores = np.asarray(normalized_scores, dtype=np.float64)
+        norms = np.linalg.norm(normalized_scores, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return cls(scaler.mean_, scaler.scale_, normalized_scores / norms, posting_info)
+
+    def __len__(self):
+        return len(self.postings)
+
+    def supports(self, user_score_matrix):
+        """모든 실수 점수를 계산할 수 있으므로 항상 True"""
+        return True
+
+    def standardize(self, user_score_matrix):
+        """사용자 점수 (N×16)를 표준화"""
+        user_score_matrix = np.asarray(user_score_matrix, dtype=np.float32)
+        return (user_score_matrix - self.mean) / self.scale
+
+    def similarities(self, user_score_matrix, rows=None):
+        """
+        사용자 점수와 공고 간 코사인 유사도 계산
+
+        Args:
+            user_score_matrix: 사용자 원점수 배열 (N×16)
+            rows: 계산할 공고 행 번호 배열 (없으면 전체 공고)
+
+        Returns:
+            np.ndarray: 유사도 행렬 (N×P), rows가 있으면 (N×len(rows))
+        """
+        postings = self.postings if rows is None else self.postings[rows]
+        user_standardized = self.standardize(user_score_matrix)
+        user_norms = np.linalg.norm(user_standardized, axis=1, keepdims=True)
+        user_norms[user_norms == 0] = 1.0
+        return (user_standardized @ postings.T) / user_norms
+
+    def save(self, path):
+        """커널을 npz 파일로 저장 (pickle 미사용)"""
+        arrays = {
+            'mean': self.mean,
+            'scale': self.scale,
+            'postings': self.postings
+        }
+        for key, values in self.posting_info.items():
+            arrays[POSTING_INFO_PREFIX + key] = np.asarray(values)
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """npz 파일에서 커널 로딩"""
+        with np.load(path, allow_pickle=False) as data:
+            posting_info = {
+                key[len(POSTING_INFO_PREFIX):]: data[key]
+                for key in data.files if key.startswith(POSTING_INFO_PREFIX)
+            }
+            return cls(data['mean'], data['scale'], data['postings'], posting_info)
+
+def select_top_k(scores, top_k, tie_breaker=None):
+    """
+    상위 k개 인덱스 선택 (argpartition 후 k개만 정렬)
+
+    전체 정렬(O(P log P)) 대신 O(P) 분할로 후보를 고른 뒤 후보만 정렬합니다.
+    유사도가 같으면 tie_breaker(공고 id) 오름차순으로 순서를 고정합니다.
+
+    Args:
+        scores: 유사도 배열 (P,)
+        top_k: 선택할 개수
+        tie_breaker: 동점 처리 기준 배열 (P,), 없으면 행 번호 사용
+
+    Returns:
+        np.ndarray: 유사도 내림차순으로 정렬된 상위 k개 인덱스
+    """
+    scores = np.asarray(scores)
+    num_scores = len(scores)
+    top_k = max(0, min(int(top_k), num_scores))
+    if top_k == 0:
+        return np.empty(0, dtype=np.intp)
+    if tie_breaker is None:
+        tie_breaker = np.arange(num_scores)
+
+    if top_k < num_scores:
+        partitioned = np.argpartition(scores, num_scores - top_k)[num_scores - top_k:]
+        # 경계값과 동점인 공고까지 후보에 포함해야 id 기준 동점 처리가 결정적이 됨
+        threshold = scores[partitioned].min()
+        candidates = np.flatnonzero(scores >= threshold)
+    else:
+        candidates = np.arange(num_scores)
+
+    order = np.lexsort((tie_breaker[candidates], -scores[candidates]))
+    return candidates[order[:top_k]]
+
+def select_top_k_batch(score_matrix, top_k, tie_breaker=None):
+    """
+    사용자별 상위 k개 인덱스 일괄 선택
+
+    Args:
+        score_matrix: 유사도 행렬 (N×P)
+        top_k: 사용자별 선택할 개수
+        tie_breaker: 동점 처리 기준 배열 (P,), 사용자마다 다르면 (N×P)
+
+    Returns:
+        np.ndarray: 사용자별 상위 k개 인덱스 (N×k)
+    """
+    score_matrix = np.asarray(score_matrix)
+    num_users, num_scores = score_matrix.shape
+    top_k = max(0, min(int(top_k), num_scores))
+    if top_k == 0 or num_users == 0:
+        return np.empty((num_users, 0), dtype=np.intp)
+    if tie_breaker is None:
+        tie_breaker = np.arange(num_scores)
+    tie_breaker = np.asarray(tie_breaker)
+    per_user = tie_breaker.ndim == 2
+    if top_k == num_scores:
+        return np.array([select_top_k(scores, top_k, tie_breaker[row] if per_user else tie_breaker)
+                         for row, scores in enumerate(score_matrix)])
+
+    partitioned = np.argpartition(score_matrix, num_scores - top_k, axis=1)[:, num_scores - top_k:]
+    candidate_scores = np.take_along_axis(score_matrix, partitioned, axis=1)
+    if per_user:
+        candidate_ties = np.take_along_axis(tie_breaker, partitioned, axis=1)
+    else:
+        candidate_ties = tie_breaker[partitioned]
+    order = np.lexsort((candidate_ties, -candidate_scores), axis=1)
+    top_indices = np.take_along_axis(partitioned, order, axis=1)
+
+    # 경계값 동점이 후보 밖에도 있는 행만 개별 처리
+    thresholds = candidate_scores.min(axis=1, keepdims=True)
+    tied_rows = np.flatnonzero((score_matrix >= thresholds).sum(axis=1) > top_k)
+    for row in tied_rows:
+        top_indices[row] = select_top_k(score_matrix[row], top_k, tie_breaker[row] if per_user else tie_breaker)
+    return top_indices
+
+def posting_info_from_dataframe(job_posting_scores):
+    """채용공고평가점수 DataFrame에서 커널에 함께 저장할 메타데이터 배열 추출"""
+    return {
+        'id': job_posting_scores['id'].to_numpy(dtype=np.int64),
+        '기관명': job_posting_scores['기관명'].astype(str).to_numpy(dtype=str),
+        '일반전형': job_posting_scores['일반전형'].astype(str).to_numpy(dtype=str)
+    }
+
+def posting_info_from_records(records):
+    """공고 레코드(PostingRecords) 컬럼 배열에서 커널에 함께 저장할 메타데이터 배열 추출"""
+    return {
+        'id': np.asarray(records.ids, dtype=np.int64),
+        '기관명': np.array(records.agencies, dtype=str)[records.agency_codes],
+        '일반전형': np.array(records.forms, dtype=str)[records.form_codes]
+    }
+
+def load_scoring_kernel(model_dir='./models'):
+    """
+    모델 디렉토리에서 커널 로딩
+
+    scoring_kernel.npz가 없는 이전 버전 모델은 similarity_model.pkl에서 커널을 생성합니다.
+
+    Args:
+        model_dir: 모델 디렉토리 경로
+
+    Returns:
+        ScoringKernel: 로딩된 커널
+    """
+    kernel_path = os.path.join(model_dir, KERNEL_FILENAME)
+    if os.path.exists(kernel_path):
+        return ScoringKernel.load(kernel_path)
+
+    with open(os.path.join(model_dir, 'similarity_model.pkl'), 'rb') as f:
+        model = pickle.load(f)
+    return ScoringKernel.from_scaler(
+        model['scaler'],
+        model['normalized_scores'],
+        posting_info_from_dataframe(model['job_posting_scores'])
+    )
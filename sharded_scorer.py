@@ -0,0 +1,151 @@
+"""
+샤딩 유사도 계산 모듈
+공고 행렬을 공유 메모리(multiprocessing.shared_memory)에 한 번 복사하고 연속 구간(샤드)으로 나누어,
+워커 프로세스마다 자기 샤드의 유사도와 상위 k개(argpartition)를 계산합니다.
+조정 프로세스는 샤드별 상위 k개를 이어 붙여 (유사도 내림차순, id 오름차순) 기준으로 다시 상위 k개를 고릅니다.
+
+공고 행렬이 커서 단일 코어 계산으로는 지연 시간 목표를 맞출 수 없을 때 사용합니다 (SCORING_SHARDS).
+워커 풀은 처음 사용할 때 프로세스마다 한 번 시작하므로, gunicorn 워커 수 × 샤드 수가 코어 수를 넘지 않게 설정합니다.
+"""
+
+import os
+import weakref
+import threading
+from multiprocessing import get_context, shared_memory
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from scoring_kernel import select_top_k_batch
+from log_config import get_logger
+
+# 로깅 설정
+logger = get_logger(__name__, 'sharded_scorer.log')
+
+# 워커 프로세스 시작 방식 (스레드가 있는 API 서버에서 fork하지 않도록 기본 spawn)
+DEFAULT_START_METHOD = os.getenv('SHARD_START_METHOD', 'spawn')
+
+# 워커 프로세스에 연결된 공유 메모리 배열 (워커마다 초기화 시 한 번 연결)
+_worker_arrays = {}
+
+def _attach_shared_postings(name, num_postings, num_columns):
+    """워커 초기화: 공유 메모리의 공고 행렬/id를 복사 없이 배열로 연결"""
+    block = shared_memory.SharedMemory(name=name)
+    postings_size = num_postings * num_columns * np.dtype(np.float32).itemsize
+    _worker_arrays['block'] = block
+    _worker_arrays['postings'] = np.ndarray((num_postings, num_columns), dtype=np.float32, buffer=block.buf)
+    _worker_arrays['ids'] = np.ndarray((num_postings,), dtype=np.int64, buffer=block.buf, offset=postings_size)
+
+def _score_shard(start, end, user_standardized, user_norms, top_k):
+    """
+    워커 작업: 한 샤드의 유사도와 사용자별 상위 k개
+
+    Returns:
+        tuple: (전체 공고 행 번호 (N×k), 유사도 (N×k), 공고 id (N×k)), 사용자별 (유사도 내림차순, id 오름차순)
+    """
+    postings = _worker_arrays['postings'][start:end]
+    ids = _worker_arrays['ids'][start:end]
+    similarities = (user_standardized @ postings.T) / user_norms
+    local_top = select_top_k_batch(similarities, top_k, ids)
+    return local_top + start, np.take_along_axis(similarities, local_top, axis=1), ids[local_top]
+
+def _release(block, pools, owner_pid):
+    """스냅샷 교체/프로세스 종료 시 현재 프로세스의 워커 풀 종료, 공유 메모리 해제 (만든 프로세스에서만 unlink)"""
+    # 시작 중인 워커가 해제된 공유 메모리에 연결하지 않도록 풀 종료를 기다림
+    pool = pools.pop(os.getpid(), None)
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+    block.close()
+    if os.getpid() == owner_pid:
+        block.unlink()
+
+class ShardedScorer:
+    """공유 메모리 샤드와 워커 프로세스 풀로 코사인 유사도 상위 k개를 계산"""
+
+    def __init__(self, kernel, num_shards, start_method=None):
+        """
+        Args:
+            kernel: 공고 단위 유사도 커널 (표준화 파라미터, 공고 행렬, id)
+            num_shards: 샤드 수 (= 워커 프로세스 수)
+            start_method: 워커 프로세스 시작 방식 (없으면 SHARD_START_METHOD 설정값)
+        """
+        self.kernel = kernel
+        num_postings, num_columns = kernel.postings.shape
+        self.num_shards = max(1, min(int(num_shards), num_postings))
+        self.start_method = start_method or DEFAULT_START_METHOD
+
+        # 공고 행렬(float32)과 id(int64)를 공유 메모리 한 블록에 복사
+        postings_size = num_postings * num_columns * np.dtype(np.float32).itemsize
+        self._block = shared_memory.SharedMemory(create=True,
+                                                 size=postings_size + num_postings * np.dtype(np.int64).itemsize)
+        np.ndarray((num_postings, num_columns), dtype=np.float32, buffer=self._block.buf)[:] = kernel.postings
+        np.ndarray((num_postings,), dtype=np.int64, buffer=self._block.buf,
+                   offset=postings_size)[:] = kernel.posting_info['id']
+        self._init_args = (self._block.name, num_postings, num_columns)
+
+        # 샤드 경계 (행 수가 최대 1 차이 나도록 균등 분할)
+        self.bounds = np.linspace(0, num_postings, self.num_shards + 1).astype(np.int64)
+
+        # 워커 풀은 프로세스별로 처음 사용할 때 시작 (fork된 프로세스는 새 풀 사용)
+        self._pools = {}
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _release, self._block, self._pools, os.getpid())
+
+    def __len__(self):
+        return len(self.kernel)
+
+    def _pool(self):
+        """현재 프로세스의 워커 풀 (없으면 시작)"""
+        pid = os.getpid()
+        pool = self._pools.get(pid)
+        if pool is not None:
+            return pool
+        with self._lock:
+            if pid not in self._pools:
+                self._pools[pid] = ProcessPoolExecutor(
+                    max_workers=self.num_shards,
+                    mp_context=get_context(self.start_method),
+                    initializer=_attach_shared_postings,
+                    initargs=self._init_args
+                )
+                logger.info(f"🧩 샤드 워커 풀 시작: 샤드 {self.num_shards}개, 공고 {len(self):,}개 ({self.start_method})")
+            return self._pools[pid]
+
+    def warm_up(self):
+        """워커 프로세스를 미리 시작하고 공유 메모리에 연결 (첫 요청 지연 방지)"""
+        self.top_k(np.full((1, self.kernel.postings.shape[1]), 3.0), 1)
+
+    def close(self):
+        """워커 풀 종료와 공유 메모리 해제"""
+        self._finalizer()
+
+    def top_k(self, user_score_matrix, top_k):
+        """
+        샤드별 상위 k개를 계산해 병합
+
+        Args:
+            user_score_matrix: 사용자 원점수 배열 (N×16)
+            top_k: 사용자별 추천할 공고 수
+
+        Returns:
+            tuple: (상위 공고 행 번호 (N×k), 상위 공고 유사도 (N×k)), 동점이면 공고 id 오름차순
+        """
+        user_standardized = self.kernel.standardize(user_score_matrix).reshape(-1, self.kernel.postings.shape[1])
+        user_norms = np.linalg.norm(user_standardized, axis=1, keepdims=True)
+        user_norms[user_norms == 0] = 1.0
+        num_users = len(user_standardized)
+        top_k = max(0, min(int(top_k), len(self)))
+        if top_k == 0 or num_users == 0:
+            return np.empty((num_users, 0), dtype=np.int64), np.empty((num_users, 0), dtype=np.float32)
+
+        pool = self._pool()
+        futures = [
+            pool.submit(_score_shard, int(start), int(end), user_standardized, user_norms, top_k)
+            for start, end in zip(self.bounds[:-1], self.bounds[1:])
+        ]
+        shard_results = [future.result() for future in futures]
+
+        # 샤드별 상위 k개(N×(샤드 수×k))를 이어 붙여 공고 id를 동점 기준으로 다시 상위 k개 선택
+        rows, similarities, ids = (np.concatenate(columns, axis=1) for columns in zip(*shard_results))
+        merged = select_top_k_batch(similarities, top_k, ids)
+        top_indices = np.take_along_axis(rows, merged, axis=1).astype(np.int64)
+        top_similarities = np.take_along_axis(similarities, merged, axis=1).astype(np.float32)
+        return top_indices, top_similarities
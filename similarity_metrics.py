@@ -0,0 +1,142 @@
+"""
+유사도 지표 모듈
+사전 계산된 공고 행렬(표준화 후 L2 정규화)과 공고별 노름/항목별 제곱값을 이용해
+여러 유사도 지표를 (N×P) 일괄 형태로 계산합니다.
+
+지표:
+    cosine          : 코사인 유사도
+    euclidean       : 유클리드 거리 기반 유사도 1 / (1 + 거리)
+    weighted_cosine : 항목별 가중치를 적용한 코사인 유사도 (가중치 없으면 cosine과 동일)
+    hybrid          : 코사인 60% + 유클리드 40% (CHANGES.md v1.0.0 추천 알고리즘)
+
+모든 지표는 항목별 가중치 w (16,)를 받으며, 표준화된 점수 공간에 대각 가중치를 적용한 것과 같습니다.
+"""
+
+import numpy as np
+
+# hybrid 지표 가중치
+HYBRID_COSINE_WEIGHT = 0.6
+HYBRID_EUCLIDEAN_WEIGHT = 0.4
+
+class MetricScorer:
+    """공고별 노름을 캐시해 두고 지표별 유사도를 계산하는 계산기"""
+
+    def __init__(self, kernel, posting_scores):
+        """
+        유사도 커널과 공고 원점수로 계산기 생성
+
+        Args:
+            kernel: 사전 계산된 유사도 커널 (ScoringKernel)
+            posting_scores: 공고 원점수 배열 (P×16)
+        """
+        self.kernel = kernel
+        self.postings = kernel.postings
+        standardized = kernel.standardize(posting_scores)
+
+        # 표준화된 공고 벡터의 항목별 제곱 (P×16) 과 L2 노름 (P,)
+        self.posting_squares = np.ascontiguousarray(standardized ** 2, dtype=np.float32)
+        self.posting_norms = np.sqrt(self.posting_squares.sum(axis=1))
+        self.posting_squares.flags.writeable = False
+        self.posting_norms.flags.writeable = False
+
+    def __len__(self):
+        return len(self.posting_norms)
+
+    def subset(self, rows):
+        """선택된 공고 행만 담은 계산기 (공고 행렬/노름/항목별 제곱을 행 번호로 추출)"""
+        scorer = object.__new__(MetricScorer)
+        scorer.kernel = self.kernel
+        scorer.postings = self.postings[rows]
+        scorer.posting_squares = self.posting_squares[rows]
+        scorer.posting_norms = self.posting_norms[rows]
+        return scorer
+
+    def similarities(self, user_score_matrix, metric='cosine', weights=None, rows=None):
+        """
+        사용자 점수와 공고 간 유사도 계산
+
+        Args:
+            user_score_matrix: 사용자 원점수 배열 (N×16)
+            metric: 유사도 지표 이름 (METRICS 키)
+            weights: 항목별 가중치 (16,), 없으면 가중치 없음
+            rows: 계산할 공고 행 번호 배열 (없으면 전체 공고)
+
+        Returns:
+            np.ndarray: 유사도 행렬 (N×P), rows가 있으면 (N×len(rows))
+
+        Raises:
+            ValueError: 지원하지 않는 지표인 경우
+        """
+        if metric not in METRICS:
+            raise ValueError(f"지원하지 않는 유사도 지표입니다: {metric}")
+        scorer = self if rows is None else self.subset(rows)
+        user_standardized = self.kernel.standardize(user_score_matrix).reshape(-1, len(self.kernel.mean))
+        return METRICS[metric](scorer, user_standardized, weights)
+
+def _norms(matrix):
+    """행별 L2 노름 (0이면 1로 대체)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return norms
+
+def _cross_terms(scorer, user_standardized, weights):
+    """
+    가중 내적과 제곱 노름 계산 (가중치 w가 없으면 w = 1)
+
+    공고 행렬은 복사하지 않고, 사용자 벡터에만 w²를 곱해 정규화 공고 행렬과 곱한 뒤 공고 노름을 곱합니다.
+    공고 쪽 가중 제곱 노름은 미리 계산된 항목별 제곱 (P×16) 과 w²의 곱입니다.
+
+    Returns:
+        tuple: (Σ w²·z·x (N×P), ‖w∘z‖² (N×1), ‖w∘x‖² (P,))
+    """
+    if weights is None:
+        cross = (user_standardized @ scorer.postings.T) * scorer.posting_norms
+        user_squares = (user_standardized ** 2).sum(axis=1, keepdims=True)
+        return cross, user_squares, scorer.posting_norms ** 2
+
+    squared_weights = np.asarray(weights, dtype=np.float32) ** 2
+    cross = ((user_standardized * squared_weights) @ scorer.postings.T) * scorer.posting_norms
+    user_squares = ((user_standardized ** 2) @ squared_weights)[:, None]
+    return cross, user_squares, scorer.posting_squares @ squared_weights
+
+def _cosine_from_terms(cross, user_squares, posting_squares):
+    """가중 내적/제곱 노름 → 코사인 유사도"""
+    user_norms = np.sqrt(user_squares)
+    user_norms[user_norms == 0] = 1.0
+    posting_norms = np.sqrt(posting_squares)
+    posting_norms[posting_norms == 0] = 1.0
+    return cross / user_norms / posting_norms
+
+def _euclidean_from_terms(cross, user_squares, posting_squares):
+    """가중 내적/제곱 노름 → 1 / (1 + 유클리드 거리), ‖z - x‖² = ‖z‖² + ‖x‖² - 2 z·x"""
+    return 1.0 / (1.0 + np.sqrt(np.maximum(user_squares + posting_squares - 2 * cross, 0)))
+
+def cosine(scorer, user_standardized, weights=None):
+    """
+    코사인 유사도 (N×P)
+
+    가중치가 있으면 양쪽 벡터를 대각 가중치로 조정한 (w∘z)·(w∘x) / (‖w∘z‖ · ‖w∘x‖) 를 계산합니다.
+    """
+    if weights is None:
+        # 가중치가 없으면 정규화 공고 행렬과의 곱만으로 계산
+        return (user_standardized @ scorer.postings.T) / _norms(user_standardized)
+    return _cosine_from_terms(*_cross_terms(scorer, user_standardized, weights))
+
+def euclidean(scorer, user_standardized, weights=None):
+    """유클리드 거리 기반 유사도 (N×P), 가중치가 있으면 ‖w∘(z - x)‖ 사용"""
+    return _euclidean_from_terms(*_cross_terms(scorer, user_standardized, weights))
+
+def hybrid(scorer, user_standardized, weights=None):
+    """코사인 60% + 유클리드 40% (N×P), 행렬 곱은 한 번만 수행"""
+    terms = _cross_terms(scorer, user_standardized, weights)
+    return (HYBRID_COSINE_WEIGHT * _cosine_from_terms(*terms)
+            + HYBRID_EUCLIDEAN_WEIGHT * _euclidean_from_terms(*terms))
+
+# 지표 이름 → 일괄 계산 함수 (scorer, 표준화된 사용자 점수 (N×16), 가중치) → (N×P)
+# weighted_cosine은 가중치를 적용한 cosine과 같음 (가중치가 없으면 cosine)
+METRICS = {
+    'cosine': cosine,
+    'euclidean': euclidean,
+    'weighted_cosine': cosine,
+    'hybrid': hybrid
+}
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+2단계 추천 (중심점 인덱스) 재현율/지연 시간 벤치마크
+전체 공고 계산(exhaustive) 대비 nprobe별 recall@k와 사용자 1명당 계산 시간을 비교합니다.
+
+- 현재 모델: models/ 의 스냅샷과 form_profiles.pkl 사용 (있는 경우)
+- 합성 데이터: 점수 테이블 생성 방식처럼 (기관명, 일반전형) 그룹별 기준 점수 ± 1 변동으로 만든 대규모 공고
+
+실행: python test/benchmark_coarse_index.py [--postings 1000000]
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import ScoringKernel, select_top_k_batch
+from posting_records import PostingRecords
+from coarse_index import CoarseIndex
+
+TOP_K = 5
+NPROBES = [1, 2, 4, 8, 16, 32, 64]
+SCORE_COLUMNS = [
+    '성실성', '개방성', '외향성', '우호성', '정서안정성', '기술전문성',
+    '인지문제해결', '대인영향력', '자기관리', '적응력', '학습속도',
+    '대인민첩성', '성과민첩성', '자기인식', '자기조절', '공감사회기술'
+]
+
+def build_synthetic(num_postings, num_agencies=5, num_forms=28, seed=42):
+    """그룹별 기준 점수 ± 1 변동 공고 (그룹 크기는 감마 분포)"""
+    rng = np.random.default_rng(seed)
+    num_groups = num_agencies * num_forms
+    baselines = rng.integers(1, 6, size=(num_groups, 16))
+    group_sizes = rng.gamma(2.0, size=num_groups)
+    groups = rng.choice(num_groups, size=num_postings, p=group_sizes / group_sizes.sum())
+    posting_scores = np.clip(baselines[groups] + rng.integers(-1, 2, size=(num_postings, 16)), 1, 5)
+
+    ids = np.arange(1, num_postings + 1, dtype=np.int64)
+    scaler = StandardScaler()
+    kernel = ScoringKernel.from_scaler(scaler, scaler.fit_transform(posting_scores), {'id': ids})
+    records = PostingRecords(
+        ids,
+        (groups // num_forms).astype(np.int32),
+        (groups % num_forms).astype(np.int32),
+        [f'기관{i}' for i in range(num_agencies)],
+        [f'전형{i}' for i in range(num_forms)],
+        posting_scores.astype(np.int8),
+        SCORE_COLUMNS,
+        preload=False
+    )
+    return kernel, records
+
+def evaluate(name, kernel, records, model_dir=None, num_users=300):
+    """nprobe별 recall@k, 평균 후보 비율, 사용자당 계산 시간 출력"""
+    index = CoarseIndex.build(kernel, records, model_dir)
+    ids = kernel.posting_info['id']
+    user_scores = np.random.default_rng(7).integers(1, 6, size=(num_users, 16))
+
+    start = time.perf_counter()
+    exact = select_top_k_batch(kernel.similarities(user_scores), TOP_K, ids)
+    exhaustive_ms = (time.perf_counter() - start) / num_users * 1000
+
+    # 사용자 1명씩 계산 (단건 /recommend와 같은 형태)
+    sample = user_scores[:50]
+    start = time.perf_counter()
+    for user in sample:
+        select_top_k_batch(kernel.similarities(user[None, :]), TOP_K, ids)
+    single_ms = (time.perf_counter() - start) / len(sample) * 1000
+
+    print(f"\n📦 {name}: 공고 {len(records):,}개, 그룹 {len(index)}개")
+    print(f"   전체 계산: 일괄 {exhaustive_ms:.3f}ms/명, 단건 {single_ms:.3f}ms/명")
+    print(f"   {'nprobe':>6} | {'recall@5':>8} | {'후보 비율':>8} | {'단건(ms)':>8} | {'속도':>6}")
+
+    for nprobe in NPROBES:
+        if nprobe >= len(index):
+            break
+        candidates = index.probe(user_scores, nprobe)
+        hits = 0
+        for user_exact, rows, user in zip(exact, candidates, user_scores):
+            similarities = kernel.similarities(user[None, :], rows=rows)
+            probed = rows[select_top_k_batch(similarities, TOP_K, ids[rows])[0]]
+            hits += len(np.intersect1d(user_exact, probed))
+        recall = hits / (TOP_K * num_users)
+        coverage = np.mean([len(rows) for rows in candidates]) / len(records)
+
+        start = time.perf_counter()
+        for user in sample:
+            rows = index.probe(user[None, :], nprobe)[0]
+            select_top_k_batch(kernel.similarities(user[None, :], rows=rows), TOP_K, ids[rows])
+        probed_ms = (time.perf_counter() - start) / len(sample) * 1000
+        print(f"   {nprobe:>6} | {recall:>8.3f} | {coverage:>7.1%} | {probed_ms:>8.3f} | {single_ms / probed_ms:>5.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description='2단계 추천 재현율/지연 시간 벤치마크')
+    parser.add_argument('--postings', type=int, default=1_000_000, help='합성 공고 수')
+    parser.add_argument('--model-dir', default='./models', help='현재 모델 디렉토리')
+    args = parser.parse_args()
+
+    print("⏱️ 2단계 추천 (form_profiles 중심점 → 그룹 내 정확 계산) 벤치마크")
+    print("=" * 60)
+
+    if os.path.exists(args.model_dir):
+        from model_snapshot import load_model_snapshot
+        snapshot = load_model_snapshot(args.model_dir, SCORE_COLUMNS)
+        evaluate('현재 모델', snapshot.kernel, snapshot.records, args.model_dir)
+
+    kernel, records = build_synthetic(args.postings)
+    evaluate('합성 데이터', kernel, records, num_users=100)
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
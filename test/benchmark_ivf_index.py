@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+IVF 인덱스 재현율/지연 시간 벤치마크
+전체 공고 계산(exhaustive) 대비 nprobe별 recall@k와 사용자 1명당 계산 시간을 비교합니다.
+
+합성 공고는 JobPostingScoreGenerator 규칙으로 만듭니다.
+- 전형명: 전형 분류 키워드를 조합한 이름 (analyze_form_characteristics가 분류별 가중치 적용)
+- 전형별 기준 점수: generate_baseline_scores_by_form
+- 공고별 점수: generate_score_with_variation과 같은 규칙 (기준 점수 ± max(1, int(기준 × 0.3)), 1~5로 제한)을 벡터화
+
+실행: python test/benchmark_ivf_index.py [--postings 1000000] [--clusters 1024]
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, 'db'))
+from scoring_kernel import ScoringKernel, select_top_k_batch
+from form_categories import FORM_CATEGORY_KEYWORDS
+from ivf_index import IVFIndex, train_ivf
+from create_job_posting_scores_table import JobPostingScoreGenerator
+
+TOP_K = 5
+NPROBES = [1, 2, 4, 8, 16, 32, 64, 128]
+
+def build_generator():
+    """DB 연결 없이 점수 생성 규칙만 사용하는 생성기"""
+    generator = JobPostingScoreGenerator.__new__(JobPostingScoreGenerator)
+    generator.score_columns = [
+        '성실성', '개방성', '외향성', '우호성', '정서안정성', '기술전문성',
+        '인지문제해결', '대인영향력', '자기관리', '적응력', '학습속도',
+        '대인민첩성', '성과민첩성', '자기인식', '자기조절', '공감사회기술'
+    ]
+    return generator
+
+def build_synthetic(num_postings, num_forms=300, seed=42):
+    """전형 분류 키워드 조합 전형명 → 전형별 기준 점수 → 공고별 변동 점수"""
+    rng = np.random.default_rng(seed)
+    generator = build_generator()
+
+    keywords = [keyword for category_keywords in FORM_CATEGORY_KEYWORDS.values() for keyword in category_keywords]
+    forms = sorted({f"{rng.choice(keywords)}{rng.choice(keywords)}직" for _ in range(num_forms * 2)})[:num_forms]
+    baseline_scores = generator.generate_baseline_scores_by_form(pd.DataFrame({'일반전형': forms}))
+    baselines = np.array([[baseline_scores[form][col] for col in generator.score_columns] for form in forms])
+
+    # 전형별 공고 수는 감마 분포, 공고 점수는 generate_score_with_variation 규칙
+    form_sizes = rng.gamma(2.0, size=len(forms))
+    posting_forms = rng.choice(len(forms), size=num_postings, p=form_sizes / form_sizes.sum())
+    base = baselines[posting_forms]
+    max_variation = np.maximum(1, (base * 0.3).astype(int))
+    variation = np.floor(rng.random(base.shape) * (2 * max_variation + 1)).astype(int) - max_variation
+    posting_scores = np.clip(base + variation, 1, 5)
+
+    scaler = StandardScaler()
+    ids = np.arange(1, num_postings + 1, dtype=np.int64)
+    return ScoringKernel.from_scaler(scaler, scaler.fit_transform(posting_scores), {'id': ids}), len(forms)
+
+def main():
+    parser = argparse.ArgumentParser(description='IVF 인덱스 재현율/지연 시간 벤치마크')
+    parser.add_argument('--postings', type=int, default=1_000_000, help='합성 공고 수')
+    parser.add_argument('--clusters', type=int, default=1024, help='IVF 군집 수')
+    parser.add_argument('--users', type=int, default=200, help='재현율 측정 사용자 수')
+    args = parser.parse_args()
+
+    print("⏱️ IVF 인덱스 (구면 k-means → 가까운 군집 구간만 계산) 벤치마크")
+    print("=" * 60)
+
+    kernel, num_forms = build_synthetic(args.postings)
+    ids = kernel.posting_info['id']
+
+    start = time.perf_counter()
+    centroids, order, offsets = train_ivf(kernel.postings, args.clusters)
+    index = IVFIndex(kernel, centroids, order, offsets)
+    build_seconds = time.perf_counter() - start
+    sizes = index.sizes
+    print(f"📦 공고 {len(kernel):,}개 (전형 {num_forms}개), 군집 {len(index)}개 "
+          f"(크기 중앙값 {int(np.median(sizes))}, 최대 {sizes.max()}), 빌드 {build_seconds:.1f}초")
+
+    user_scores = np.random.default_rng(7).integers(1, 6, size=(args.users, 16))
+    # 전체 계산 기준 결과 (유사도 행렬 메모리 제한을 위해 50명씩)
+    exact = np.concatenate([
+        select_top_k_batch(kernel.similarities(user_scores[start:start + 50]), TOP_K, ids)
+        for start in range(0, len(user_scores), 50)
+    ])
+
+    # 사용자 1명씩 계산 (단건 /recommend와 같은 형태)
+    sample = user_scores[:50]
+    start = time.perf_counter()
+    for user in sample:
+        select_top_k_batch(kernel.similarities(user[None, :]), TOP_K, ids)
+    single_ms = (time.perf_counter() - start) / len(sample) * 1000
+    print(f"   전체 계산: 단건 {single_ms:.3f}ms/명")
+    print(f"   {'nprobe':>6} | {'recall@5':>8} | {'후보 비율':>8} | {'단건(ms)':>8} | {'속도':>6}")
+
+    for nprobe in NPROBES:
+        if nprobe >= len(index):
+            break
+        top_indices, _ = index.search(user_scores, nprobe, TOP_K)
+        hits = sum(len(np.intersect1d(user_exact, rows)) for user_exact, rows in zip(exact, top_indices))
+        recall = hits / (TOP_K * len(user_scores))
+        coverage = np.mean([len(rows) for rows in index.probe(user_scores, nprobe)]) / len(kernel)
+
+        start = time.perf_counter()
+        for user in sample:
+            index.search(user[None, :], nprobe, TOP_K)
+        probed_ms = (time.perf_counter() - start) / len(sample) * 1000
+        print(f"   {nprobe:>6} | {recall:>8.3f} | {coverage:>7.1%} | {probed_ms:>8.3f} | {single_ms / probed_ms:>5.1f}x")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+유사도 계산 엔진 벤치마크
+기존 sklearn 경로(StandardScaler.transform + cosine_similarity), 사전 계산 커널,
+정수 격자 조회표 엔진을 공고 수/사용자 수별로 비교합니다.
+
+실행: python test/benchmark_lattice_engine.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+from sklearn.metrics.pairwise import cosine_similarity
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import ScoringKernel
+from lattice_engine import LatticeEngine
+
+def measure(func, repeat):
+    """평균 실행 시간 (ms)"""
+    func()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    print("⏱️ 유사도 계산 엔진 벤치마크 (sklearn vs kernel vs lattice)")
+    print("=" * 78)
+    print(f"{'공고 수':>10} | {'사용자':>6} | {'sklearn(ms)':>11} | {'kernel(ms)':>10} | {'lattice(ms)':>11} | {'sklearn 대비':>10}")
+    print("-" * 78)
+
+    rng = np.random.default_rng(42)
+    for num_postings in [430, 10_000, 100_000]:
+        posting_scores = rng.integers(1, 6, size=(num_postings, 16))
+        scaler = StandardScaler()
+        normalized_scores = scaler.fit_transform(posting_scores)
+        kernel = ScoringKernel.from_scaler(scaler, normalized_scores)
+        engine = LatticeEngine(kernel)
+
+        for num_users in [1, 64]:
+            user_scores = rng.integers(1, 6, size=(num_users, 16))
+            repeat = max(5, 2_000_000 // (num_postings * num_users))
+
+            sklearn_ms = measure(lambda: cosine_similarity(scaler.transform(user_scores), normalized_scores), repeat)
+            kernel_ms = measure(lambda: kernel.similarities(user_scores), repeat)
+            lattice_ms = measure(lambda: engine.similarities(user_scores), repeat)
+            print(f"{num_postings:>10,} | {num_users:>6} | {sklearn_ms:>11.3f} | {kernel_ms:>10.3f} | "
+                  f"{lattice_ms:>11.3f} | {sklearn_ms / lattice_ms:>9.1f}x")
+
+    print("=" * 78)
+    print("💡 조회표 크기: 공고당 80 × 4바이트 (공고 행렬의 5배)")
+
+if __name__ == "__main__":
+    main()
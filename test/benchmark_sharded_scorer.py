@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+샤딩 유사도 계산 지연 시간 벤치마크
+단일 프로세스 전체 계산과 샤드 수별 ShardedScorer(공유 메모리 + 워커 프로세스 + 상위 k개 병합)의 요청당 시간을 비교합니다.
+샤드 수가 CPU 코어 수를 넘으면 워커끼리 코어를 나눠 쓰므로 느려집니다.
+
+실행: python test/benchmark_sharded_scorer.py [--postings 1000000] [--shards 1 2 4 8]
+"""
+
+import os
+import sys
+import time
+import argparse
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import ScoringKernel, select_top_k_batch
+from sharded_scorer import ShardedScorer
+
+TOP_K = 5
+BATCH_SIZES = [1, 32]
+
+def build_synthetic(num_postings, seed=42):
+    """무작위 1~5 점수 공고 커널"""
+    rng = np.random.default_rng(seed)
+    posting_scores = rng.integers(1, 6, size=(num_postings, 16))
+    scaler = StandardScaler()
+    ids = np.arange(1, num_postings + 1, dtype=np.int64)
+    return ScoringKernel.from_scaler(scaler, scaler.fit_transform(posting_scores), {'id': ids})
+
+def measure(rank, user_scores, batch_size, repeats):
+    """batch_size명씩 묶어 repeats번 호출한 요청당 평균 시간 (ms)"""
+    start = time.perf_counter()
+    for i in range(repeats):
+        rank(user_scores[i * batch_size:(i + 1) * batch_size])
+    return (time.perf_counter() - start) / repeats * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description='샤딩 유사도 계산 지연 시간 벤치마크')
+    parser.add_argument('--postings', type=int, default=1_000_000, help='합성 공고 수')
+    parser.add_argument('--shards', type=int, nargs='+', default=[1, 2, 4, 8], help='비교할 샤드 수')
+    parser.add_argument('--repeats', type=int, default=20, help='측정 반복 횟수')
+    args = parser.parse_args()
+
+    print("⏱️ 샤딩 유사도 계산 벤치마크")
+    print("=" * 60)
+    kernel = build_synthetic(args.postings)
+    ids = kernel.posting_info['id']
+    user_scores = np.random.default_rng(7).integers(1, 6, size=(max(BATCH_SIZES) * args.repeats, 16))
+    print(f"📦 공고 {len(kernel):,}개, CPU 코어 {os.cpu_count()}개")
+
+    def rank_single_process(batch):
+        return select_top_k_batch(kernel.similarities(batch), TOP_K, ids)
+
+    baseline = {batch_size: measure(rank_single_process, user_scores, batch_size, args.repeats)
+                for batch_size in BATCH_SIZES}
+    header = ' | '.join(f"{f'{batch_size}명(ms)':>10}" for batch_size in BATCH_SIZES)
+    print(f"   {'샤드':>6} | {header}")
+    print(f"   {'단일':>6} | " + ' | '.join(f"{baseline[batch_size]:>10.2f}" for batch_size in BATCH_SIZES))
+
+    for num_shards in args.shards:
+        scorer = ShardedScorer(kernel, num_shards)
+        try:
+            start = time.perf_counter()
+            scorer.warm_up()
+            warm_up_seconds = time.perf_counter() - start
+
+            def rank_sharded(batch):
+                return scorer.top_k(batch, TOP_K)
+
+            timings = [measure(rank_sharded, user_scores, batch_size, args.repeats) for batch_size in BATCH_SIZES]
+            print(f"   {num_shards:>6} | " + ' | '.join(
+                f"{timing:>10.2f}" for timing in timings
+            ) + f"  (속도 {baseline[1] / timings[0]:.2f}x / {baseline[BATCH_SIZES[-1]] / timings[-1]:.2f}x, "
+                f"워커 시작 {warm_up_seconds:.1f}초)")
+        finally:
+            scorer.close()
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+운영 모드 처리량 벤치마크
+gunicorn 워커 수를 바꿔 가며 /recommend 처리량(req/s), 응답 시간, 워커 메모리(PSS)를 측정합니다.
+모델 파일(models/)이 있어야 하며, 측정은 로컬 포트에서 실행한 서버를 대상으로 합니다.
+
+실행: python test/benchmark_throughput.py --workers 1 2 4 --duration 10
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+import multiprocessing
+import numpy as np
+import requests
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_DIR)
+from job_recommendation_api import score_columns
+
+def read_pss_kb(pid):
+    """프로세스의 PSS (공유 페이지를 프로세스 수로 나눈 실사용 메모리, KB)"""
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                if line.startswith('Pss:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+def child_pids(pid):
+    """자식 프로세스 pid 목록 (gunicorn 워커)"""
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(child) for child in f.read().split()]
+    except OSError:
+        return []
+
+def start_server(workers, port):
+    """gunicorn 서버 시작 후 /health 응답까지 대기"""
+    env = dict(os.environ, API_WORKERS=str(workers), API_PORT=str(port), API_HOST='127.0.0.1')
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'wsgi:app'],
+        cwd=PROJECT_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            if requests.get(f"http://127.0.0.1:{port}/health", timeout=1).ok and len(child_pids(server.pid)) >= workers:
+                return server
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+
+    server.terminate()
+    raise RuntimeError("서버가 시작되지 않았습니다. models/ 디렉토리와 gunicorn 설치를 확인하세요.")
+
+def run_client(port, duration, seed, results):
+    """지정 시간 동안 무작위 점수로 /recommend 반복 호출"""
+    rng = np.random.default_rng(seed)
+    session = requests.Session()
+    url = f"http://127.0.0.1:{port}/recommend"
+    latencies = []
+
+    end_time = time.time() + duration
+    while time.time() < end_time:
+        user_scores = dict(zip(score_columns, rng.integers(1, 6, size=len(score_columns)).tolist()))
+        payload = {'user_scores': user_scores, 'top_k': 5}
+        start = time.perf_counter()
+        response = session.post(url, json=payload)
+        if response.status_code == 200:
+            latencies.append(time.perf_counter() - start)
+    results.put(latencies)
+
+def measure(workers, clients, duration, port):
+    """워커 수 하나에 대한 처리량/응답 시간/메모리 측정"""
+    server = start_server(workers, port)
+    try:
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=run_client, args=(port, duration, seed, results))
+            for seed in range(clients)
+        ]
+        for process in processes:
+            process.start()
+        latencies = []
+        for _ in processes:
+            latencies.extend(results.get())
+        for process in processes:
+            process.join()
+
+        worker_pss = [read_pss_kb(pid) for pid in child_pids(server.pid)]
+        master_pss = read_pss_kb(server.pid)
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        'rps': len(latencies) / duration,
+        'p50': float(np.percentile(latencies_ms, 50)) if len(latencies) else 0.0,
+        'p95': float(np.percentile(latencies_ms, 95)) if len(latencies) else 0.0,
+        'memory_mb': (sum(worker_pss) + master_pss) / 1024,
+        'per_worker_mb': (sum(worker_pss) / len(worker_pss) / 1024) if worker_pss else 0.0
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='운영 모드 처리량 벤치마크')
+    parser.add_argument('--workers', type=int, nargs='+', default=None, help='측정할 워커 수 목록')
+    parser.add_argument('--clients', type=int, default=None, help='동시 클라이언트 프로세스 수 (기본: 워커 수 × 2)')
+    parser.add_argument('--duration', type=float, default=10, help='워커 수별 측정 시간 (초)')
+    parser.add_argument('--port', type=int, default=18888, help='벤치마크용 포트')
+    args = parser.parse_args()
+
+    cpu_count = multiprocessing.cpu_count()
+    worker_counts = args.workers or sorted({1, 2, 4, cpu_count})
+
+    print(f"⏱️ 운영 모드 처리량 벤치마크 (CPU 코어: {cpu_count}개)")
+    print("=" * 78)
+    print(f"{'워커':>4} | {'클라이언트':>6} | {'req/s':>8} | {'p50(ms)':>8} | {'p95(ms)':>8} | {'전체 PSS(MB)':>12} | {'워커당(MB)':>10}")
+    print("-" * 78)
+
+    for workers in worker_counts:
+        clients = args.clients or workers * 2
+        result = measure(workers, clients, args.duration, args.port)
+        print(f"{workers:>4} | {clients:>10} | {result['rps']:>8.1f} | {result['p50']:>8.2f} | "
+              f"{result['p95']:>8.2f} | {result['memory_mb']:>12.1f} | {result['per_worker_mb']:>10.1f}")
+
+    print("=" * 78)
+    print("💡 처리량은 CPU 코어 수까지 워커 수에 비례해 증가하고, 클라이언트도 같은 머신에서 실행되면 코어를 나눠 씁니다.")
+
+if __name__ == "__main__":
+    main()
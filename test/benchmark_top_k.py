@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+상위 k개 선택 마이크로 벤치마크
+전체 argsort 방식과 argpartition 기반 select_top_k를 공고 수별로 비교합니다.
+
+실행: python test/benchmark_top_k.py
+"""
+
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import select_top_k
+
+def measure(func, repeat):
+    """평균 실행 시간 (ms)"""
+    func()  # 워밍업
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    print("⏱️ 상위 k개 선택 벤치마크 (argsort vs argpartition)")
+    print("=" * 60)
+    print(f"{'공고 수':>10} | {'top_k':>5} | {'argsort(ms)':>12} | {'top_k(ms)':>10} | {'배속':>6}")
+    print("-" * 60)
+
+    rng = np.random.default_rng(42)
+    for num_postings in [10_000, 100_000, 1_000_000]:
+        similarities = rng.random(num_postings, dtype=np.float32)
+        posting_ids = np.arange(1, num_postings + 1)
+        repeat = max(5, 2_000_000 // num_postings)
+
+        for top_k in [5, 7]:
+            argsort_ms = measure(lambda: similarities.argsort()[-top_k:][::-1], repeat)
+            top_k_ms = measure(lambda: select_top_k(similarities, top_k, posting_ids), repeat)
+            print(f"{num_postings:>10,} | {top_k:>5} | {argsort_ms:>12.3f} | {top_k_ms:>10.3f} | {argsort_ms / top_k_ms:>5.1f}x")
+
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+추천 API 앱 테스트
+서버를 띄우지 않고 Flask test_client로 무작위 공고 아티팩트를 로딩한 앱의 응답을 확인합니다.
+"""
+
+import os
+import sys
+import signal
+import tempfile
+import threading
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import job_recommendation_api as api
+from model_artifact import save_model_artifact
+
+def write_model(model_dir, version='test', num_postings=300, seed=0, missing_labels=0):
+    """무작위 공고 점수로 서빙용 아티팩트 작성 (앞쪽 missing_labels개 공고는 기관명 결측)"""
+    rng = np.random.default_rng(seed)
+    posting_scores = rng.integers(1, 6, size=(num_postings, len(api.score_columns)))
+    job_posting_scores = pd.DataFrame(posting_scores, columns=api.score_columns)
+    job_posting_scores.insert(0, 'id', np.arange(1, num_postings + 1))
+    job_posting_scores.insert(1, '기관명', rng.choice(['부산교통공사', '부산시설공단', '부산관광공사'], num_postings))
+    job_posting_scores.insert(2, '일반전형', rng.choice(['운영직', '기술직', '사무직'], num_postings))
+    job_posting_scores.loc[:missing_labels - 1, '기관명'] = None
+    scaler = StandardScaler()
+    save_model_artifact(model_dir, version, scaler, scaler.fit_transform(posting_scores),
+                        job_posting_scores, api.score_columns)
+    return job_posting_scores
+
+def random_user_scores(num_users, seed=1):
+    rng = np.random.default_rng(seed)
+    return [dict(zip(api.score_columns, row)) for row in rng.integers(1, 6, size=(num_users, 16)).tolist()]
+
+def test_batch_matches_single_and_rejects_bad_requests():
+    """/recommend/batch 결과 == 사용자별 /recommend 결과, 빈 배열/최대 인원 초과/잘못된 top_k/숫자가 아닌 점수는 400"""
+    original_dir, original_batch_size = api.MODEL_DIR, api.MAX_BATCH_SIZE
+    with tempfile.TemporaryDirectory() as model_dir:
+        write_model(model_dir)
+        api.MODEL_DIR = model_dir
+        try:
+            assert api.load_similarity_model()
+            client = api.app.test_client()
+            users = random_user_scores(12)
+
+            batch = client.post('/recommend/batch', json={'user_scores_list': users, 'top_k': 7}).get_json()
+            assert batch['success'] and batch['user_count'] == len(users)
+            for i, user_scores in enumerate(users):
+                single = client.post('/recommend', json={'user_scores': user_scores, 'top_k': 7}).get_json()
+                assert single['success'] and single['total_count'] == 7
+                assert batch['results'][i]['index'] == i
+                assert batch['results'][i]['recommendations'] == single['recommendations']
+
+            api.MAX_BATCH_SIZE = 3
+            bad_batches = [
+                {'user_scores_list': []},
+                {'user_scores_list': users[:4]},
+                {'user_scores_list': users[:1], 'top_k': 0},
+                {'user_scores_list': users[:1], 'top_k': api.MAX_TOP_K + 1},
+                {'user_scores_list': users[:1], 'top_k': True},
+                {'user_scores_list': users[:1], 'top_k': 2.5},
+                {'user_scores_list': users[:1], 'top_k': '5'},
+            ]
+            for payload in bad_batches:
+                response = client.post('/recommend/batch', json=payload)
+                assert response.status_code == 400 and not response.get_json()['success'], payload
+            for top_k in (0, -1, api.MAX_TOP_K + 1, True, None, '5'):
+                response = client.post('/recommend', json={'user_scores': users[0], 'top_k': top_k})
+                assert response.status_code == 400 and 'top_k' in response.get_json()['error'], top_k
+
+            # 숫자가 아닌 점수: 500이 아니라 400, 오류에 항목명과 (일괄 요청이면) 구직자 번호
+            for bad_value in ('4', None, [4], True, {'value': 4}):
+                bad_user = {**users[1], '외향성': bad_value}
+                response = client.post('/recommend', json={'user_scores': bad_user})
+                assert response.status_code == 400 and '외향성' in response.get_json()['error'], bad_value
+                api.MAX_BATCH_SIZE = original_batch_size
+                response = client.post('/recommend/batch', json={'user_scores_list': [users[0], bad_user]})
+                error = response.get_json()['error']
+                assert response.status_code == 400 and error.startswith('[1]') and '외향성' in error, bad_value
+        finally:
+            api.MODEL_DIR, api.MAX_BATCH_SIZE = original_dir, original_batch_size
+            api.recommendation_cache.clear()
+
+def test_statistics_served_from_snapshot_with_etag():
+    """/statistics == pandas 집계 (결측 라벨 제외), 요청마다 다시 계산하지 않음, If-None-Match는 모델 버전 단위 304"""
+    original_dir = api.MODEL_DIR
+    with tempfile.TemporaryDirectory() as first_dir, tempfile.TemporaryDirectory() as second_dir:
+        job_posting_scores = write_model(first_dir, version='v1', missing_labels=4)
+        write_model(second_dir, version='v2', num_postings=120, seed=7)
+        api.MODEL_DIR = first_dir
+        try:
+            assert api.load_similarity_model()
+            client = api.app.test_client()
+
+            # 통계 계산을 막아도 로딩 시 인코딩한 응답으로 200
+            api.active_snapshot.records.statistics = lambda: 1 / 0
+            response = client.get('/statistics')
+            assert response.status_code == 200 and response.headers['ETag'] == '"stats-v1"'
+            assert response.data == api.active_snapshot.statistics_body
+            assert response.get_json() == {
+                'success': True,
+                'statistics': {
+                    'total_postings': len(job_posting_scores),
+                    'unique_agencies': job_posting_scores['기관명'].nunique(),
+                    'unique_forms': job_posting_scores['일반전형'].nunique()
+                },
+                'form_distribution': job_posting_scores['일반전형'].value_counts().to_dict(),
+                'agency_distribution': job_posting_scores['기관명'].value_counts().to_dict()
+            }
+
+            cached = client.get('/statistics', headers={'If-None-Match': '"stats-v1"'})
+            assert cached.status_code == 304 and cached.data == b''
+
+            # 모델이 바뀌면 이전 ETag로도 새 통계
+            api.MODEL_DIR = second_dir
+            assert api.load_similarity_model()
+            response = client.get('/statistics', headers={'If-None-Match': '"stats-v1"'})
+            assert response.status_code == 200 and response.headers['ETag'] == '"stats-v2"'
+            assert response.get_json()['statistics']['total_postings'] == 120
+        finally:
+            api.MODEL_DIR = original_dir
+            api.recommendation_cache.clear()
+
+def test_reload_swaps_snapshot_in_background():
+    """리로드 중에는 이전 스냅샷으로 응답, 동시 리로드는 409, 교체 후 새 버전과 캐시 초기화, ?wait=true는 완료 후 응답"""
+    original_dir, original_loader = api.MODEL_DIR, api.load_model_snapshot
+    started, release = threading.Event(), threading.Event()
+
+    def slow_loader(model_dir, score_columns):
+        # 새 모델 디렉토리를 읽되, 테스트가 허락할 때까지 교체를 미룸
+        started.set()
+        assert release.wait(10)
+        return original_loader(new_dir, score_columns)
+
+    with tempfile.TemporaryDirectory() as old_dir, tempfile.TemporaryDirectory() as new_dir:
+        write_model(old_dir, version='old')
+        write_model(new_dir, version='new', seed=5)
+        api.MODEL_DIR = old_dir
+        try:
+            assert api.load_similarity_model()
+            client = api.app.test_client()
+            payload = {'user_scores': random_user_scores(1)[0], 'top_k': 5}
+            before = client.post('/recommend', json=payload).get_json()['recommendations']
+            assert api.recommendation_cache.stats()['size'] == 1
+
+            api.load_model_snapshot = slow_loader
+            assert client.post('/reload_model').status_code == 202
+            assert started.wait(10)
+
+            # 로딩 중: 이전 스냅샷으로 응답, 두 번째 리로드는 409
+            health = client.get('/health').get_json()
+            assert health['model_version'] == 'old' and health['reload']['state'] == 'loading'
+            assert client.post('/recommend', json=payload).get_json()['recommendations'] == before
+            assert client.post('/reload_model').status_code == 409
+
+            release.set()
+            api.reload_thread.join(10)
+            health = client.get('/health').get_json()
+            assert health['model_version'] == 'new' and health['reload']['state'] == 'succeeded'
+            assert health['cache']['size'] == 0
+            assert client.post('/recommend', json=payload).get_json()['recommendations'] != before
+
+            # ?wait=true: 로딩이 끝난 뒤 새 모델 정보와 함께 200
+            api.load_model_snapshot = lambda model_dir, score_columns: original_loader(old_dir, score_columns)
+            response = client.post('/reload_model?wait=true')
+            assert response.status_code == 200 and response.get_json()['model']['version'] == 'old'
+            assert client.get('/health').get_json()['model_version'] == 'old'
+        finally:
+            release.set()
+            if api.reload_thread is not None:
+                api.reload_thread.join(10)
+            api.MODEL_DIR, api.load_model_snapshot = original_dir, original_loader
+            api.recommendation_cache.clear()
+
+def test_reload_under_gunicorn_signals_master():
+    """gunicorn 워커에서 /reload_model은 직접 로딩하지 않고 마스터에 HUP 신호를 보내고 202"""
+    received = []
+    previous_handler = signal.signal(signal.SIGHUP, lambda signum, frame: received.append(signum))
+    api.gunicorn_master_pid = os.getpid()
+    try:
+        response = api.app.test_client().post('/reload_model?wait=true')
+        assert response.status_code == 202 and 'HUP' in response.get_json()['message']
+        assert received == [signal.SIGHUP]
+        assert api.reload_thread is None or not api.reload_thread.is_alive()
+    finally:
+        api.gunicorn_master_pid = None
+        signal.signal(signal.SIGHUP, previous_handler)
+
+if __name__ == "__main__":
+    test_batch_matches_single_and_rejects_bad_requests()
+    test_statistics_served_from_snapshot_with_etag()
+    test_reload_swaps_snapshot_in_background()
+    test_reload_under_gunicorn_signals_master()
+    print("✅ 추천 API 앱 테스트 통과")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+대량 삽입(bulk_insert) 테스트
+DB 서버 없이 가짜 커넥션으로 묶음 크기, 실패 묶음의 한 행씩 재시도, upsert 문장, LOAD DATA용 TSV 이스케이프를 확인합니다.
+"""
+
+import os
+import sys
+import pymysql
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database_manager import DatabaseManager
+
+class FakeCursor:
+    """실행한 문장을 기록하고, 값이 'bad'인 행이 들어 있으면 IntegrityError를 내는 가짜 커서"""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def _check(self, rows):
+        if any('bad' in row for row in rows):
+            raise pymysql.err.IntegrityError(1062, 'Duplicate entry')
+
+    def executemany(self, sql, rows):
+        self._check(rows)
+        self.connection.calls.append(('executemany', sql, list(rows)))
+
+    def execute(self, sql, params=None):
+        if sql.startswith('LOAD DATA'):
+            with open(params[0], encoding='utf-8') as tsv_file:
+                self.connection.loaded = tsv_file.read()
+            self.rowcount = self.connection.loaded.count('\n')
+            return
+        self._check([params])
+        self.connection.calls.append(('execute', sql, params))
+
+class FakeConnection:
+    """트랜잭션 호출과 실행 문장을 기록하는 가짜 커넥션"""
+
+    def __init__(self):
+        self.calls = []
+        self.loaded = None
+        self.options = None
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def begin(self):
+        self.calls.append(('begin',))
+
+    def commit(self):
+        self.calls.append(('commit',))
+
+    def rollback(self):
+        self.calls.append(('rollback',))
+
+    def close(self):
+        pass
+
+def test_bulk_insert_modes():
+    """insert 묶음/재시도, upsert ON DUPLICATE KEY UPDATE, load_infile TSV (NULL/NaN/탭/줄바꿈)"""
+    db = DatabaseManager(database='sangsang', pooled=False)
+    db.connection = FakeConnection()
+
+    # insert: 5행을 2행씩 → executemany 3번, 묶음마다 트랜잭션
+    rows = [(i, f"기관{i}") for i in range(5)]
+    assert db.bulk_insert('t', ['id', '기관명'], iter(rows), chunk_size=2) == 5
+    batches = [call for call in db.connection.calls if call[0] == 'executemany']
+    assert [len(call[2]) for call in batches] == [2, 2, 1]
+    assert batches[0][1] == "INSERT INTO `t` (`id`, `기관명`) VALUES (%s, %s)"
+    assert db.connection.calls.count(('commit',)) == 3
+
+    # 실패한 묶음: skip_errors면 롤백 후 한 행씩 다시 넣어 실패한 행만 건너뜀, 아니면 예외
+    db.connection.calls = []
+    assert db.bulk_insert('t', ['id', '기관명'], [(1, 'a'), (2, 'bad'), (3, 'c')], skip_errors=True) == 2
+    assert ('rollback',) in db.connection.calls
+    assert [call[2] for call in db.connection.calls if call[0] == 'execute'] == [(1, 'a'), (3, 'c')]
+    try:
+        db.bulk_insert('t', ['id', '기관명'], [(2, 'bad')])
+        assert False, "실패한 묶음이 예외 없이 넘어감"
+    except pymysql.err.IntegrityError:
+        pass
+
+    # upsert: 딕셔너리 행, 갱신 컬럼과 추가 식
+    db.connection.calls = []
+    db.bulk_insert('scores', ['기관명', '성실성'], [{'기관명': 'a', '성실성': 3}], mode='upsert',
+                   update_columns=['성실성'], update_expressions={'updated_at': 'CURRENT_TIMESTAMP'})
+    _, sql, params = db.connection.calls[1]
+    assert sql.endswith("ON DUPLICATE KEY UPDATE `성실성`=VALUES(`성실성`), `updated_at`=CURRENT_TIMESTAMP")
+    assert params == [('a', 3)]
+
+    # load_infile: 임시 TSV는 NULL/NaN을 \N, 탭/줄바꿈/역슬래시를 이스케이프, local_infile 커넥션 따로 사용
+    loader = FakeConnection()
+
+    def open_connection(**options):
+        loader.options = options
+        return loader
+
+    db._open_connection = open_connection
+    rows = [(1, None), (2, float('nan')), (3, 'a\tb\nc\\d')]
+    assert db.bulk_insert('t', ['id', '기관명'], rows, mode='load_infile') == 3
+    assert loader.options == {'local_infile': True}
+    assert loader.loaded == '1\t\\N\n2\t\\N\n3\ta\\tb\\nc\\\\d\n'
+
+if __name__ == "__main__":
+    test_bulk_insert_modes()
+    print("✅ 대량 삽입 테스트 통과")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+2단계 추천 중심점 인덱스 테스트
+form_profiles.pkl 중심점 적용과, 모든 그룹을 탐색하면 전체 계산과 같은 결과가 나오는지 확인합니다.
+"""
+
+import os
+import sys
+import pickle
+import tempfile
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import ScoringKernel, select_top_k_batch
+from coarse_index import CoarseIndex, FORM_PROFILES_FILENAME
+from test_distinct_groups import build_sample_records
+
+def build_sample_kernel(records):
+    """레코드 원점수로 만든 공고 단위 커널"""
+    scaler = StandardScaler()
+    scores = np.asarray(records.posting_scores, dtype=np.float64)
+    return ScoringKernel.from_scaler(scaler, scaler.fit_transform(scores), {'id': records.ids})
+
+def test_form_profiles_centroids():
+    """form_profiles.pkl 평균이 있으면 그 값, 없으면 공고 평균을 중심점으로 사용"""
+    records = build_sample_records()
+    kernel = build_sample_kernel(records)
+    computed = CoarseIndex.build(kernel, records)
+
+    # 첫 그룹만 다른 평균을 가진 프로필 파일
+    first = computed.groups.order[0]
+    agency, form = records.agencies[records.agency_codes[first]], records.forms[records.form_codes[first]]
+    profile_values = np.full(16, 3.0)
+    form_profiles = pd.DataFrame([profile_values], columns=records.score_columns,
+                                 index=pd.MultiIndex.from_tuples([(agency, form)], names=['기관명', '일반전형']))
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        with open(os.path.join(model_dir, FORM_PROFILES_FILENAME), 'wb') as f:
+            pickle.dump(form_profiles, f)
+        loaded = CoarseIndex.build(kernel, records, model_dir)
+
+    expected = kernel.standardize(profile_values[None, :]).ravel()
+    expected = expected / np.linalg.norm(expected)
+    assert np.allclose(loaded.centroids[0], expected, atol=1e-6)
+    assert np.array_equal(loaded.centroids[1:], computed.centroids[1:])
+
+def test_probe_all_groups_matches_exhaustive():
+    """nprobe = 그룹 수이면 후보가 전체 공고이고 상위 k개가 전체 계산과 같음"""
+    records = build_sample_records()
+    kernel = build_sample_kernel(records)
+    index = CoarseIndex.build(kernel, records)
+    ids = records.ids
+
+    user_scores = np.random.default_rng(2).integers(1, 6, size=(10, 16))
+    expected = select_top_k_batch(kernel.similarities(user_scores), 5, ids)
+    for user, rows, user_expected in zip(user_scores, index.probe(user_scores, len(index)), expected):
+        assert np.array_equal(np.sort(rows), np.arange(len(records)))
+        similarities = kernel.similarities(user[None, :], rows=rows)
+        assert np.array_equal(rows[select_top_k_batch(similarities, 5, ids[rows])[0]], user_expected)
+
+    # nprobe가 작으면 후보는 선택된 그룹의 공고만 포함
+    for rows in index.probe(user_scores, 2):
+        assert len(np.unique(index.groups.group_ids[rows])) == 2
+
+if __name__ == "__main__":
+    test_form_profiles_centroids()
+    test_probe_all_groups_matches_exhaustive()
+    print("✅ 2단계 추천 중심점 인덱스 테스트 통과")
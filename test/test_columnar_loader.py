@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+컬럼 배열 적재(fetch_columnar) 테스트
+DB 서버 없이 가짜 서버 측 커서로 배열 증설, NULL 처리(점수/라벨), 사전 인코딩, 모델 빌더의 그룹 평균 프로필을 확인합니다.
+"""
+
+import os
+import sys
+import json
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from database_manager import DatabaseManager
+from posting_records import PostingRecords, encode_labels
+from distinct_groups import posting_group_ids
+from model_builder import JobRecommendationModelBuilder
+from test_iter_query import FakeConnection
+
+def test_fetch_columnar_matches_dataframe():
+    """배치/증설과 무관하게 DataFrame 변환과 같은 배열, (기관명, 일반전형) 평균은 groupby().mean()과 같음"""
+    rng = np.random.default_rng(3)
+    builder = JobRecommendationModelBuilder(data_source='database')
+    num_scores = len(builder.score_columns)
+    rows = [
+        (i, f"기관{rng.integers(4)}", f"전형{rng.integers(3)}", *rng.integers(1, 6, num_scores).tolist())
+        for i in range(1, 51)
+    ]
+    rows[7] = rows[7][:5] + (None,) + rows[7][6:]  # 점수 NULL → 0, 평균에서 제외
+
+    db = DatabaseManager(database='sangsang', pooled=False)
+    db._open_connection = lambda **options: FakeConnection(rows)
+    columns = db.fetch_columnar("SELECT ...", [
+        ('id', np.int64),
+        ('기관명', 'label'),
+        ('일반전형', 'label'),
+        ('scores', np.int8, num_scores)
+    ], capacity=8, batch_size=16)
+
+    frame = pd.DataFrame(rows, columns=['id', '기관명', '일반전형'] + builder.score_columns)
+    assert np.array_equal(columns['id'], frame['id'].to_numpy())
+    assert columns['scores'].dtype == np.int8 and columns['scores'][7, 2] == 0
+    assert np.array_equal(columns['scores'], frame[builder.score_columns].fillna(0).to_numpy())
+    for name in ('기관명', '일반전형'):
+        codes, labels = columns[name]
+        expected_codes, expected_labels = encode_labels(frame[name].to_numpy())
+        assert np.array_equal(codes, expected_codes) and labels == expected_labels
+
+    agency_codes, agencies = columns['기관명']
+    form_codes, forms = columns['일반전형']
+    records = PostingRecords(columns['id'], agency_codes, form_codes, agencies, forms, columns['scores'],
+                             builder.score_columns, preload=False)
+    profiles = builder._group_mean_profiles(records)
+    expected = frame.groupby(['기관명', '일반전형'])[builder.score_columns].mean()
+    assert list(profiles.index) == list(expected.index)
+    assert np.allclose(profiles.to_numpy(), expected.to_numpy())
+
+def test_fetch_columnar_null_labels():
+    """NULL 기관명/일반전형은 사전 끝의 None 라벨: 응답은 null, 통계/그룹 평균에서 제외, 중복 제거는 공고별 그룹"""
+    builder = JobRecommendationModelBuilder(data_source='database')
+    num_scores = len(builder.score_columns)
+    agencies = [None, '부산교통공사', '부산시설공단', None, '부산교통공사', '부산시설공단', '부산교통공사']
+    forms = ['운영직', None, '기술직', '운영직', '운영직', '기술직', None]
+    rows = [(i + 1, agency, form, *[(i + column) % 5 + 1 for column in range(num_scores)])
+            for i, (agency, form) in enumerate(zip(agencies, forms))]
+
+    db = DatabaseManager(database='sangsang', pooled=False)
+    db._open_connection = lambda **options: FakeConnection(rows)
+    columns = db.fetch_columnar("SELECT ...", [
+        ('id', np.int64),
+        ('기관명', 'label'),
+        ('일반전형', 'label'),
+        ('scores', np.int8, num_scores)
+    ], capacity=2, batch_size=3)
+    agency_codes, agency_labels = columns['기관명']
+    form_codes, form_labels = columns['일반전형']
+    assert agency_labels == ['부산교통공사', '부산시설공단', None] and form_labels == ['운영직', '기술직', None]
+    records = PostingRecords(columns['id'], agency_codes, form_codes, agency_labels, form_labels, columns['scores'],
+                             builder.score_columns, preload=False)
+
+    # 응답: 결측 라벨은 null
+    decoded = json.loads(records.encode(np.arange(len(rows)), np.zeros(len(rows))))
+    assert [item['기관명'] for item in decoded] == agencies and [item['일반전형'] for item in decoded] == forms
+
+    # 통계/그룹 평균: pandas value_counts/groupby처럼 결측 제외
+    frame = pd.DataFrame(rows, columns=['id', '기관명', '일반전형'] + builder.score_columns)
+    statistics = records.statistics()
+    assert statistics['statistics'] == {'total_postings': 7, 'unique_agencies': 2, 'unique_forms': 2}
+    assert statistics['agency_distribution'] == frame['기관명'].value_counts().to_dict()
+    assert statistics['form_distribution'] == frame['일반전형'].value_counts().to_dict()
+    profiles = builder._group_mean_profiles(records)
+    expected = frame.groupby(['기관명', '일반전형'])[builder.score_columns].mean()
+    assert list(profiles.index) == list(expected.index)
+    assert np.allclose(profiles.to_numpy(), expected.to_numpy())
+
+    # 중복 제거: 결측 라벨 공고는 서로 다른 그룹, 나머지는 라벨별 그룹
+    form_groups = posting_group_ids(records, 'form')
+    assert form_groups[1] != form_groups[6] and form_groups[0] == form_groups[3] == form_groups[4]
+    agency_form_groups = posting_group_ids(records, 'agency_form')
+    assert len(set(agency_form_groups.tolist())) == 6 and agency_form_groups[2] == agency_form_groups[5]
+
+if __name__ == "__main__":
+    test_fetch_columnar_matches_dataframe()
+    test_fetch_columnar_null_labels()
+    print("✅ 컬럼 배열 적재 테스트 통과")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+커넥션 풀 테스트
+DB 서버 없이 가짜 커넥션으로 재사용, 최대 크기 대기, 생존 확인, 유휴 정리, 관리자 대여/반납을 확인합니다.
+"""
+
+import os
+import sys
+import threading
+import time
+import pymysql
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import database_manager
+from database_manager import ConnectionPool, PoolTimeoutError, DatabaseManager
+
+class FakeConnection:
+    """ping/close/rollback 호출을 기록하는 가짜 커넥션"""
+
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+        self.rollbacks = 0
+
+    def ping(self, reconnect=False):
+        if not self.alive:
+            raise pymysql.err.OperationalError(2006, 'MySQL server has gone away')
+
+    def close(self):
+        self.closed = True
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def begin(self):
+        pass
+
+def test_pool_reuse_limits_and_recycling():
+    """반납한 커넥션 재사용, 최대 크기 초과 시 대기/시간 초과, 끊긴 커넥션 교체, 오래 쉰 커넥션 정리"""
+    opened = []
+
+    def connect():
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    pool = ConnectionPool(connect, min_size=1, max_size=2, max_idle_seconds=0.05, timeout=0.05)
+
+    # 재사용: 순서대로 빌리고 반납하면 커넥션 하나로 처리
+    for _ in range(5):
+        with pool.connection():
+            pass
+    assert len(opened) == 1 and pool.stats()['reused'] == 4
+
+    # 최대 크기: 2개를 빌린 상태에서 세 번째는 시간 초과, 반납하면 다른 스레드가 이어받음
+    first, second = pool.acquire(), pool.acquire()
+    try:
+        pool.acquire()
+        assert False, "최대 크기를 넘어 대여됨"
+    except PoolTimeoutError:
+        pass
+    borrowed = []
+    waiter = threading.Thread(target=lambda: borrowed.append(pool.acquire(timeout=1)))
+    waiter.start()
+    time.sleep(0.01)
+    pool.release(second)
+    waiter.join()
+    assert borrowed == [second] and pool.stats()['waits'] >= 2 and pool.stats()['timeouts'] == 1
+
+    # 생존 확인: 끊긴 커넥션은 닫고 새로 연결
+    pool.release(borrowed[0])
+    pool.release(first)
+    for connection, _ in pool._idle:
+        connection.alive = False
+    replaced = pool.acquire()
+    assert replaced.alive and pool.stats()['ping_failures'] == 1
+    pool.release(replaced)
+
+    # 유휴 정리: 오래 쉰 커넥션은 최소 크기(1)만 남기고 닫음
+    time.sleep(0.1)
+    pool.release(pool.acquire())
+    stats = pool.stats()
+    assert stats['size'] == 1 and stats['recycled'] >= 1 and stats['in_use'] == 0
+
+    pool.close()
+    assert all(connection.closed for connection in opened)
+
+def test_manager_borrows_from_pool():
+    """DatabaseManager connect/disconnect는 풀 대여/반납, 연결 오류가 난 커넥션과 미완료 트랜잭션은 정리"""
+    opened = []
+
+    def connect():
+        opened.append(FakeConnection())
+        return opened[-1]
+
+    pool = ConnectionPool(connect, min_size=0, max_size=4)
+    original = database_manager.get_connection_pool
+    database_manager.get_connection_pool = lambda *args: pool
+    try:
+        db = DatabaseManager(database='sangsang', pooled=True)
+        for _ in range(3):
+            assert db.connect()
+            db.disconnect()
+        assert len(opened) == 1 and pool.stats()['in_use'] == 0
+
+        # 커밋하지 않은 트랜잭션은 반납 전에 롤백
+        db.connect()
+        db.begin_transaction()
+        db.disconnect()
+        assert opened[0].rollbacks == 1
+
+        # 연결 오류가 난 커넥션은 반납하지 않고 닫음
+        db.connect()
+        db._mark_broken(pymysql.err.OperationalError(2013, 'Lost connection'))
+        db.disconnect()
+        assert opened[0].closed and pool.stats()['idle'] == 0
+    finally:
+        database_manager.get_connection_pool = original
+
+if __name__ == "__main__":
+    test_pool_reuse_limits_and_recycling()
+    test_manager_borrows_from_pool()
+    print("✅ 커넥션 풀 테스트 통과")
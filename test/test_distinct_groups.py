@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+그룹별 중복 제거 추천 테스트
+reduceat 기반 그룹 최댓값 선택이 그룹별로 직접 고른 결과와 같은지 확인합니다.
+"""
+
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from posting_records import PostingRecords, encode_labels
+from distinct_groups import PostingGroups, posting_group_ids, DISTINCT_MODES
+
+def build_sample_records(num_postings=400, seed=0):
+    """기관 3개 × 전형 5개 무작위 공고 레코드"""
+    rng = np.random.default_rng(seed)
+    agency_codes, agencies = encode_labels(rng.choice(['부산교통공사', '부산시설공단', '부산관광공사'], num_postings))
+    form_codes, forms = encode_labels(rng.choice(['운전직', '기계직', '행정직', '전기직', '운영직'], num_postings))
+    ids = rng.permutation(num_postings).astype(np.int64) + 1
+    scores = rng.integers(1, 6, size=(num_postings, 16)).astype(np.int8)
+    return PostingRecords(ids, agency_codes, form_codes, agencies, forms, scores, [f'점수{i}' for i in range(16)],
+                          preload=False)
+
+def reference_select(similarities, top_k, group_ids, ids):
+    """그룹마다 (유사도 내림차순, id 오름차순) 첫 공고를 고른 뒤 같은 기준으로 상위 k개"""
+    results = []
+    for row in similarities:
+        best = {}
+        for column, (group, similarity) in enumerate(zip(group_ids, row)):
+            key = (-similarity, ids[column])
+            if group not in best or key < best[group][0]:
+                best[group] = (key, column)
+        results.append([column for _, column in sorted(best.values())[:top_k]])
+    return np.array(results)
+
+def test_distinct_select_matches_reference():
+    """전체 공고/필터된 행 모두 직접 계산한 그룹별 최고 공고와 일치 (동점 포함)"""
+    records = build_sample_records()
+    rng = np.random.default_rng(1)
+    # 소수 첫째 자리로 반올림해 그룹 안/그룹 간 동점을 만듦
+    similarities = np.round(rng.uniform(-1, 1, size=(20, len(records))), 1).astype(np.float32)
+    rows = np.flatnonzero(rng.random(len(records)) < 0.3)
+
+    for mode in DISTINCT_MODES:
+        group_ids = posting_group_ids(records, mode)
+        groups = PostingGroups(group_ids, records.ids)
+
+        for top_k in (3, 50):
+            columns, values = groups.select(similarities, top_k)
+            assert np.array_equal(columns, reference_select(similarities, top_k, group_ids, records.ids))
+            assert np.array_equal(values, np.take_along_axis(similarities, columns, axis=1))
+
+            subset = similarities[:, rows]
+            columns, _ = groups.select(subset, top_k, rows)
+            assert np.array_equal(columns, reference_select(subset, top_k, group_ids[rows], records.ids[rows]))
+
+    # 그룹 수보다 top_k가 크면 그룹 수만큼만 반환
+    assert groups.select(similarities, 50)[0].shape == (20, len(groups))
+
+if __name__ == "__main__":
+    test_distinct_select_matches_reference()
+    print("✅ 그룹별 중복 제거 테스트 통과")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+스트리밍 조회(iter_query) 테스트
+DB 서버 없이 가짜 서버 측 커서로 배치 크기, 커넥션 반납/폐기, CSV 이어 쓰기를 확인합니다.
+"""
+
+import os
+import sys
+import tempfile
+import pymysql
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, 'data'))
+import database_manager
+from database_manager import ConnectionPool, DatabaseManager
+from manage_tables import export_table_to_csv
+
+class FakeCursor:
+    """fetchmany 호출마다 남은 행을 잘라 주는 가짜 서버 측 커서"""
+
+    def __init__(self, rows, cursor_class):
+        self.rows = rows
+        self.cursor_class = cursor_class
+        self.fetch_sizes = []
+
+    def execute(self, sql, params=None):
+        if self.cursor_class is pymysql.cursors.SSDictCursor:
+            self.rows = [{'id': row[0], '기관명': row[1]} for row in self.rows]
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def close(self):
+        pass
+
+class FakeConnection:
+    """cursor(클래스)로 가짜 커서를 만드는 커넥션"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.cursors = []
+        self.closed = False
+
+    def cursor(self, cursor_class=None):
+        self.cursors.append(FakeCursor(list(self.rows), cursor_class))
+        return self.cursors[-1]
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        self.closed = True
+
+def test_iter_query_batches_and_connection_handling():
+    """batch_size행씩 반환, 끝까지 읽으면 풀에 반납, 중간에 멈추면 커넥션 폐기, CSV는 헤더/BOM 한 번"""
+    rows = [(i, f"기관{i}") for i in range(1, 11)]
+    opened = []
+
+    def connect():
+        opened.append(FakeConnection(rows))
+        return opened[-1]
+
+    pool = ConnectionPool(connect, min_size=0, max_size=2)
+    original = database_manager.get_connection_pool
+    database_manager.get_connection_pool = lambda *args: pool
+    try:
+        db = DatabaseManager(database='sangsang', pooled=True)
+
+        # 끝까지 읽기: 4/4/2행, 서버 측 커서 사용, 커넥션은 풀로 반납
+        batches = list(db.iter_query("SELECT id, 기관명 FROM t", batch_size=4))
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert [row for batch in batches for row in batch] == rows
+        assert opened[0].cursors[0].cursor_class is pymysql.cursors.SSCursor
+        assert pool.stats()['idle'] == 1 and not opened[0].closed
+
+        # 중간에 멈추기: 남은 결과가 걸린 커넥션은 반납하지 않고 닫음
+        for _ in db.iter_query("SELECT id, 기관명 FROM t", batch_size=3):
+            break
+        assert opened[0].closed and pool.stats()['idle'] == 0 and pool.stats()['in_use'] == 0
+
+        # CSV 내보내기: 배치마다 이어 쓰지만 BOM과 헤더는 파일 처음에 한 번
+        with tempfile.TemporaryDirectory() as output_dir:
+            original_batch_size = database_manager.DB_STREAM_BATCH_SIZE
+            database_manager.DB_STREAM_BATCH_SIZE = 3
+            try:
+                assert export_table_to_csv(db, 't', output_dir)
+            finally:
+                database_manager.DB_STREAM_BATCH_SIZE = original_batch_size
+            with open(os.path.join(output_dir, 't_export.csv'), 'rb') as csv_file:
+                content = csv_file.read()
+            assert content.count('﻿'.encode('utf-8')) == 1
+            lines = content.decode('utf-8-sig').splitlines()
+            assert lines[0] == 'id,기관명' and len(lines) == 11 and lines[-1] == '10,기관10'
+            assert opened[-1].cursors[0].cursor_class is pymysql.cursors.SSDictCursor
+    finally:
+        database_manager.get_connection_pool = original
+
+if __name__ == "__main__":
+    test_iter_query_batches_and_connection_handling()
+    print("✅ 스트리밍 조회 테스트 통과")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+IVF 인덱스 테스트
+군집 순 연속 저장 배치와, 모든 군집을 탐색하면 전체 계산과 같은 결과가 나오는지 확인합니다.
+"""
+
+import os
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import select_top_k_batch
+from ivf_index import IVFIndex, train_ivf
+from model_artifact import save_model_artifact, load_model_artifact
+from model_snapshot import load_model_snapshot
+from test_unique_profiles import build_duplicated_postings, SCORE_COLUMNS
+
+def test_search_all_clusters_matches_exhaustive():
+    """군집 순 배치가 공고를 한 번씩 포함하고, nprobe = 군집 수이면 전체 계산과 같음"""
+    _, kernel, _, ids = build_duplicated_postings(num_postings=3000, num_profiles=400)
+    centroids, order, offsets = train_ivf(kernel.postings, 16, sample_size=1000)
+    index = IVFIndex(kernel, centroids, order, offsets)
+
+    assert np.array_equal(np.sort(order), np.arange(len(ids))) and offsets[-1] == len(ids)
+    # 각 공고는 중심점 유사도가 가장 높은 군집에 속함
+    clusters = np.repeat(np.arange(len(index)), index.sizes)
+    assert np.array_equal((index.cluster_postings @ index.centroids.T).argmax(axis=1), clusters)
+
+    user_scores = np.random.default_rng(3).integers(1, 6, size=(20, 16))
+    exact = kernel.similarities(user_scores)
+    expected = select_top_k_batch(exact, 5, ids)
+    top_indices, top_similarities = index.search(user_scores, len(index), 5)
+    for user, (rows, similarities) in enumerate(zip(top_indices, top_similarities)):
+        assert np.array_equal(rows, expected[user])
+        assert np.allclose(similarities, exact[user, rows], atol=1e-6)
+
+    # nprobe가 작으면 결과는 probe로 고른 후보 안에서만 나옴
+    top_indices, _ = index.search(user_scores, 2, 5)
+    for rows, candidates in zip(top_indices, index.probe(user_scores, 2)):
+        assert np.isin(rows, candidates).all()
+
+def test_artifact_stores_ivf():
+    """ivf_clusters로 저장한 아티팩트를 스냅샷이 2단계 추천 인덱스로 사용"""
+    scaler, kernel, posting_scores, ids = build_duplicated_postings(num_postings=500, num_profiles=100)
+    job_posting_scores = pd.DataFrame(posting_scores, columns=SCORE_COLUMNS)
+    job_posting_scores.insert(0, 'id', ids)
+    job_posting_scores.insert(1, '기관명', '부산교통공사')
+    job_posting_scores.insert(2, '일반전형', '운영직')
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        save_model_artifact(model_dir, 'test', scaler, scaler.transform(posting_scores),
+                            job_posting_scores, SCORE_COLUMNS, ivf_clusters=8)
+        artifact = load_model_artifact(model_dir)
+        assert artifact.manifest['ivf_clusters'] == 8
+        index = artifact.build_ivf(artifact.build_kernel())
+        assert np.array_equal(index.cluster_postings, kernel.postings[index.order])
+        assert np.array_equal(index.cluster_ids, ids[index.order])
+
+        snapshot = load_model_snapshot(model_dir, SCORE_COLUMNS)
+        assert isinstance(snapshot.coarse_index(), IVFIndex)
+        assert snapshot.describe()['ivf_clusters'] == 8
+
+if __name__ == "__main__":
+    test_search_all_clusters_matches_exhaustive()
+    test_artifact_stores_ivf()
+    print("✅ IVF 인덱스 테스트 통과")
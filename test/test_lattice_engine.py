@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+정수 격자 조회표 엔진 테스트
+무작위 격자점(1~5점 정수 16개)에서 조회표 엔진의 유사도가 커널/sklearn 코사인 유사도와 같은지 확인합니다.
+"""
+
+import os
+import sys
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+from sklearn.metrics.pairwise import cosine_similarity
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import ScoringKernel, select_top_k_batch
+from lattice_engine import LatticeEngine
+
+def build_sample_kernel(num_postings=500, seed=0):
+    """무작위 1~5점 공고 점수로 스케일러와 커널 생성"""
+    posting_scores = np.random.default_rng(seed).integers(1, 6, size=(num_postings, 16))
+    scaler = StandardScaler()
+    normalized_scores = scaler.fit_transform(posting_scores)
+    return scaler, normalized_scores, ScoringKernel.from_scaler(scaler, normalized_scores)
+
+def test_lattice_matches_kernel_on_random_lattice_points():
+    """무작위 격자점 2000개: 조회표 유사도 == 커널/sklearn 유사도, 상위 공고 동일"""
+    scaler, normalized_scores, kernel = build_sample_kernel()
+    engine = LatticeEngine(kernel)
+
+    lattice_points = np.random.default_rng(1).integers(1, 6, size=(2000, 16))
+    # 모든 항목이 같은 점수인 경계 격자점도 포함
+    lattice_points[:5] = np.arange(1, 6)[:, None]
+    assert engine.supports(lattice_points)
+
+    actual = engine.similarities(lattice_points)
+    assert np.allclose(actual, kernel.similarities(lattice_points), atol=1e-5)
+    assert np.allclose(actual, cosine_similarity(scaler.transform(lattice_points), normalized_scores), atol=1e-5)
+
+    top_k = 5
+    lattice_top = select_top_k_batch(actual, top_k)
+    kernel_top = select_top_k_batch(kernel.similarities(lattice_points), top_k)
+    # 부동소수점 합산 순서 차이로 순위가 바뀔 수 있는 근소 동점 행은 제외하고 비교
+    sorted_scores = -np.sort(-actual, axis=1)
+    clear_rows = np.all(np.diff(sorted_scores[:, :top_k + 1], axis=1) < -1e-5, axis=1)
+    assert clear_rows.mean() > 0.9
+    assert np.array_equal(lattice_top[clear_rows], kernel_top[clear_rows])
+
+def test_lattice_rejects_non_lattice_scores():
+    """범위 밖이거나 정수가 아닌 점수는 지원하지 않음"""
+    _, _, kernel = build_sample_kernel(num_postings=20)
+    engine = LatticeEngine(kernel)
+    assert not engine.supports(np.full((1, 16), 3.5))
+    assert not engine.supports(np.full((1, 16), 6))
+    assert engine.supports(np.full((2, 16), 5.0))
+
+if __name__ == "__main__":
+    test_lattice_matches_kernel_on_random_lattice_points()
+    test_lattice_rejects_non_lattice_scores()
+    print("✅ 격자 조회표 엔진 테스트 통과")
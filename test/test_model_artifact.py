@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+서빙용 모델 아티팩트 테스트
+pickle 모델을 아티팩트로 변환해 로딩한 스냅샷이 pickle 경로와 같은 추천을 내는지 확인합니다.
+"""
+
+import os
+import sys
+import pickle
+import tempfile
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from model_artifact import convert_pickle_model, load_model_artifact, artifact_path
+from model_snapshot import load_model_snapshot
+from scoring_kernel import select_top_k_batch
+
+SCORE_COLUMNS = [f'점수{i}' for i in range(16)]
+
+def write_pickle_model(model_dir, num_postings=200, seed=0):
+    """무작위 공고 점수로 similarity_model.pkl 작성"""
+    rng = np.random.default_rng(seed)
+    job_posting_scores = pd.DataFrame(rng.integers(1, 6, size=(num_postings, 16)), columns=SCORE_COLUMNS)
+    job_posting_scores.insert(0, 'id', np.arange(1000, 1000 + num_postings))
+    job_posting_scores.insert(1, '기관명', rng.choice(['부산교통공사', '부산시설공단', '부산관광공사'], num_postings))
+    job_posting_scores.insert(2, '일반전형', rng.choice(['운영직', '기술직', '사무직', '전기직'], num_postings))
+
+    scaler = StandardScaler()
+    normalized_scores = scaler.fit_transform(job_posting_scores[SCORE_COLUMNS])
+    with open(os.path.join(model_dir, 'similarity_model.pkl'), 'wb') as f:
+        pickle.dump({
+            'scaler': scaler,
+            'normalized_scores': normalized_scores,
+            'job_posting_scores': job_posting_scores
+        }, f)
+
+def test_artifact_matches_pickle_model():
+    """아티팩트 스냅샷 == pickle 스냅샷 (유사도, 추천 레코드, 버전)"""
+    with tempfile.TemporaryDirectory() as model_dir:
+        write_pickle_model(model_dir)
+        pickle_snapshot = load_model_snapshot(model_dir, SCORE_COLUMNS)
+
+        convert_pickle_model(model_dir, SCORE_COLUMNS)
+        artifact_snapshot = load_model_snapshot(model_dir, SCORE_COLUMNS)
+
+        assert pickle_snapshot.source == 'pickle'
+        assert artifact_snapshot.source == 'artifact'
+        assert artifact_snapshot.version == pickle_snapshot.version
+        assert artifact_snapshot.statistics_body == pickle_snapshot.statistics_body
+
+        user_scores = np.random.default_rng(1).integers(1, 6, size=(20, 16))
+        expected = pickle_snapshot.kernel.similarities(user_scores)
+        actual = artifact_snapshot.kernel.similarities(user_scores)
+        assert np.array_equal(actual, expected)
+
+        top_indices = select_top_k_batch(actual, 5, artifact_snapshot.kernel.posting_info['id'])
+        for row, user_top_indices in enumerate(top_indices):
+            user_similarities = actual[row, user_top_indices]
+            assert (artifact_snapshot.records.encode(user_top_indices, user_similarities)
+                    == pickle_snapshot.records.encode(user_top_indices, user_similarities))
+
+def test_artifact_is_memory_mapped():
+    """배열은 복사 없이 읽기 전용 memmap으로 열림"""
+    with tempfile.TemporaryDirectory() as model_dir:
+        write_pickle_model(model_dir, num_postings=30)
+        convert_pickle_model(model_dir, SCORE_COLUMNS)
+        artifact = load_model_artifact(model_dir)
+
+        assert len(artifact) == 30
+        for array in artifact.arrays.values():
+            assert isinstance(array, np.memmap)
+            assert not array.flags.writeable
+
+        kernel = artifact.build_kernel()
+        assert np.shares_memory(kernel.postings, artifact.arrays['postings'])
+
+        # 다시 변환해도 기존 디렉토리를 교체하고 임시 디렉토리를 남기지 않음
+        convert_pickle_model(model_dir, SCORE_COLUMNS)
+        assert sorted(os.listdir(model_dir)) == sorted(['similarity_model.pkl', os.path.basename(artifact_path(model_dir))])
+
+if __name__ == "__main__":
+    test_artifact_matches_pickle_model()
+    test_artifact_is_memory_mapped()
+    print("✅ 모델 아티팩트 테스트 통과")
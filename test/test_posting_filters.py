@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+공고 필터 인덱스 테스트
+필터/점수 비트맵으로 고른 행과 부분 유사도 계산이 전체 계산 후 마스킹한 결과와 같은지 확인합니다.
+"""
+
+import os
+import sys
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import ScoringKernel, select_top_k_batch
+from posting_records import PostingRecords, encode_labels
+from posting_filters import PostingFilterIndex, ScoreBitmapIndex
+from lattice_engine import LatticeEngine
+from similarity_metrics import MetricScorer
+from form_categories import classify_form
+
+SCORE_COLUMNS = [f'점수{i}' for i in range(16)]
+AGENCIES = ['부산교통공사', '부산시설공단', '부산관광공사', '부산환경공단']
+FORMS = ['운전직', '기계직', '행정직', '공무직(시설관리)', '고객상담직', '일반계약직']
+
+def build_sample(num_postings=500, seed=0):
+    """무작위 공고로 커널, 레코드, 필터 인덱스 생성"""
+    rng = np.random.default_rng(seed)
+    posting_scores = rng.integers(1, 6, size=(num_postings, 16))
+    agency_names = rng.choice(AGENCIES, num_postings)
+    form_names = rng.choice(FORMS, num_postings)
+
+    scaler = StandardScaler()
+    ids = rng.permutation(num_postings).astype(np.int64) + 1000
+    kernel = ScoringKernel.from_scaler(scaler, scaler.fit_transform(posting_scores), {'id': ids})
+    agency_codes, agencies = encode_labels(agency_names)
+    form_codes, forms = encode_labels(form_names)
+    records = PostingRecords(ids, agency_codes, form_codes, agencies, forms,
+                             posting_scores.astype(np.int8), SCORE_COLUMNS, preload=False)
+    return kernel, records, PostingFilterIndex(records), agency_names, form_names
+
+def test_select_matches_mask():
+    """필드 안은 OR, 필드끼리는 AND"""
+    _, _, index, agency_names, form_names = build_sample()
+    categories = [set(classify_form(form)) for form in form_names]
+
+    filters = (('category', ('driving', 'technical')), ('기관명', ('부산교통공사', '부산시설공단')))
+    expected = np.flatnonzero([
+        agency in ('부산교통공사', '부산시설공단') and bool(category & {'driving', 'technical'})
+        for agency, category in zip(agency_names, categories)
+    ])
+    assert np.array_equal(index.select(filters), expected)
+
+    assert np.array_equal(index.select((('일반전형', ('행정직',)),)), np.flatnonzero(form_names == '행정직'))
+    assert index.select(None) is None
+    assert len(index.select((('기관명', ('없는기관',)),))) == 0
+
+def test_subset_scoring_matches_full():
+    """부분 계산 (kernel/lattice/지표) == 전체 계산의 해당 열, 상위 k개 == 마스킹 후 상위 k개"""
+    kernel, records, index, _, _ = build_sample()
+    rows = index.select((('category', ('administrative', 'civil_service')),))
+    user_scores = np.random.default_rng(1).integers(1, 6, size=(20, 16))
+
+    full = kernel.similarities(user_scores)
+    assert np.allclose(kernel.similarities(user_scores, rows=rows), full[:, rows], atol=1e-6)
+
+    lattice = LatticeEngine(kernel)
+    assert np.allclose(lattice.similarities(user_scores, rows=rows), lattice.similarities(user_scores)[:, rows], atol=1e-6)
+
+    scorer = MetricScorer(kernel, records.posting_scores)
+    weights = np.linspace(0.5, 2.0, 16)
+    for metric in ('cosine', 'euclidean', 'hybrid'):
+        assert np.allclose(scorer.similarities(user_scores, metric, weights, rows=rows),
+                           scorer.similarities(user_scores, metric, weights)[:, rows], atol=1e-6)
+
+    ids = kernel.posting_info['id']
+    subset = kernel.similarities(user_scores, rows=rows)
+    filtered_top = rows[select_top_k_batch(subset, 5, ids[rows])]
+
+    masked = np.full_like(full, -np.inf)
+    masked[:, rows] = subset
+    assert np.array_equal(filtered_top, select_top_k_batch(masked, 5, ids))
+
+def test_score_bitmaps_match_boolean_query():
+    """비트맵 AND/OR == 점수 배열 비교 (워드 경계가 아닌 공고 수 포함)"""
+    for num_postings in (1, 63, 64, 500):
+        _, records, index, agency_names, _ = build_sample(num_postings, seed=num_postings)
+        scores = records.posting_scores
+        bitmaps = ScoreBitmapIndex(scores)
+
+        constraints = ((5, 4, 5), (0, 3, 5), (9, 1, 2))
+        expected = (scores[:, 5] >= 4) & (scores[:, 0] >= 3) & (scores[:, 9] <= 2)
+        assert np.array_equal(bitmaps.mask(constraints), expected)
+        assert np.array_equal(bitmaps.select(constraints), np.flatnonzero(expected))
+
+        # 필터로 먼저 고른 행과 결합
+        rows = index.select((('기관명', ('부산교통공사',)),))
+        assert np.array_equal(bitmaps.select(constraints, rows),
+                              np.flatnonzero(expected & (agency_names == '부산교통공사')))
+        assert bitmaps.select(None, rows) is rows
+
+if __name__ == "__main__":
+    test_select_matches_mask()
+    test_subset_scoring_matches_full()
+    test_score_bitmaps_match_boolean_query()
+    print("✅ 공고 필터 테스트 통과")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+응답용 공고 레코드 테스트
+미리 인코딩한 JSON 조각(encode)과 레코드(build)가 같은 행으로 직접 만든 응답 딕셔너리와 같은지 확인합니다.
+"""
+
+import os
+import sys
+import json
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from posting_records import PostingRecords
+
+SCORE_COLUMNS = ['성실성', '개방성', '외향성', '우호성', '정서안정성', '기술전문성', '인지문제해결', '대인영향력',
+                 '자기관리', '적응력', '학습속도', '대인민첩성', '성과민첩성', '자기인식', '자기조절', '공감사회기술']
+
+def build_rows():
+    """따옴표/역슬래시/유니코드 라벨과 결측 기관명/일반전형이 섞인 공고 행"""
+    rng = np.random.default_rng(0)
+    rows = pd.DataFrame(rng.integers(1, 6, size=(6, 16)), columns=SCORE_COLUMNS)
+    rows.insert(0, 'id', [105, 3, 77, 12, 9, 41])
+    rows.insert(1, '기관명', ['부산교통공사', None, '부산 "시설" 공단', '부산교통공사', '부산관광공사\\본사', None])
+    rows.insert(2, '일반전형', ['운영직', '기술직', None, '사무직 (7급)', '운영직', '전기직'])
+    return rows
+
+def expected_recommendations(rows, top_indices, top_similarities):
+    """원래 DataFrame 행으로 만든 응답 딕셔너리 (필드 순서 포함)"""
+    recommendations = []
+    for rank, (idx, similarity) in enumerate(zip(top_indices, top_similarities), 1):
+        row = rows.iloc[idx]
+        recommendations.append({
+            'rank': rank,
+            'id': int(row['id']),
+            '기관명': None if pd.isna(row['기관명']) else row['기관명'],
+            '일반전형': None if pd.isna(row['일반전형']) else row['일반전형'],
+            '유사도': round(float(similarity), 3),
+            '공고점수': {col: int(row[col]) for col in SCORE_COLUMNS}
+        })
+    return recommendations
+
+def test_encode_matches_rows():
+    """encode/build == 행에서 만든 딕셔너리 (필드명/순서, None → null, 유사도 소수 셋째 자리 반올림)"""
+    rows = build_rows()
+    top_indices = np.array([2, 0, 5, 1, 4, 3])
+    similarity_cases = [
+        np.array([0.98765, 0.5, 0.1 + 0.2, -0.0004, -0.12345, 0.0]),
+        np.array([0.99951, 1 / 3, 2 / 3, 1e-7, -1.0, 0.1], dtype=np.float32)
+    ]
+
+    # 기본은 로딩 시 레코드를 만들지 않고 처음 추천될 때 생성
+    assert PostingRecords.from_dataframe(rows, SCORE_COLUMNS)._entries == {}
+    for records in (PostingRecords.from_dataframe(rows, SCORE_COLUMNS, preload=True),
+                    PostingRecords.from_dataframe(rows, SCORE_COLUMNS),
+                    PostingRecords.from_dataframe(PostingRecords.from_dataframe(rows, SCORE_COLUMNS).to_dataframe(),
+                                                  SCORE_COLUMNS)):
+        assert None in records.agencies and None in records.forms
+        for top_similarities in similarity_cases:
+            expected = expected_recommendations(rows, top_indices, top_similarities)
+            encoded = records.encode(top_indices, top_similarities)
+            decoded = json.loads(encoded)
+            assert decoded == expected
+            assert [list(item) for item in decoded] == [list(item) for item in expected]
+            assert records.build(top_indices, top_similarities) == expected
+            # 직접 인코딩한 바이트 == 같은 딕셔너리를 json.dumps로 직렬화한 바이트 (숫자 표기 포함)
+            assert encoded == json.dumps(expected, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        assert records.encode(top_indices[:0], similarity_cases[0][:0]) == b'[]'
+
+    # 결측 라벨은 DataFrame으로 되돌리면 NaN
+    restored = PostingRecords.from_dataframe(rows, SCORE_COLUMNS).to_dataframe()
+    for name in ('기관명', '일반전형'):
+        assert restored[name].isna().tolist() == rows[name].isna().tolist()
+        assert restored[name].dropna().tolist() == rows[name].dropna().tolist()
+
+if __name__ == "__main__":
+    test_encode_matches_rows()
+    print("✅ 응답용 공고 레코드 테스트 통과")
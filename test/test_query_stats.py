@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+쿼리 지표 테스트
+DB 서버 없이 가짜 커넥션으로 문장 유형 정규화, 문장 유형별 집계/백분위, 느린 쿼리 로그를 확인합니다.
+"""
+
+import os
+import sys
+import logging
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import database_manager
+from database_manager import DatabaseManager, QueryStats, fingerprint
+
+class FakeCursor:
+    """SELECT는 행 3개, 그 밖의 문장은 변경 행 1개를 돌려주는 가짜 커서"""
+
+    def __init__(self):
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, sql, params=None):
+        self.rowcount = 1
+
+    def fetchall(self):
+        return [(1,), (2,), (3,)]
+
+class FakeConnection:
+    def cursor(self, cursor_class=None):
+        return FakeCursor()
+
+class ListHandler(logging.Handler):
+    """로그 메시지를 모으는 핸들러"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+def test_fingerprint_and_summary():
+    """값/값 목록/공백/주석만 다른 문장은 같은 유형, 유형별 횟수/행 수/백분위 집계"""
+    assert fingerprint("SELECT * FROM t WHERE id = 3 AND n = 'a''b'") == "SELECT * FROM t WHERE id = ? AND n = ?"
+    assert fingerprint("SELECT *\n  FROM t -- 주석\n WHERE id IN (%s, %s, %s)") == "SELECT * FROM t WHERE id IN (...)"
+    assert fingerprint("INSERT INTO `t` (`a`) VALUES (1), (2)") == fingerprint("INSERT INTO `t` (`a`) VALUES (%s)")
+    assert fingerprint("SELECT 기관1 FROM `표2`") == "SELECT 기관1 FROM `표2`"
+
+    stats = QueryStats(samples=100)
+    for i in range(1, 101):
+        stats.record(f"SELECT * FROM t WHERE id = {i}", i / 1000, rows=1)
+    stats.record("UPDATE t SET a = 1", 0.5, rows=0, error=True)
+    summary = stats.summary()
+    assert [item['fingerprint'] for item in summary] == ["SELECT * FROM t WHERE id = ?", "UPDATE t SET a = ?"]
+    select = summary[0]
+    assert select['count'] == 100 and select['rows'] == 100 and select['max_ms'] == 100.0
+    assert abs(select['p50_ms'] - 50.5) < 1e-6 and abs(select['p95_ms'] - 95.05) < 1e-6
+    assert summary[1]['errors'] == 1 and len(stats.summary(limit=1)) == 1
+    assert 'UPDATE t SET a = ?' in stats.format()
+    stats.reset()
+    assert stats.summary() == [] and stats.format() == ''
+
+def test_manager_records_queries_and_slow_log():
+    """execute_query/execute_query_dict 실행 시간과 행 수 기록, 기준 이상이면 문장/파라미터 로그"""
+    database_manager.query_stats.reset()
+    handler = ListHandler()
+    database_manager.logger.addHandler(handler)
+    original_threshold = database_manager.DB_SLOW_QUERY_MS
+    try:
+        db = DatabaseManager(database='sangsang', pooled=False)
+        db.connection = FakeConnection()
+        db.execute_query("SELECT id FROM t WHERE 기관명 = %s", ('부산교통공사',))
+        db.execute_query_dict("SELECT id FROM t WHERE 기관명 = %s", ('부산시설공단',))
+        db.execute_query("DELETE FROM t WHERE id = %s", (1,), fetch=False)
+        summary = {item['fingerprint']: item for item in database_manager.query_stats.summary()}
+        assert summary["SELECT id FROM t WHERE 기관명 = ?"]['count'] == 2
+        assert summary["SELECT id FROM t WHERE 기관명 = ?"]['rows'] == 6
+        assert summary["DELETE FROM t WHERE id = ?"]['rows'] == 1
+        assert not any('느린 쿼리' in message for message in handler.messages)
+
+        # 기준을 아주 작게 하면 모든 쿼리가 느린 쿼리로 기록됨
+        database_manager.DB_SLOW_QUERY_MS = 1e-9
+        db.execute_query("SELECT id FROM t WHERE 기관명 = %s", ('부산관광공사',))
+        slow = [message for message in handler.messages if '느린 쿼리' in message]
+        assert len(slow) == 1 and '부산관광공사' in slow[0] and '(3행)' in slow[0]
+    finally:
+        database_manager.DB_SLOW_QUERY_MS = original_threshold
+        database_manager.logger.removeHandler(handler)
+        database_manager.query_stats.reset()
+
+if __name__ == "__main__":
+    test_fingerprint_and_summary()
+    test_manager_records_queries_and_slow_log()
+    print("✅ 쿼리 지표 테스트 통과")
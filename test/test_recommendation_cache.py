@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+추천 결과 캐시 테스트
+"""
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from recommendation_cache import RecommendationCache
+
+def test_cache_lru_eviction_and_stats():
+    """크기 초과 시 가장 오래 사용하지 않은 항목 제거"""
+    cache = RecommendationCache(max_size=2, ttl_seconds=0)
+    key_a = RecommendationCache.make_key('v1', [3] * 16, 5)
+    key_b = RecommendationCache.make_key('v1', [4] * 16, 5)
+    key_c = RecommendationCache.make_key('v1', [5] * 16, 5)
+
+    cache.put(key_a, 'a')
+    cache.put(key_b, 'b')
+    assert cache.get(key_a) == 'a'  # a를 최근 사용으로 갱신
+    cache.put(key_c, 'c')           # b 제거
+
+    assert cache.get(key_b) is None
+    assert cache.get(key_c) == 'c'
+    stats = cache.stats()
+    assert stats['size'] == 2
+    assert stats['hits'] == 2 and stats['misses'] == 1 and stats['evictions'] == 1
+
+def test_cache_key_includes_model_version():
+    """모델 버전이 다르면 다른 키"""
+    cache = RecommendationCache(max_size=10)
+    cache.put(RecommendationCache.make_key('v1', [3] * 16, 5), 'old')
+    assert cache.get(RecommendationCache.make_key('v2', [3] * 16, 5)) is None
+
+def test_cache_ttl_expiration():
+    """TTL이 지난 항목은 조회되지 않음"""
+    cache = RecommendationCache(max_size=10, ttl_seconds=0.01)
+    key = RecommendationCache.make_key('v1', [3] * 16, 5)
+    cache.put(key, 'value')
+    time.sleep(0.02)
+    assert cache.get(key) is None
+    assert cache.stats()['expirations'] == 1
+
+if __name__ == "__main__":
+    test_cache_lru_eviction_and_stats()
+    test_cache_key_includes_model_version()
+    test_cache_ttl_expiration()
+    print("✅ 추천 캐시 테스트 통과")
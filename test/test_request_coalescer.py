@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+요청 묶음 처리기 테스트
+동시에 들어온 요청이 묶여 처리되고, 각 요청이 자기 결과를 받는지 확인합니다.
+"""
+
+import os
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from request_coalescer import RequestCoalescer
+
+def submit_concurrently(coalescer, items):
+    """스레드마다 하나씩 요청을 보내고 결과 수집"""
+    results = [None] * len(items)
+    barrier = threading.Barrier(len(items))
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = coalescer.submit(items[i], timeout=5)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(items))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def test_concurrent_requests_are_batched():
+    """동시 요청 → 묶음 처리, 요청별 결과 순서 유지, 최대 크기 준수"""
+    observed_sizes = []
+
+    def square_all(items):
+        observed_sizes.append(len(items))
+        return [item * item for item in items]
+
+    coalescer = RequestCoalescer(square_all, window_ms=50, max_batch_size=8)
+    results = submit_concurrently(coalescer, list(range(20)))
+
+    assert results == [i * i for i in range(20)]
+    assert max(observed_sizes) > 1
+    assert max(observed_sizes) <= 8
+
+    stats = coalescer.stats()
+    assert stats['total_requests'] == 20
+    assert stats['total_batches'] == len(observed_sizes)
+    assert sum(int(size) * count for size, count in stats['batch_size_histogram'].items()) == 20
+
+def test_errors_reach_only_failed_requests():
+    """예외 객체를 반환한 요청만 실패"""
+    def fail_negative(items):
+        return [ValueError(item) if item < 0 else item for item in items]
+
+    coalescer = RequestCoalescer(fail_negative, window_ms=20, max_batch_size=16)
+    results = submit_concurrently(coalescer, [1, -1, 2, -2])
+
+    assert results[0] == 1 and results[2] == 2
+    assert isinstance(results[1], ValueError) and isinstance(results[3], ValueError)
+
+if __name__ == "__main__":
+    test_concurrent_requests_are_batched()
+    test_errors_reach_only_failed_requests()
+    print("✅ 요청 묶음 처리 테스트 통과")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+사전 계산 유사도 커널 테스트
+ScoringKernel의 결과가 기존 StandardScaler + cosine_similarity 경로와 같은지 확인합니다.
+"""
+
+import os
+import sys
+import tempfile
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+from sklearn.metrics.pairwise import cosine_similarity
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import ScoringKernel, select_top_k, select_top_k_batch
+
+def build_sample_model(num_postings=300, seed=0):
+    """무작위 1~5점 공고 점수로 스케일러와 표준화 점수 생성"""
+    rng = np.random.default_rng(seed)
+    posting_scores = rng.integers(1, 6, size=(num_postings, 16))
+    scaler = StandardScaler()
+    normalized_scores = scaler.fit_transform(posting_scores)
+    return scaler, normalized_scores
+
+def test_kernel_matches_sklearn_cosine():
+    """커널 유사도 == sklearn 코사인 유사도"""
+    scaler, normalized_scores = build_sample_model()
+    kernel = ScoringKernel.from_scaler(scaler, normalized_scores)
+
+    user_scores = np.random.default_rng(1).integers(1, 6, size=(50, 16))
+    expected = cosine_similarity(scaler.transform(user_scores), normalized_scores)
+    actual = kernel.similarities(user_scores)
+
+    assert actual.shape == expected.shape
+    assert np.allclose(actual, expected, atol=1e-5)
+
+def test_kernel_save_and_load():
+    """npz 저장 후 로딩해도 같은 결과"""
+    scaler, normalized_scores = build_sample_model(num_postings=20)
+    posting_info = {
+        'id': np.arange(1, 21),
+        '기관명': np.array(['부산교통공사'] * 20),
+        '일반전형': np.array(['운영직'] * 20)
+    }
+    kernel = ScoringKernel.from_scaler(scaler, normalized_scores, posting_info)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'scoring_kernel.npz')
+        kernel.save(path)
+        loaded = ScoringKernel.load(path)
+
+    user_scores = np.full((1, 16), 3)
+    assert np.array_equal(loaded.similarities(user_scores), kernel.similarities(user_scores))
+    assert loaded.posting_info['기관명'][0] == '부산교통공사'
+    assert list(loaded.posting_info['id']) == list(range(1, 21))
+
+def test_select_top_k_matches_full_sort():
+    """argpartition 기반 상위 k개 == 전체 정렬 결과"""
+    scores = np.random.default_rng(2).random(10000)
+    for top_k in [1, 5, 7, 10000, 20000]:
+        expected = np.argsort(-scores, kind='stable')[:top_k]
+        assert np.array_equal(select_top_k(scores, top_k), expected)
+
+def test_select_top_k_breaks_ties_by_posting_id():
+    """동점이면 공고 id 오름차순"""
+    scores = np.array([0.5, 0.9, 0.5, 0.5, 0.1, 0.5])
+    posting_ids = np.array([40, 10, 30, 20, 50, 60])
+    assert list(posting_ids[select_top_k(scores, 3, posting_ids)]) == [10, 20, 30]
+
+    score_matrix = np.vstack([scores, scores[::-1]])
+    top_indices = select_top_k_batch(score_matrix, 3, posting_ids)
+    assert list(posting_ids[top_indices[0]]) == [10, 20, 30]
+    assert np.array_equal(top_indices[1], select_top_k(scores[::-1], 3, posting_ids))
+
+if __name__ == "__main__":
+    test_kernel_matches_sklearn_cosine()
+    test_kernel_save_and_load()
+    test_select_top_k_matches_full_sort()
+    test_select_top_k_breaks_ties_by_posting_id()
+    print("✅ 유사도 커널 테스트 통과")
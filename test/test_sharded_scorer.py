@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+샤딩 유사도 계산 테스트
+샤드별 상위 k개를 병합한 결과가 단일 프로세스 전체 계산과 같은지 확인합니다 (샤드 간 동점 포함).
+"""
+
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import select_top_k_batch
+from sharded_scorer import ShardedScorer
+from test_unique_profiles import build_duplicated_postings
+
+def test_sharded_top_k_matches_exhaustive():
+    """샤드 3개 병합 == 전체 공고 상위 k개 (같은 점수 벡터가 여러 샤드에 흩어진 동점 포함)"""
+    _, kernel, _, ids = build_duplicated_postings(num_postings=3000, num_profiles=50)
+    scorer = ShardedScorer(kernel, 3)
+    try:
+        user_scores = np.random.default_rng(4).integers(1, 6, size=(15, 16))
+        similarities = kernel.similarities(user_scores)
+        for top_k in (1, 10, 200, len(ids), len(ids) + 5):
+            top_indices, top_similarities = scorer.top_k(user_scores, top_k)
+            expected = select_top_k_batch(similarities, top_k, ids)
+            assert np.array_equal(top_indices, expected)
+            assert np.allclose(top_similarities, np.take_along_axis(similarities, expected, axis=1), atol=1e-6)
+
+        # k가 0 이하이면 워커를 거치지 않고 빈 결과
+        for top_k in (0, -3):
+            top_indices, top_similarities = scorer.top_k(user_scores, top_k)
+            assert top_indices.shape == (15, 0) and top_similarities.shape == (15, 0)
+    finally:
+        scorer.close()
+
+if __name__ == "__main__":
+    test_sharded_top_k_matches_exhaustive()
+    print("✅ 샤딩 유사도 계산 테스트 통과")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+유사도 지표 테스트
+각 지표의 일괄 계산 결과가 sklearn 기준 계산과 같은지 확인합니다.
+"""
+
+import os
+import sys
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+from sklearn.metrics.pairwise import cosine_similarity, euclidean_distances
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import ScoringKernel
+from similarity_metrics import MetricScorer, METRICS
+
+def build_sample_scorer(num_postings=300, seed=0):
+    """무작위 1~5점 공고 점수로 스케일러와 지표 계산기 생성"""
+    posting_scores = np.random.default_rng(seed).integers(1, 6, size=(num_postings, 16))
+    scaler = StandardScaler()
+    normalized_scores = scaler.fit_transform(posting_scores)
+    scorer = MetricScorer(ScoringKernel.from_scaler(scaler, normalized_scores), posting_scores)
+    return scaler, normalized_scores, scorer
+
+def test_metrics_match_sklearn():
+    """cosine / euclidean / hybrid / weighted_cosine == sklearn 기준값"""
+    scaler, normalized_scores, scorer = build_sample_scorer()
+    user_scores = np.random.default_rng(1).integers(1, 6, size=(40, 16))
+    user_standardized = scaler.transform(user_scores)
+
+    cosine = cosine_similarity(user_standardized, normalized_scores)
+    euclidean = 1 / (1 + euclidean_distances(user_standardized, normalized_scores))
+    expected = {
+        'cosine': cosine,
+        'euclidean': euclidean,
+        'hybrid': 0.6 * cosine + 0.4 * euclidean,
+        'weighted_cosine': cosine
+    }
+    assert set(expected) == set(METRICS)
+    for metric, values in expected.items():
+        assert np.allclose(scorer.similarities(user_scores, metric), values, atol=1e-5), metric
+
+def test_weights_match_diagonal_scaling():
+    """가중치 적용 결과 == 양쪽 벡터에 대각 가중치를 곱한 뒤 계산한 값"""
+    scaler, normalized_scores, scorer = build_sample_scorer()
+    user_scores = np.random.default_rng(1).integers(1, 6, size=(40, 16))
+    weights = np.random.default_rng(2).random(16) + 0.1
+    weights[3] = 0.0
+
+    user_weighted = scaler.transform(user_scores) * weights
+    posting_weighted = normalized_scores * weights
+    cosine = cosine_similarity(user_weighted, posting_weighted)
+    euclidean = 1 / (1 + euclidean_distances(user_weighted, posting_weighted))
+
+    assert np.allclose(scorer.similarities(user_scores, 'cosine', weights), cosine, atol=1e-5)
+    assert np.allclose(scorer.similarities(user_scores, 'weighted_cosine', weights), cosine, atol=1e-5)
+    assert np.allclose(scorer.similarities(user_scores, 'euclidean', weights), euclidean, atol=1e-5)
+    assert np.allclose(scorer.similarities(user_scores, 'hybrid', weights), 0.6 * cosine + 0.4 * euclidean, atol=1e-5)
+
+def test_metrics_batched_equals_single():
+    """(N×P) 일괄 계산 == 사용자별 계산"""
+    _, _, scorer = build_sample_scorer(num_postings=50)
+    user_scores = np.random.default_rng(3).integers(1, 6, size=(8, 16))
+    for metric in METRICS:
+        batched = scorer.similarities(user_scores, metric)
+        assert batched.shape == (8, 50)
+        for row in range(8):
+            assert np.allclose(batched[row], scorer.similarities(user_scores[row:row + 1], metric)[0], atol=1e-6)
+
+if __name__ == "__main__":
+    test_metrics_match_sklearn()
+    test_weights_match_diagonal_scaling()
+    test_metrics_batched_equals_single()
+    print("✅ 유사도 지표 테스트 통과")
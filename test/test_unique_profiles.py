@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+고유 점수 프로필 테스트
+프로필 단위로 계산한 상위 k개를 공고로 펼친 결과가 공고 단위 상위 k개와 같은지 확인합니다.
+"""
+
+import os
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scoring_kernel import ScoringKernel, select_top_k_batch
+from unique_profiles import UniqueProfiles, group_profiles
+from model_artifact import save_model_artifact, load_model_artifact
+
+SCORE_COLUMNS = [f'점수{i}' for i in range(16)]
+
+def build_duplicated_postings(num_postings=2000, num_profiles=60, seed=0):
+    """고유 벡터 num_profiles개를 반복한 공고 점수와 섞인 id"""
+    rng = np.random.default_rng(seed)
+    base = rng.integers(1, 6, size=(num_profiles, 16))
+    posting_scores = base[rng.integers(0, num_profiles, size=num_postings)]
+    ids = rng.permutation(num_postings).astype(np.int64) + 1
+    scaler = StandardScaler()
+    kernel = ScoringKernel.from_scaler(scaler, scaler.fit_transform(posting_scores), {'id': ids})
+    return scaler, kernel, posting_scores, ids
+
+def test_profile_top_k_matches_posting_top_k():
+    """프로필 상위 k개 펼침 == 공고 단위 상위 k개 (프로필 간 동점, k > 프로필 수 포함)"""
+    _, kernel, posting_scores, ids = build_duplicated_postings()
+    order, offsets = group_profiles(posting_scores, ids)
+    profiles = UniqueProfiles(kernel, posting_scores, order, offsets)
+    assert len(profiles) <= 60 and offsets[-1] == len(ids)
+
+    # 공고별 프로필 번호
+    posting_profiles = np.empty(len(ids), dtype=np.int64)
+    posting_profiles[order] = np.repeat(np.arange(len(profiles)), profiles.sizes)
+
+    user_scores = np.random.default_rng(1).integers(1, 6, size=(30, 16))
+    for round_digits in (None, 1):
+        profile_similarities = profiles.kernel.similarities(user_scores)
+        if round_digits is not None:
+            # 반올림으로 프로필 간 동점을 만듦
+            profile_similarities = np.round(profile_similarities, round_digits)
+        posting_similarities = profile_similarities[:, posting_profiles]
+
+        for top_k in (1, 5, 100):
+            top_rows, top_scores = profiles.top_k(profile_similarities, top_k)
+            expected = select_top_k_batch(posting_similarities, top_k, ids)
+            assert np.array_equal(top_rows, expected)
+            assert np.array_equal(top_scores, np.take_along_axis(posting_similarities, expected, axis=1))
+
+def test_large_top_k_matches_exhaustive():
+    """큰 k (프로필 크기보다 크거나 전체 공고 수)에서도 공고 단위 전체 선택과 같음"""
+    _, kernel, posting_scores, ids = build_duplicated_postings(num_postings=5000, num_profiles=400, seed=2)
+    order, offsets = group_profiles(posting_scores, ids)
+    profiles = UniqueProfiles(kernel, posting_scores, order, offsets)
+    posting_profiles = np.empty(len(ids), dtype=np.int64)
+    posting_profiles[order] = np.repeat(np.arange(len(profiles)), profiles.sizes)
+
+    user_scores = np.random.default_rng(3).integers(1, 6, size=(20, 16))
+    for round_digits in (None, 1):
+        profile_similarities = profiles.kernel.similarities(user_scores)
+        if round_digits is not None:
+            profile_similarities = np.round(profile_similarities, round_digits)
+        posting_similarities = profile_similarities[:, posting_profiles]
+
+        for top_k in (37, 1000, len(ids) - 1, len(ids), len(ids) + 10):
+            top_rows, top_scores = profiles.top_k(profile_similarities, top_k)
+            expected = select_top_k_batch(posting_similarities, top_k, ids)
+            assert np.array_equal(top_rows, expected)
+            assert np.array_equal(top_scores, np.take_along_axis(posting_similarities, expected, axis=1))
+
+def test_artifact_stores_profiles():
+    """아티팩트에 저장된 프로필 == 로딩 시 계산한 프로필"""
+    scaler, kernel, posting_scores, ids = build_duplicated_postings(num_postings=300, num_profiles=20)
+    job_posting_scores = pd.DataFrame(posting_scores, columns=SCORE_COLUMNS)
+    job_posting_scores.insert(0, 'id', ids)
+    job_posting_scores.insert(1, '기관명', '부산교통공사')
+    job_posting_scores.insert(2, '일반전형', '운영직')
+
+    with tempfile.TemporaryDirectory() as model_dir:
+        save_model_artifact(model_dir, 'test', scaler, scaler.transform(posting_scores),
+                            job_posting_scores, SCORE_COLUMNS)
+        artifact = load_model_artifact(model_dir)
+        assert artifact.manifest['unique_profiles'] <= 20
+        stored = artifact.build_profiles(artifact.build_kernel())
+
+        computed = UniqueProfiles(kernel, posting_scores, *group_profiles(posting_scores, ids))
+        assert np.array_equal(stored.order, computed.order)
+        assert np.array_equal(stored.kernel.postings, computed.kernel.postings)
+        assert np.array_equal(stored.kernel.posting_info['id'], computed.kernel.posting_info['id'])
+
+if __name__ == "__main__":
+    test_profile_top_k_matches_posting_top_k()
+    test_large_top_k_matches_exhaustive()
+    test_artifact_stores_profiles()
+    print("✅ 고유 점수 프로필 테스트 통과")
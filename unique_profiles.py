@@ -0,0 +1,134 @@
+"""
+고유 점수 프로필 모듈
+같은 16개 정수 점수 벡터를 가진 공고를 하나의 프로필로 묶어, 유사도는 고유 프로필에 대해서만 계산하고
+상위 프로필을 다시 공고로 펼칩니다.
+
+공고 배치 (빌드 시 계산):
+    order   : 프로필 번호, 공고 id 순으로 정렬한 공고 행 번호 (P,)
+    offsets : 프로필별 order 구간 경계 (U+1,) - 프로필 g의 공고는 order[offsets[g]:offsets[g+1]]
+
+같은 프로필의 공고는 유사도가 같으므로, 공고 단위 상위 k개(동점이면 id 오름차순)는
+(유사도 내림차순, 프로필 최소 id 오름차순) 기준 상위 k개 프로필 안에서만 나옵니다.
+"""
+
+import numpy as np
+from scoring_kernel import ScoringKernel, select_top_k_batch
+
+def group_profiles(posting_scores, ids):
+    """
+    공고 점수 벡터를 고유 프로필로 묶기
+
+    Args:
+        posting_scores: 공고 원점수 배열 (P×16)
+        ids: 공고 id 배열 (P,)
+
+    Returns:
+        tuple: (order (P,) int64, offsets (U+1,) int64)
+    """
+    posting_scores = np.asarray(posting_scores)
+    if len(posting_scores) == 0:
+        return np.empty(0, dtype=np.int64), np.zeros(1, dtype=np.int64)
+    _, groups = np.unique(posting_scores, axis=0, return_inverse=True)
+    groups = groups.reshape(-1)
+    order = np.lexsort((np.asarray(ids), groups)).astype(np.int64)
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(groups)))).astype(np.int64)
+    return order, offsets
+
+class UniqueProfiles:
+    """고유 프로필 유사도 커널과 프로필 → 공고 펼침 정보"""
+
+    def __init__(self, kernel, posting_scores, order, offsets, unique_postings=None):
+        """
+        공고 단위 커널과 프로필 배치로 생성
+
+        Args:
+            kernel: 공고 단위 유사도 커널 (ScoringKernel, posting_info에 'id' 필요)
+            posting_scores: 공고 원점수 배열 (P×16)
+            order: group_profiles의 공고 행 번호 배열 (P,)
+            offsets: group_profiles의 프로필 구간 경계 (U+1,)
+            unique_postings: 프로필별 정규화 공고 벡터 (U×16), 없으면 커널에서 추출
+        """
+        self.order = np.asarray(order)
+        self.offsets = np.asarray(offsets)
+        self.sizes = np.diff(self.offsets)
+        self.ids = kernel.posting_info['id']
+
+        # 프로필 대표 공고 = 프로필 안에서 id가 가장 작은 공고
+        representatives = self.order[self.offsets[:-1]]
+        if unique_postings is None:
+            unique_postings = kernel.postings[representatives]
+        self.kernel = ScoringKernel(kernel.mean, kernel.scale, unique_postings,
+                                    {'id': self.ids[representatives]})
+        self.kernel.postings.flags.writeable = False
+        self.posting_scores = np.asarray(posting_scores)[representatives]
+
+    def __len__(self):
+        return len(self.sizes)
+
+    def top_k(self, profile_similarities, top_k):
+        """
+        프로필 유사도에서 공고 단위 상위 k개 계산
+
+        상위 프로필을 순서대로 누적해 공고 k개에 닿는 앞쪽 프로필만 펼친 뒤 (유사도 내림차순, id 오름차순)으로
+        정렬합니다 (O(N·k)). 경계 프로필이 앞/뒤 프로필과 동점인 행만 상위 프로필 전체를 펼칩니다.
+
+        Args:
+            profile_similarities: 프로필 유사도 행렬 (N×U)
+            top_k: 사용자별 추천할 공고 수
+
+        Returns:
+            tuple: (상위 공고 행 번호 (N×k), 상위 공고 유사도 (N×k))
+        """
+        num_users = len(profile_similarities)
+        top_k = max(0, min(int(top_k), len(self.order)))
+        if top_k == 0 or num_users == 0:
+            return (np.empty((num_users, 0), dtype=np.int64),
+                    np.empty((num_users, 0), dtype=profile_similarities.dtype))
+
+        top_profiles = select_top_k_batch(profile_similarities, top_k, self.kernel.posting_info['id'])
+        profile_scores = np.take_along_axis(profile_similarities, top_profiles, axis=1)
+        num_profiles = top_profiles.shape[1]
+
+        # 프로필 순서대로 공고 수(최대 k)를 누적해 k개에 닿는 앞쪽 프로필만 펼침 (N×k)
+        sizes = np.minimum(self.sizes[top_profiles], top_k).ravel()
+        ends = np.cumsum(sizes)
+        starts = ends - sizes
+        targets = (starts[::num_profiles][:, None] + np.arange(top_k)).ravel()
+        used = np.searchsorted(ends, targets, side='right')
+        positions = self.offsets[top_profiles.ravel()[used]] + targets - starts[used]
+        candidate_rows = self.order[positions].reshape(num_users, top_k)
+        candidate_scores = profile_scores.ravel()[used].reshape(num_users, top_k)
+
+        # 유사도가 같은 프로필끼리는 공고 id 순으로 섞이도록 다시 정렬
+        ranking = np.lexsort((self.ids[candidate_rows], -candidate_scores), axis=1)
+        top_rows = np.take_along_axis(candidate_rows, ranking, axis=1)
+        top_scores = np.take_along_axis(candidate_scores, ranking, axis=1).astype(profile_similarities.dtype)
+
+        # 마지막으로 펼친 프로필이 앞/뒤 프로필과 동점이면 id가 더 작은 공고가 밖에 남을 수 있어 개별 처리
+        last = used.reshape(num_users, top_k)[:, -1] % num_profiles
+        rows = np.arange(num_users)
+        last_scores = profile_scores[rows, last]
+        tied = (last > 0) & (profile_scores[rows, np.maximum(last - 1, 0)] == last_scores)
+        tied |= (last + 1 < num_profiles) & (profile_scores[rows, np.minimum(last + 1, num_profiles - 1)] == last_scores)
+        for row in np.flatnonzero(tied):
+            top_rows[row], top_scores[row] = self._expand_row(top_profiles[row], profile_scores[row], top_k)
+        return top_rows, top_scores
+
+    def _expand_row(self, profiles, scores, top_k):
+        """
+        한 사용자의 상위 프로필을 프로필마다 최대 k개씩 모두 펼쳐 상위 k개 공고 선택
+
+        Args:
+            profiles: 상위 프로필 번호 배열 (k,)
+            scores: 프로필 유사도 배열 (k,)
+            top_k: 추천할 공고 수
+
+        Returns:
+            tuple: (상위 공고 행 번호 (k,), 상위 공고 유사도 (k,))
+        """
+        counts = np.minimum(self.sizes[profiles], top_k)
+        within = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        rows = self.order[np.repeat(self.offsets[profiles], counts) + within]
+        scores = np.repeat(scores, counts)
+        ranking = np.lexsort((self.ids[rows], -scores))[:top_k]
+        return rows[ranking], scores[ranking]
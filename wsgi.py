@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+프로덕션 WSGI 진입점
+gunicorn 마스터 프로세스에서 모델을 미리 로딩한 뒤 워커를 fork 하여,
+모든 워커가 같은 모델 메모리 페이지를 공유하도록 합니다.
+
+실행: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+from job_recommendation_api import app, load_similarity_model
+
+if not load_similarity_model():
+    raise RuntimeError("모델 로딩에 실패했습니다. 먼저 python3 model_builder.py --source database 를 실행하세요.")